@@ -0,0 +1,88 @@
+"""
+Regression check of rank_top_k against a full evaluation.
+
+    python benchmarks/check_ranking.py [--count 600] [--k 10] [--seed 0]
+
+rank_top_k must return what sorting evaluate_multiple_cvs by total score
+gives. The check runs, at every depth, on synthetic CVs (see
+synthetic_cvs.py) and on finance CVs strong enough to fill the top k
+followed by ones whose uncapped skill score goes well past 100, and exits
+with status 1 on any difference, such as a pruned CV that belongs in the
+top k.
+"""
+import argparse
+import copy
+import json
+import logging
+import sys
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS_DIR.parent))
+
+from model import CVEvaluationSystem, EVALUATION_DEPTHS  # noqa: E402
+from synthetic_cvs import SyntheticCVGenerator  # noqa: E402
+
+# The finance CVs meet the first minimum experience and miss the second
+REQUIREMENTS = (
+    {},
+    {'min_experience_years': 1},
+    {'min_experience_years': 3, 'required_skills': ['Excel', 'Python']}
+)
+
+
+def skill_heavy_cv(skill, count):
+    """A finance CV whose count skills all match the finance_skills vocabulary"""
+    return {
+        'summary': 'Financial analyst working on audit, compliance and GAAP reporting.',
+        'experience': [{'title': 'Analyst', 'duration': 'Jan 2019 - Dec 2020',
+                        'description': 'Loan processing and reconciliation for a regional bank.'}],
+        'education': [{'degree': 'Bachelor of Science in Finance', 'institution': 'State University'}],
+        'skills': [f'{skill} {index}' for index in range(count)],
+        'accomplishments': ['Reduced costs by 10%']
+    }
+
+
+def top_by_sorting(system, cvs_data, k, depth):
+    reports = system.evaluate_multiple_cvs(copy.deepcopy(cvs_data), depth)['individual_reports']
+    reports = [report for report in reports if 'error' not in report]
+    return sorted(reports, key=lambda report: -report['report']['evaluation_summary']['total_score'])[:k]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check rank_top_k against sorting a full evaluation')
+    parser.add_argument('--count', type=int, default=600, help='synthetic CVs ranked')
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    logging.disable(logging.CRITICAL)
+
+    # The skill heavy CVs come last, so the top k is full when they are reached
+    skill_heavy = {f'strong_{index}': skill_heavy_cv('Loan processing', 13) for index in range(args.k)}
+    for count in (40, 80):
+        skill_heavy[f'skill_heavy_{count}'] = skill_heavy_cv('Loan processing', count)
+    scenarios = {
+        'synthetic': SyntheticCVGenerator(args.seed).cvs(args.count),
+        'skill heavy': skill_heavy
+    }
+
+    failures = 0
+    for name, cvs_data in scenarios.items():
+        for requirements, depth in product(REQUIREMENTS, EVALUATION_DEPTHS):
+            system = CVEvaluationSystem()
+            system.reference_date = datetime(2024, 6, 1)
+            system.set_requirements(copy.deepcopy(requirements))
+            expected = top_by_sorting(system, cvs_data, args.k, depth)
+            ranked = system.rank_top_k(copy.deepcopy(cvs_data), args.k, depth)
+            same = json.dumps(expected, sort_keys=True, default=str) == \
+                json.dumps(ranked['top_candidates'], sort_keys=True, default=str)
+            failures += not same
+            print(f"{name}, requirements {json.dumps(requirements)}, depth {depth}: "
+                  f"{'ok' if same else 'MISMATCH'} ({ranked['pruned']} of {ranked['total_cvs_considered']} pruned)")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
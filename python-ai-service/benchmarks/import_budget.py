@@ -0,0 +1,92 @@
+"""
+Import-time budget of each Lambda entry point.
+
+    python benchmarks/import_budget.py [--repeat 5]
+
+Every entry point is measured in fresh interpreters, as on a cold start:
+the time to import handler, then the time of the imports and set-up the
+entry point does on its first call. The best of --repeat runs is compared
+with the entry point's budget, and the modules it must never load (e.g.
+pdfplumber for evaluate_resume) are checked. Exits with status 1 if an
+entry point is over budget or loads a forbidden module.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+
+# Budgets in milliseconds, for importing handler and for the first call's
+# own imports and set-up
+HANDLER_IMPORT_BUDGET_MS = 40
+
+ENTRY_POINTS = {
+    'evaluate_resume': {
+        # Imports the model and builds the warm engine
+        'first_call': 'handler.init_engine()',
+        'budget_ms': 150,
+        'forbidden': ('pdfplumber', 'pdfminer', 'dateutil', 'numpy')
+    },
+    'parse_resume': {
+        'first_call': 'import pdfplumber',
+        'budget_ms': 600,
+        'forbidden': ('model', 'numpy')
+    }
+}
+
+MEASURE = '''
+import json, sys, time
+start = time.perf_counter()
+import handler
+imported = time.perf_counter()
+{first_call}
+done = time.perf_counter()
+print(json.dumps({{
+    'import_ms': (imported - start) * 1000,
+    'first_call_ms': (done - imported) * 1000,
+    'modules': sorted(name.split('.')[0] for name in sys.modules)
+}}))
+'''
+
+
+def measure(first_call):
+    process = subprocess.run([sys.executable, '-c', MEASURE.format(first_call=first_call)], cwd=SERVICE_DIR,
+                             capture_output=True, text=True)
+    if process.returncode != 0:
+        return None, process.stderr.strip().splitlines()[-1]
+    return json.loads(process.stdout.strip().splitlines()[-1]), None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the import-time budget of each handler')
+    parser.add_argument('--repeat', type=int, default=5, help='cold starts measured per entry point')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, entry in ENTRY_POINTS.items():
+        runs = []
+        for _ in range(args.repeat):
+            result, error = measure(entry['first_call'])
+            if result is None:
+                break
+            runs.append(result)
+        if not runs:
+            print(f'{name}: could not be measured ({error})')
+            continue
+
+        import_ms = min(run['import_ms'] for run in runs)
+        first_call_ms = min(run['first_call_ms'] for run in runs)
+        loaded = [module for module in entry['forbidden'] if module in runs[0]['modules']]
+        over = import_ms > HANDLER_IMPORT_BUDGET_MS or first_call_ms > entry['budget_ms']
+        failed = failed or over or bool(loaded)
+        print(f"{name}: import handler {import_ms:.1f}/{HANDLER_IMPORT_BUDGET_MS} ms, "
+              f"first call {first_call_ms:.1f}/{entry['budget_ms']} ms"
+              f"{'  OVER BUDGET' if over else ''}"
+              f"{'  loads ' + ', '.join(loaded) if loaded else ''}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+Benchmarks of the CV evaluation model.
+
+    python benchmarks/run_benchmarks.py run [--sizes 1,1000,100000] [--output FILE]
+    python benchmarks/run_benchmarks.py compare OLD.json NEW.json [--threshold 0.1]
+
+run measures, on synthetic CVs of every industry (see synthetic_cvs.py):
+  - per-CV latency of evaluate_multiple_cvs, _detect_industry and every
+    score component of the detected industry's evaluator; component times
+    exclude the keyword scan of the CV they share, timed as document_scan
+  - batch throughput of evaluate_multiple_cvs at each size
+  - peak traced memory of evaluate_multiple_cvs at each size, input included
+
+Results are written as a flat JSON dict of metric name -> value along with
+the engine version, commit and platform they were taken on. compare lists
+the metrics of two result files side by side and exits with status 1 if
+any got worse by more than the threshold (and, for latencies, by more than
+MIN_LATENCY_CHANGE_MS).
+"""
+import argparse
+import copy
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS_DIR.parent))
+
+from model import CVDocument, CVEvaluationSystem, EVALUATOR_CACHE, SCORING_ENGINE_VERSION  # noqa: E402
+from synthetic_cvs import INDUSTRIES, SyntheticCVGenerator  # noqa: E402
+
+DEFAULT_SIZES = (1, 1000, 100000)
+
+# CVs timed one by one for the latency metrics
+DEFAULT_LATENCY_SAMPLES = 17 * 30
+
+# Times each latency is measured; the fastest run counts, as the others
+# mostly measure interference
+LATENCY_REPEATS = 5
+
+# Metrics where a larger value is better; every other metric is a cost
+HIGHER_IS_BETTER = ('cvs_per_second',)
+
+# Latency changes below this many milliseconds are timer noise, never regressions
+MIN_LATENCY_CHANGE_MS = 0.01
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 4)
+
+
+def summarize(name, timings):
+    """Latency metrics of a list of per-CV timings in seconds"""
+    timings = sorted(timings)
+    return {
+        f'latency.{name}.median_ms': _ms(statistics.median(timings)),
+        f'latency.{name}.p95_ms': _ms(timings[min(len(timings) - 1, int(len(timings) * 0.95))]),
+        f'latency.{name}.mean_ms': _ms(statistics.fmean(timings))
+    }
+
+
+def best_time(function, setup=lambda: None):
+    """Fastest of LATENCY_REPEATS timed calls of function(setup()), and its last result"""
+    best = None
+    for _ in range(LATENCY_REPEATS):
+        argument = setup()
+        start = time.perf_counter()
+        result = function(argument)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def scanned(doc):
+    """Compute the texts and keyword hits every scorer of a CV shares"""
+    doc.corpus_hits, doc.narrative_hits, doc.experience_hits, doc.skill_hits
+    doc.accomplishment_hits, doc.total_experience_years
+    return doc
+
+
+def measure_latency(system, cvs_data, depth):
+    evaluate, detect, scan = [], [], []
+    components = {}
+    compiled = system._compiled_criteria()
+
+    for cv_id, cv_data in cvs_data.items():
+        elapsed, _ = best_time(lambda single: system.evaluate_multiple_cvs(single, depth),
+                               lambda: {cv_id: copy.deepcopy(cv_data)})
+        evaluate.append(elapsed)
+
+        cv_data = system._validate_cv_data(cv_data)
+        new_doc = lambda: CVDocument(cv_data, system.reference_date)  # noqa: E731
+        elapsed, industry = best_time(system._detect_industry, new_doc)
+        detect.append(elapsed)
+
+        # Scorers share the CV's texts and keyword scan, timed on their own
+        elapsed, doc = best_time(scanned, new_doc)
+        scan.append(elapsed)
+
+        evaluator = EVALUATOR_CACHE.get(compiled, industry)
+        for key, scorer in evaluator.scorers().items():
+            elapsed, _ = best_time(scorer, lambda: doc)
+            components.setdefault(key, []).append(elapsed)
+
+    metrics = {}
+    metrics.update(summarize('evaluate_multiple_cvs', evaluate))
+    metrics.update(summarize('detect_industry', detect))
+    metrics.update(summarize('document_scan', scan))
+    for key in sorted(components):
+        metrics.update(summarize(f'scorer.{key}', components[key]))
+    return metrics
+
+
+def measure_batch(system, generator, size, depth, memory=True):
+    cvs_data = generator.cvs(size)
+    gc.collect()
+    start = time.perf_counter()
+    system.evaluate_multiple_cvs(cvs_data, depth)
+    elapsed = time.perf_counter() - start
+    metrics = {
+        f'throughput.{size}.seconds': round(elapsed, 4),
+        f'throughput.{size}.cvs_per_second': round(size / elapsed, 2)
+    }
+
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        cvs_data = generator.cvs(size)
+        results = system.evaluate_multiple_cvs(cvs_data, depth)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del results, cvs_data
+        metrics[f'memory.{size}.peak_mb'] = round(peak / (1024 * 1024), 2)
+    return metrics
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARKS_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    system = CVEvaluationSystem()
+    # Ongoing roles are measured to a fixed date so runs are comparable
+    system.reference_date = datetime(2024, 6, 1)
+    generator = SyntheticCVGenerator(args.seed)
+
+    metrics = {}
+    print(f'Latency over {args.samples} CVs of {len(INDUSTRIES)} industries...', flush=True)
+    metrics.update(measure_latency(system, generator.cvs(args.samples), args.depth))
+    for size in args.sizes:
+        print(f'Batch of {size} CVs...', flush=True)
+        metrics.update(measure_batch(system, generator, size, args.depth, not args.skip_memory))
+
+    result = {
+        'engine_version': SCORING_ENGINE_VERSION,
+        'commit': git_commit(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'depth': args.depth,
+        'metrics': metrics
+    }
+    output = Path(args.output) if args.output else \
+        BENCHMARKS_DIR / 'results' / f"{result['commit'] or 'local'}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, sort_keys=True) + '\n')
+    print(f'Results written to {output}')
+    return 0
+
+
+def compare(args):
+    old = json.loads(Path(args.old).read_text())
+    new = json.loads(Path(args.new).read_text())
+    print(f"{'metric':<60} {'old':>12} {'new':>12} {'change':>9}")
+    regressions = 0
+    for name in sorted(set(old['metrics']) | set(new['metrics'])):
+        before, after = old['metrics'].get(name), new['metrics'].get(name)
+        if before is None or after is None:
+            print(f'{name:<60} {str(before):>12} {str(after):>12}')
+            continue
+        change = (after - before) / before if before else 0.0
+        worse = -change if name.endswith(HIGHER_IS_BETTER) else change
+        noise = name.endswith('_ms') and abs(after - before) < MIN_LATENCY_CHANGE_MS
+        flag = '  REGRESSION' if worse > args.threshold and not noise else ''
+        regressions += bool(flag)
+        print(f'{name:<60} {before:>12} {after:>12} {change:>+8.1%}{flag}')
+    if old.get('engine_version') != new.get('engine_version'):
+        print(f"Scoring engine changed from {old.get('engine_version')} to {new.get('engine_version')}")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the CV evaluation model')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the benchmarks and store the results')
+    run_parser.add_argument('--sizes', type=lambda text: [int(size) for size in text.split(',')],
+                            default=list(DEFAULT_SIZES), help='comma-separated batch sizes')
+    run_parser.add_argument('--samples', type=int, default=DEFAULT_LATENCY_SAMPLES,
+                            help='CVs timed one by one for latency')
+    run_parser.add_argument('--depth', default='full', choices=('score', 'standard', 'full'))
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--skip-memory', action='store_true', help='skip the traced memory runs')
+    run_parser.add_argument('--output', help='result file, by default results/<commit>-<time>.json')
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help='relative change counted as a regression')
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
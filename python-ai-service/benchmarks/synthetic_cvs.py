@@ -0,0 +1,162 @@
+"""
+Synthetic cv_data for benchmarking, shaped like parse_resume output.
+
+Every CV is built for one of the industries _detect_industry knows, from
+that industry's detection keywords, its scoring plan's keywords and the
+scorer vocabularies, mixed with generic resume wording. The numbers of
+experience entries, skills and accomplishments and the length of every
+text vary from CV to CV; the same seed always gives the same CVs.
+"""
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model import INDUSTRY_DETECTION_KEYWORDS, POSITIVE_KEYWORDS, SCORER_VOCABULARIES  # noqa: E402
+from scoring_plans import SCORING_PLANS  # noqa: E402
+
+INDUSTRIES = tuple(INDUSTRY_DETECTION_KEYWORDS)
+
+FIRST_NAMES = ('Amina', 'Daniel', 'Sofia', 'Hamza', 'Grace', 'Luis', 'Mei', 'Omar', 'Priya', 'Tom')
+LAST_NAMES = ('Khan', 'Smith', 'Garcia', 'Ahmed', 'Chen', 'Okafor', 'Rossi', 'Patel', 'Novak', 'Brown')
+JOB_TITLES = ('Manager', 'Specialist', 'Coordinator', 'Associate', 'Lead', 'Analyst', 'Supervisor',
+              'Assistant', 'Consultant', 'Director', 'Instructor', 'Pilot', 'Operator', 'Teacher')
+INSTITUTIONS = ('State University', 'Community College', 'Institute of Technology', 'City College',
+                'National University')
+DEGREES = ('PhD in {field}', 'Master of Science in {field}', 'MBA', 'Bachelor of Arts in {field}',
+           'Bachelor of Science in {field}', 'BS {field}', 'Associate of Applied Science', 'High School Diploma',
+           'Certificate in {field}')
+FIELDS = ('Finance', 'Education', 'Business Administration', 'Computer Science', 'Biology', 'Fine Arts',
+          'Hospitality Management', 'Aviation', 'Environmental Science')
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+FILLER = ('responsible for', 'daily', 'across the organization', 'with cross-functional teams', 'in a fast-paced',
+          'environment', 'for key accounts', 'ensuring quality', 'on schedule', 'within budget', 'regional',
+          'weekly reports', 'new hires', 'the department', 'customers', 'operations')
+SENTENCES = (
+    '{Verb} {term} and {term} {filler}.',
+    '{Verb} {term} for a team of {count}, improving {term} by {percent}%.',
+    'Worked on {term} {filler} {filler}.',
+    '{Verb} {term}, {term} and {term} {filler}.',
+    'Handled {term} for {count} clients {filler}.',
+)
+VERBS = ('Managed', 'Led', 'Developed', 'Improved', 'Coordinated', 'Implemented', 'Supported', 'Created',
+         'Achieved', 'Organized')
+
+# Terms any CV may mention besides its own industry's
+GENERAL_TERMS = tuple(sorted({term for terms in SCORER_VOCABULARIES.values() for term in terms}))
+
+
+class SyntheticCVGenerator:
+    """Deterministic generator of cv_data dicts, one industry per CV"""
+
+    def __init__(self, seed=0):
+        self.random = random.Random(seed)
+
+    def industry_terms(self, industry):
+        plan = SCORING_PLANS.get(industry)
+        terms = list(INDUSTRY_DETECTION_KEYWORDS[industry])
+        if plan is not None:
+            terms.extend(plan.positive_keywords)
+            terms.extend(plan.skill_keywords)
+        return terms
+
+    def term(self, industry_terms):
+        # Two out of three terms come from the CV's own industry
+        r = self.random
+        if r.random() < 0.67:
+            return r.choice(industry_terms)
+        return r.choice(GENERAL_TERMS if r.random() < 0.8 else POSITIVE_KEYWORDS)
+
+    def sentence(self, industry_terms):
+        r = self.random
+        template = r.choice(SENTENCES)
+        return template.replace('{Verb}', r.choice(VERBS)).format(
+            term=_Terms(self, industry_terms),
+            filler=_Choices(r, FILLER),
+            count=r.randint(2, 40),
+            percent=r.randint(5, 60)
+        )
+
+    def text(self, industry_terms, sentences):
+        return ' '.join(self.sentence(industry_terms) for _ in range(sentences))
+
+    def duration(self):
+        r = self.random
+        start = r.randint(2000, 2022)
+        form = r.random()
+        if form < 0.4:
+            end = 'Present' if r.random() < 0.3 else f'{r.choice(MONTHS)} {r.randint(start, 2024)}'
+            return f'{r.choice(MONTHS)} {start} - {end}'
+        if form < 0.7:
+            return f'{r.randint(1, 12):02d}/{start} - {r.randint(1, 12):02d}/{r.randint(start, 2024)}'
+        if form < 0.95:
+            return f'{r.randint(0, 9)} years {r.randint(0, 11)} months'
+        return 'Not specified'
+
+    def cv(self, industry=None, size=None):
+        """
+        One cv_data dict. size scales the amount of content: 'small',
+        'medium' or 'large', at random if None.
+        """
+        r = self.random
+        industry = industry or r.choice(INDUSTRIES)
+        size = size or r.choice(('small', 'medium', 'medium', 'large'))
+        scale = {'small': 1, 'medium': 2, 'large': 4}[size]
+        terms = self.industry_terms(industry)
+
+        name = f'{r.choice(FIRST_NAMES)} {r.choice(LAST_NAMES)}'
+        summary = '\n'.join([
+            name,
+            f'{name.split()[0].lower()}.{r.randint(1, 999)}@example.com | +1 555-{r.randint(100, 999)}-{r.randint(1000, 9999)}',
+            self.text(terms, r.randint(1, 2 * scale))
+        ])
+        experience = [
+            {
+                'title': f'{r.choice(JOB_TITLES)}',
+                'duration': self.duration(),
+                'description': self.text(terms, r.randint(1, 3 * scale))
+            }
+            for _ in range(r.randint(1, 2 * scale))
+        ]
+        education = [
+            {
+                'degree': r.choice(DEGREES).format(field=r.choice(FIELDS)) +
+                          (' with honors' if r.random() < 0.1 else ''),
+                'institution': r.choice(INSTITUTIONS)
+            }
+            for _ in range(r.randint(1, 3))
+        ]
+        skills = [self.term(terms).title() for _ in range(r.randint(3, 6 * scale))]
+        accomplishments = [self.text(terms, 1) for _ in range(r.randint(0, 2 * scale))]
+        return {
+            'summary': summary,
+            'experience': experience,
+            'education': education,
+            'skills': skills,
+            'accomplishments': accomplishments
+        }
+
+    def cvs(self, count, industries=INDUSTRIES):
+        """cv_id -> cv_data for count CVs, cycling through industries"""
+        return {f'cv_{i}': self.cv(industries[i % len(industries)]) for i in range(count)}
+
+
+class _Terms:
+    """Format field giving a new term on every use"""
+
+    def __init__(self, generator, industry_terms):
+        self.generator = generator
+        self.industry_terms = industry_terms
+
+    def __format__(self, spec):
+        return self.generator.term(self.industry_terms)
+
+
+class _Choices:
+    def __init__(self, rng, options):
+        self.rng = rng
+        self.options = options
+
+    def __format__(self, spec):
+        return self.rng.choice(self.options)
@@ -0,0 +1,264 @@
+from array import array
+from collections.abc import Mapping
+
+# Characters of text gathered before they are sealed into one string of the
+# buffer; a record's strings always sit in a single chunk
+CHUNK_CHARS = 1 << 20
+
+# How a CV field is stored: a string, a list of strings, the skills list
+# (ids into the batch's skill table), a list of string-valued entries all
+# with the same keys, such as experience, or any other value kept as is
+TEXT, STRINGS, SKILLS, ENTRIES, VALUE = range(5)
+
+LISTS = (STRINGS, SKILLS, ENTRIES)
+
+
+def _field_kind(key, value):
+    """Kind of a field and, for entries, their shared keys"""
+    if isinstance(value, str):
+        return TEXT, None
+    if isinstance(value, list):
+        if all(isinstance(item, str) for item in value):
+            return (SKILLS if key == 'skills' else STRINGS), None
+        if all(isinstance(item, dict) for item in value):
+            keys = tuple(value[0])
+            if all(tuple(item) == keys and all(isinstance(v, str) for v in item.values()) for item in value):
+                return ENTRIES, keys
+    return VALUE, None
+
+
+class CompactCV(Mapping):
+    """
+    One CV of a CompactBatch, read as the JSON dict it was built from.
+
+    Strings live in the batch's text buffer. The record keeps its shape
+    (keys, kinds and entry keys, shared by every CV laid out alike), one
+    array with the length of each list field followed by the boundaries of
+    its strings in their chunk of text, and its skill ids. Other values are
+    kept as they are. Reading a field decodes it afresh. A field assigned
+    later is kept as it is too and hides the encoded one, whose text stays
+    unused in the buffer; nothing is appended. Evaluation decodes a record
+    once and leaves it unchanged.
+    """
+
+    __slots__ = ('_batch', '_shape', '_chunk', '_index', '_skills', '_values')
+
+    def __init__(self, batch, cv_data):
+        self._batch = batch
+        self._encode(cv_data)
+
+    def _encode(self, cv_data):
+        batch = self._batch
+        shape = []
+        lengths = []
+        strings = []
+        skills = array('I')
+        values = None
+        for key, value in cv_data.items():
+            kind, entry_keys = _field_kind(key, value)
+            if kind in LISTS:
+                lengths.append(len(value))
+            if kind == TEXT:
+                strings.append(value)
+            elif kind == STRINGS:
+                strings.extend(value)
+            elif kind == SKILLS:
+                skills.extend(batch.skill_id(skill) for skill in value)
+            elif kind == ENTRIES:
+                for entry in value:
+                    strings.extend(entry.values())
+            else:
+                if values is None:
+                    values = {}
+                values[key] = value
+            shape.append((key, kind, entry_keys))
+
+        self._shape = batch.shape(tuple(shape))
+        self._chunk, self._index = batch.append(strings, lengths)
+        self._skills = skills if skills else None
+        self._values = values
+
+    def _locate(self, key):
+        """(kind, entry keys, list length, position of first boundary, first skill) of a field"""
+        index = self._index
+        lists = 0
+        boundary = sum(1 for _, kind, _ in self._shape if kind in LISTS)
+        skill = 0
+        for field, kind, entry_keys in self._shape:
+            length = 0
+            if kind in LISTS:
+                length = index[lists]
+                lists += 1
+            if field == key:
+                return kind, entry_keys, length, boundary, skill
+            if kind == TEXT:
+                boundary += 1
+            elif kind == STRINGS:
+                boundary += length
+            elif kind == SKILLS:
+                skill += length
+            elif kind == ENTRIES:
+                boundary += length * len(entry_keys)
+        raise KeyError(key)
+
+    def _strings(self, boundary, count):
+        index = self._index
+        text = self._batch.chunk(self._chunk)
+        return [text[index[i]:index[i + 1]] for i in range(boundary, boundary + count)]
+
+    def __getitem__(self, key):
+        values = self._values
+        if values is not None and key in values:
+            return values[key]
+        kind, entry_keys, length, boundary, skill = self._locate(key)
+        if kind == TEXT:
+            return self._strings(boundary, 1)[0]
+        if kind == STRINGS:
+            return self._strings(boundary, length)
+        if kind == SKILLS:
+            if not length:
+                return []
+            names = self._batch.skill_names
+            return [names[skill_id] for skill_id in self._skills[skill:skill + length]]
+        if kind == ENTRIES:
+            values = iter(self._strings(boundary, length * len(entry_keys)))
+            return [{entry_key: next(values) for entry_key in entry_keys} for _ in range(length)]
+        return self._values[key]
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._shape = self._batch.shape(self._shape + ((key, VALUE, None),))
+        if self._values is None:
+            self._values = {}
+        self._values[key] = value
+
+    def __iter__(self):
+        return (key for key, _, _ in self._shape)
+
+    def __len__(self):
+        return len(self._shape)
+
+    def __contains__(self, key):
+        return any(field == key for field, _, _ in self._shape)
+
+    def to_dict(self):
+        """The JSON dict form of the CV"""
+        return {key: self[key] for key, _, _ in self._shape}
+
+    def __repr__(self):
+        return f'CompactCV({self.to_dict()!r})'
+
+    def __reduce__(self):
+        # A record travels (e.g. to a worker process) on its own, not with its batch
+        return _standalone, (self.to_dict(),)
+
+
+def _standalone(cv_data):
+    return CompactBatch().add(None, cv_data)
+
+
+class CompactBatch(Mapping):
+    """
+    Memory-compact cv_id -> CV mapping for large in-memory batches.
+
+    Every string of every CV is appended to one text buffer, sealed into
+    strings of about CHUNK_CHARS characters, and records keep offsets into
+    it. CVs whose text is all ASCII share chunks apart from the others, so
+    one accented name does not widen a whole chunk. Skill names are interned
+    in a table shared by the batch, and so are the shapes of CVs.
+
+    A CompactBatch can be passed anywhere a dict of cv_id -> CV data is, e.g.
+    to CVEvaluationSystem.evaluate_multiple_cvs; to_dicts() converts back to
+    the JSON form. Reports of compact CVs carry the decoded dict as their
+    extracted_data, so they serialize as plain JSON.
+    """
+
+    def __init__(self, cvs_data=None):
+        # Sealed chunks; None for a chunk still being filled
+        self._chunks = []
+        # ASCII-only or not -> (chunk index, pieces, length) of the chunk being filled
+        self._filling = {}
+        self._skill_ids = {}
+        self.skill_names = []
+        self._shapes = {}
+        self._records = {}
+        if cvs_data:
+            for cv_id, cv_data in cvs_data.items():
+                self.add(cv_id, cv_data)
+
+    def add(self, cv_id, cv_data):
+        """
+        Store a CV dict under cv_id and return its record. Anything else is
+        stored as it is, for evaluation to report as invalid.
+        """
+        record = CompactCV(self, cv_data) if isinstance(cv_data, dict) else cv_data
+        self._records[cv_id] = record
+        return record
+
+    def chunk(self, index):
+        """One string of the text buffer; a chunk being filled is sealed on first read"""
+        text = self._chunks[index]
+        if text is None:
+            ascii_only = next(key for key, filling in self._filling.items() if filling[0] == index)
+            self._seal(ascii_only)
+            text = self._chunks[index]
+        return text
+
+    def _seal(self, ascii_only):
+        index, pieces, _ = self._filling.pop(ascii_only)
+        self._chunks[index] = ''.join(pieces)
+
+    def append(self, strings, prefix=()):
+        """
+        Append strings to the buffer. Returns the chunk they went to and an
+        array of prefix followed by the boundaries of the strings in it.
+        """
+        ascii_only = all(string.isascii() for string in strings)
+        filling = self._filling.get(ascii_only)
+        if filling is not None and filling[2] >= CHUNK_CHARS:
+            self._seal(ascii_only)
+            filling = None
+        if filling is None:
+            filling = (len(self._chunks), [], 0)
+            self._chunks.append(None)
+
+        index, pieces, length = filling
+        boundaries = array('I', prefix)
+        boundaries.append(length)
+        for string in strings:
+            length += len(string)
+            boundaries.append(length)
+        pieces.extend(strings)
+        self._filling[ascii_only] = (index, pieces, length)
+        return index, boundaries
+
+    def skill_id(self, skill):
+        skill_id = self._skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = self._skill_ids[skill] = len(self.skill_names)
+            self.skill_names.append(skill)
+        return skill_id
+
+    def shape(self, shape):
+        return self._shapes.setdefault(shape, shape)
+
+    def __getitem__(self, cv_id):
+        return self._records[cv_id]
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+    def to_dicts(self):
+        """cv_id -> CV dict of every CV"""
+        return {cv_id: record.to_dict() if isinstance(record, CompactCV) else record
+                for cv_id, record in self._records.items()}
+
+
+def json_default(value):
+    """json.dumps default= hook turning compact records into their dict form"""
+    if isinstance(value, CompactCV):
+        return value.to_dict()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
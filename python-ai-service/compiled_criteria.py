@@ -0,0 +1,85 @@
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+
+
+def criteria_fingerprint(criteria):
+    """Stable hash of an evaluation criteria dict"""
+    canonical = json.dumps(criteria, sort_keys=True, separators=(',', ':'), default=repr)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class CompiledCriteria:
+    """
+    Immutable snapshot of the evaluation criteria with the per-CV work done once.
+
+    The criteria are deep-copied, so changing the dict afterwards never
+    reaches an evaluator built from the snapshot; a change gives a different
+    fingerprint and therefore a different cache entry.
+    """
+
+    def __init__(self, criteria):
+        self.fingerprint = criteria_fingerprint(criteria)
+        self.criteria = copy.deepcopy(criteria)
+
+        self.required_sections = tuple(self.criteria.get('required_sections') or ())
+        self.required_section_set = frozenset(self.required_sections)
+        # Lowered once here instead of for every CV; order and duplicates are kept
+        self.keywords = tuple(kw.lower() for kw in self.criteria.get('keywords') or ())
+        self.required_skills = tuple(s.lower() for s in self.criteria.get('required_skills') or ())
+
+    @classmethod
+    def of(cls, criteria):
+        return criteria if isinstance(criteria, cls) else cls(criteria)
+
+
+class EvaluatorCache:
+    """
+    LRU of evaluators keyed by (industry, criteria fingerprint).
+
+    Lives at module level so evaluators are shared by every CV of a batch and
+    by later invocations of a warm Lambda container.
+    """
+
+    def __init__(self, factory, max_entries=256):
+        self.factory = factory
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._criteria = OrderedDict()
+
+    def compile(self, criteria):
+        """CompiledCriteria for a criteria dict, reused while it is unchanged"""
+        fingerprint = criteria_fingerprint(criteria)
+        compiled = self._criteria.get(fingerprint)
+        if compiled is None:
+            compiled = self._criteria[fingerprint] = CompiledCriteria(criteria)
+            if len(self._criteria) > self.max_entries:
+                self._criteria.popitem(last=False)
+        else:
+            self._criteria.move_to_end(fingerprint)
+        return compiled
+
+    def get(self, compiled, industry):
+        key = (industry, compiled.fingerprint)
+        evaluator = self._entries.get(key)
+        if evaluator is None:
+            evaluator = self._entries[key] = self.factory(compiled, industry)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        return evaluator
+
+    def invalidate(self, fingerprint=None):
+        """Drop the evaluators of one criteria fingerprint, or everything"""
+        if fingerprint is None:
+            self._entries.clear()
+            self._criteria.clear()
+            return
+        self._criteria.pop(fingerprint, None)
+        for key in [key for key in self._entries if key[1] == fingerprint]:
+            del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,131 @@
+import copy
+import logging
+from datetime import datetime
+
+from model import CVDocument, EVALUATOR_CACHE, SCORING_ENGINE_VERSION, check_depth
+from result_cache import content_hash
+
+# Score components computed from each criteria field. Requirement checks,
+# totals, decisions and feedback are always rebuilt, so fields that only
+# feed the checks list no components. A changed field missing from this
+# table makes every component stale.
+CRITERIA_DEPENDENCIES = {
+    'required_sections': ('section_completeness',),
+    'required_skills': ('skills_relevance',),
+    'keywords': ('keyword_matching',),
+    'min_experience_years': (),
+    'education_level': (),
+    'preferred_industries': (),
+    'industry_specific_weights': ()
+}
+
+
+class RetainedScores:
+    """
+    Per-CV score breakdowns of the last run, with what they were computed
+    under: the criteria, the month ongoing roles were measured to and the
+    scoring engine version. Serializable with to_dict()/from_dict().
+    """
+
+    def __init__(self):
+        self.criteria = None
+        self.reference_month = None
+        self.engine_version = SCORING_ENGINE_VERSION
+        # cv_id -> (content hash, industry, score breakdown)
+        self.entries = {}
+
+    def stale_components(self, criteria, reference_month):
+        """Components to recompute under new criteria, or None for all of them"""
+        if self.criteria is None or reference_month != self.reference_month or \
+                self.engine_version != SCORING_ENGINE_VERSION:
+            return None
+        stale = set()
+        for field in set(criteria) | set(self.criteria):
+            if criteria.get(field) != self.criteria.get(field):
+                if field not in CRITERIA_DEPENDENCIES:
+                    return None
+                stale.update(CRITERIA_DEPENDENCIES[field])
+        return stale
+
+    def to_dict(self):
+        return {
+            'criteria': self.criteria,
+            'reference_month': self.reference_month,
+            'engine_version': self.engine_version,
+            'entries': {cv_id: list(entry) for cv_id, entry in self.entries.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        retained = cls()
+        retained.criteria = data['criteria']
+        retained.reference_month = data['reference_month']
+        retained.engine_version = data['engine_version']
+        retained.entries = {cv_id: tuple(entry) for cv_id, entry in data['entries'].items()}
+        return retained
+
+
+def rescore(system, cvs_data, retained, depth='full'):
+    """
+    evaluate_multiple_cvs(cvs_data, depth) reusing the scores retained from
+    the previous run.
+
+    A CV whose content is unchanged keeps its industry and every score
+    component the criteria changes do not touch; only the stale components
+    are recomputed, then the total, checks, feedback and report. Other CVs
+    are evaluated from scratch. retained is then updated to this run.
+    """
+    check_depth(depth)
+    compiled = system._batch_criteria()
+    reference = system.reference_date or datetime.now()
+    reference_month = f'{reference.year}-{reference.month}'
+    stale = retained.stale_components(system.evaluation_criteria, reference_month)
+
+    reports = []
+    entries = {}
+    for cv_id, cv_data in cvs_data.items():
+        try:
+            cv_data = system._validate_cv_data(cv_data)
+            digest = content_hash(cv_data)
+            doc = CVDocument(cv_data, system.reference_date)
+            entry = retained.entries.get(cv_id) if stale is not None else None
+
+            if entry is not None and digest is not None and entry[0] == digest:
+                industry, scores = entry[1], dict(entry[2])
+                evaluator = EVALUATOR_CACHE.get(compiled or system._compiled_criteria(), industry)
+                scorers = evaluator.scorers()
+                for key in stale:
+                    if key in scores:
+                        scores[key] = scorers[key](doc)
+                evaluation = {'total_score': evaluator.total_score(scores), 'score_breakdown': scores}
+                if depth != 'score':
+                    evaluation['feedback'] = evaluator._generate_feedback(scores, cv_data)
+                if depth == 'full':
+                    evaluation['extracted_data'] = cv_data
+            else:
+                industry = system._detect_industry(doc)
+                evaluation = system._evaluate_cv(doc, industry, depth, compiled)
+
+            report = system._generate_report(evaluation, doc, industry, depth)
+            meets_reqs = system._check_requirements(evaluation, industry, doc)
+            reports.append({
+                'cv_id': cv_id,
+                'industry': industry,
+                'report': report,
+                'meets_requirements': meets_reqs
+            })
+            if digest is not None:
+                entries[cv_id] = (digest, industry, dict(evaluation['score_breakdown']))
+        except Exception as e:
+            logging.error(f"Error evaluating CV {cv_id}: {str(e)}")
+            reports.append(system._error_report(cv_id, cv_data, e, depth))
+
+    retained.criteria = copy.deepcopy(system.evaluation_criteria)
+    retained.reference_month = reference_month
+    retained.engine_version = SCORING_ENGINE_VERSION
+    retained.entries = entries
+
+    return {
+        'individual_reports': reports,
+        'summary_report': system._generate_summary_report(reports)
+    }
@@ -0,0 +1,91 @@
+import logging
+import re
+from datetime import datetime
+from functools import lru_cache
+
+DATE_PATTERN = re.compile(
+    r'(\d{1,2}/\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4})',
+    re.IGNORECASE
+)
+YEARS_PATTERN = re.compile(r'(\d+)\s*year', re.IGNORECASE)
+MONTHS_PATTERN = re.compile(r'(\d+)\s*month', re.IGNORECASE)
+
+# Month names dateutil understands; anything else is left to dateutil itself
+MONTH_NAMES = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10, 'nov': 11, 'november': 11, 'dec': 12, 'december': 12
+}
+
+# Default length of a role whose duration says nothing usable
+DEFAULT_MONTHS = 12
+
+
+def parse_duration_months(duration_str, reference_date=None):
+    """
+    Length in months of an experience duration such as 'Jan 2019 - Mar 2021',
+    '03/2020 - present' or '2 years 6 months'.
+
+    Ongoing roles ('present', 'current') end at reference_date, which
+    defaults to now. Only its year and month are used, so results are cached
+    per duration string and month.
+    """
+    if not duration_str:
+        return 0
+    if reference_date is None:
+        reference_date = datetime.now()
+    if not isinstance(duration_str, str):
+        return _parse_uncached(duration_str, reference_date.year, reference_date.month)
+    return _parse_cached(duration_str, reference_date.year, reference_date.month)
+
+
+def _month_of(date_str, year, month):
+    """(year, month) of one matched date, without dateutil when possible"""
+    if date_str.isascii():
+        if '/' in date_str:
+            month_part, year_part = date_str.split('/')
+            month_number = int(month_part)
+        else:
+            name, year_part = date_str.split(' ')
+            month_number = MONTH_NAMES.get(name.lower(), 0)
+        parsed_year = int(year_part)
+        if 1 <= month_number <= 12 and parsed_year >= 1000:
+            return parsed_year, month_number
+
+    # Unusual dates (unknown names, years before 1000...) keep dateutil's
+    # reading, with the reference month filling whatever is missing
+    from dateutil import parser
+    parsed = parser.parse(date_str, default=datetime(year, month, 1))
+    return parsed.year, parsed.month
+
+
+def _parse_uncached(duration_str, year, month):
+    try:
+        lowered = duration_str.lower()
+        ongoing = 'present' in lowered or 'current' in lowered
+
+        dates = DATE_PATTERN.findall(duration_str)
+        if len(dates) >= 2:
+            start_year, start_month = _month_of(dates[0], year, month)
+            end_year, end_month = (year, month) if ongoing else _month_of(dates[1], year, month)
+            return (end_year - start_year) * 12 + (end_month - start_month)
+
+        # Fallback to simple year/month extraction
+        years_match = YEARS_PATTERN.search(duration_str)
+        months_match = MONTHS_PATTERN.search(duration_str)
+
+        total_months = 0
+        if years_match:
+            total_months += int(years_match.group(1)) * 12
+        if months_match:
+            total_months += int(months_match.group(1))
+
+        return total_months if total_months > 0 else DEFAULT_MONTHS
+
+    except Exception as e:
+        logging.warning(f"Error parsing duration '{duration_str}': {str(e)}")
+        return DEFAULT_MONTHS
+
+
+_parse_cached = lru_cache(maxsize=4096)(_parse_uncached)
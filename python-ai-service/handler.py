@@ -1,13 +1,14 @@
+import copy
 import json
 import os
-import tempfile
-from model import CVEvaluationSystem
-import pdfplumber
+import time
 import re
 import traceback
 import logging
 import warnings
 
+from response_encoding import dumps, encode_response, request_body
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -18,6 +19,87 @@ logging.getLogger('pdfminer').setLevel(logging.ERROR)
 warnings.filterwarnings('ignore', category=UserWarning, module='pdfminer')
 warnings.filterwarnings('ignore', category=FutureWarning, module='re')
 
+# Both Lambda functions load this module, so it only imports what both need.
+# The evaluation model is imported by init_engine() and pdfplumber (with the
+# whole of pdfminer) by parse_pdf_to_cv_data(), on first use; see
+# benchmarks/import_budget.py for what each entry point may cost.
+
+# Evaluation results reused across invocations of a warm container, kept in
+# /tmp, the only writable path on Lambda; created by init_engine()
+RESULT_CACHE = None
+
+# Evaluation engine of a warm container. init_engine() builds it once, on the
+# first evaluation or warmup event the container gets (the init path), and
+# every later invocation reuses it (the warm path). Lambda runs one
+# invocation at a time per container, so requests take turns setting its
+# requirements.
+ENGINE = None
+DEFAULT_CRITERIA = None
+INIT_DURATION_MS = None
+
+# Stage timings of the profiled requests of a warm container, one histogram
+# per stage across all of them; created by init_engine()
+PROFILER = None
+
+# Most resumes one evaluate_resumes call takes; the caller splits larger
+# batches, which would also near Lambda's 6MB response limit
+MAX_BATCH_RESUMES = int(os.environ.get('MAX_BATCH_RESUMES', 250))
+
+# Batches at least this large are spread over worker processes, where the
+# container has more than one CPU and allows them (see parallel_evaluation.py);
+# for smaller ones starting the pool costs more than it saves
+MIN_PARALLEL_BATCH = 100
+
+# Run through the engine at init so everything evaluation builds lazily is
+# in place before the first real CV
+WARMUP_CV = {
+    'summary': 'Warmup Candidate\nwarmup@example.com | +1 555 000 0000\nFinancial analyst with audit experience.',
+    'experience': [
+        {'duration': 'Jan 2019 - Present', 'description': 'Managed audit and reconciliation, reduced costs by 10%.'},
+        {'duration': '2 years 6 months', 'description': 'Customer service and team training.'}
+    ],
+    'education': [{'degree': 'Bachelor of Science in Finance', 'institution': 'State University'}],
+    'skills': ['Excel', 'GAAP', 'Customer Service'],
+    'accomplishments': ['Developed a new reporting process']
+}
+
+def init_engine():
+    """Init path: build and exercise the engine once per container; True if this call did it"""
+    global ENGINE, DEFAULT_CRITERIA, INIT_DURATION_MS, RESULT_CACHE, PROFILER
+    if ENGINE is not None:
+        return False
+    start = time.perf_counter()
+    from model import CVEvaluationSystem, EVALUATOR_CACHE
+    from profiling import Profiler
+    from result_cache import ResultCache
+    from scoring_plans import SCORING_PLANS
+
+    RESULT_CACHE = ResultCache(directory=os.environ.get('CV_RESULT_CACHE_DIR', '/tmp/cv-evaluation-cache'))
+    PROFILER = Profiler()
+    engine = CVEvaluationSystem()
+    DEFAULT_CRITERIA = copy.deepcopy(engine.evaluation_criteria)
+    compiled = engine._compiled_criteria()
+    for industry in SCORING_PLANS:
+        EVALUATOR_CACHE.get(compiled, industry)
+    engine.evaluate_multiple_cvs({'warmup': copy.deepcopy(WARMUP_CV)}, 'full')
+    ENGINE = engine
+    INIT_DURATION_MS = round((time.perf_counter() - start) * 1000, 2)
+    logger.info(f"Evaluation engine initialized in {INIT_DURATION_MS} ms")
+    return True
+
+def evaluation_engine(requirements):
+    """Warm path: the container's engine, holding only this request's requirements"""
+    init_engine()
+    ENGINE.evaluation_criteria = copy.deepcopy(DEFAULT_CRITERIA)
+    # Only profiled requests are timed; PROFILER keeps their histograms
+    ENGINE.disable_profiling()
+    ENGINE.set_requirements(requirements)
+    return ENGINE
+
+def is_warmup_event(event):
+    """A scheduled warmup ping ({'warmup': true} or serverless-plugin-warmup) rather than a request"""
+    return isinstance(event, dict) and bool(event.get('warmup') or event.get('source') == 'serverless-plugin-warmup')
+
 def parse_resume(event, context):
     """
     Lambda handler for parsing resumes
@@ -26,7 +108,7 @@ def parse_resume(event, context):
     """
     try:
         # Parse request body
-        body = json.loads(event['body'])
+        body = json.loads(request_body(event))
         file_path = body.get('file_path')
         
         if not file_path:
@@ -55,34 +137,22 @@ def parse_resume(event, context):
             cv_data = parse_pdf_to_cv_data(file_path)
             
             # Important! Make sure cv_data is JSON serializable
-            # Convert any non-serializable types
+            # Convert any non-serializable types, then serialize the body once
             cv_data = ensure_json_serializable(cv_data)
-            
-            # Test JSON serialization to catch issues early
-            try:
-                json_str = json.dumps(cv_data)
-                json.loads(json_str)  # Verify it can be parsed back
-                logger.info(f"Successfully serialized CV data, length: {len(json_str)}")
-            except Exception as json_err:
-                logger.error(f"JSON serialization test failed: {str(json_err)}")
+            body = serialize_response(cv_data, lambda cv_data: {
                 # Fall back to simpler structure
-                cv_data = {
-                    'summary': cv_data.get('summary', ''),
-                    'experience': [],
-                    'education': [],
-                    'skills': cv_data.get('skills', []),
-                    'accomplishments': [],
-                    'total_experience_years': 0
-                }
+                'summary': cv_data.get('summary', ''),
+                'experience': [],
+                'education': [],
+                'skills': cv_data.get('skills', []),
+                'accomplishments': [],
+                'total_experience_years': 0
+            })
             
-            return {
-                'statusCode': 200,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps(cv_data)
-            }
+            return encode_response(event, 200, {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            }, body)
         except Exception as e:
             logger.error(f"Error parsing PDF: {str(e)}")
             logger.error(traceback.format_exc())
@@ -123,34 +193,63 @@ def parse_resume(event, context):
             })
         }
 
+# Control characters that might break JSON; newlines and tabs are kept
+CONTROL_CHARACTERS = re.compile('[\x00-\x08\x0b-\x1f]')
+STRIP_CONTROL_CHARACTERS = dict.fromkeys(code for code in range(32) if code not in (9, 10))
+
+def _clean(text):
+    """text without control characters; most strings have none and are returned as is"""
+    if CONTROL_CHARACTERS.search(text) is None:
+        return text
+    return text.translate(STRIP_CONTROL_CHARACTERS)
+
 def ensure_json_serializable(data):
     """Ensure all values in a dictionary are JSON serializable"""
+    if isinstance(data, str):
+        return _clean(data)
     if isinstance(data, dict):
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, (dict, list)):
-                result[key] = ensure_json_serializable(value)
-            elif isinstance(value, (str, int, float, bool)) or value is None:
-                # Extra sanitization for strings
-                if isinstance(value, str):
-                    # Remove any control characters that might break JSON
-                    value = ''.join(c for c in value if ord(c) >= 32 or c == '\n' or c == '\t')
-                result[key] = value
-            else:
-                # Convert non-serializable types to strings and sanitize
-                result[key] = ''.join(c for c in str(value) if ord(c) >= 32 or c == '\n' or c == '\t')
-        return result
-    elif isinstance(data, list):
+        return {key: ensure_json_serializable(value) for key, value in data.items()}
+    if isinstance(data, list):
         return [ensure_json_serializable(item) for item in data]
-    elif isinstance(data, (str, int, float, bool)) or data is None:
-        # Extra sanitization for strings
-        if isinstance(data, str):
-            # Remove any control characters that might break JSON
-            data = ''.join(c for c in data if ord(c) >= 32 or c == '\n' or c == '\t')
+    if isinstance(data, (int, float, bool)) or data is None:
         return data
-    else:
-        # Convert to sanitized string
-        return ''.join(c for c in str(data) if ord(c) >= 32 or c == '\n' or c == '\t')
+    # Convert non-serializable types to sanitized strings
+    return _clean(str(data))
+
+def serialize_response(data, fallback):
+    """
+    JSON body of a sanitized response, in UTF-8 bytes, serialized once. If
+    the data still can't be serialized, the body of fallback(data) is
+    returned instead.
+    """
+    try:
+        body = dumps(data)
+        logger.info(f"Successfully serialized response, length: {len(body)}")
+        return body
+    except Exception as json_err:
+        logger.error(f"JSON serialization failed: {str(json_err)}")
+        return dumps(fallback(data))
+
+def fill_missing_fields(resume_data):
+    """Fill the sections a parsed resume lacks with placeholders, in place"""
+    if 'experience' not in resume_data or not resume_data['experience']:
+        resume_data['experience'] = [{'duration': 'Not specified', 'description': 'Experience information could not be extracted from the resume'}]
+    
+    if 'education' not in resume_data or not resume_data['education']:
+        resume_data['education'] = [{'degree': 'Not specified', 'institution': 'Not specified'}]
+    
+    if 'skills' not in resume_data or not resume_data['skills']:
+        resume_data['skills'] = ['Skills information could not be extracted from the resume']
+    
+    if 'summary' not in resume_data or not resume_data['summary']:
+        resume_data['summary'] = 'Summary information could not be extracted from the resume'
+
+def option_error(body, *names):
+    """Error message for the first of the true/false options names that body sets to anything but a boolean"""
+    for name in names:
+        if not isinstance(body.get(name, False), bool):
+            return f'{name} must be true or false, got {json.dumps(body[name])}'
+    return None
 
 def evaluate_resume(event, context):
     """
@@ -158,14 +257,58 @@ def evaluate_resume(event, context):
     Expected input:
       - resume_data: Parsed resume data
       - requirements: Job requirements
+      - depth (optional): 'score', 'standard' or 'full' (default)
+      - gate_first (optional): true to reject on the first failed hard requirement
+        before scoring (default false)
+      - profile (optional): true to add the time spent in each evaluation stage to
+        the report as 'timings', and the stage histograms of every profiled
+        request of the container as 'profile_summary', bypassing the result
+        cache (default false)
     """
     try:
+        if is_warmup_event(event):
+            cold_start = init_engine()
+            return {
+                'statusCode': 200,
+                'headers': {'Content-Type': 'application/json'},
+                'body': json.dumps({'warmup': True, 'cold_start': cold_start, 'init_duration_ms': INIT_DURATION_MS})
+            }
+        cold_start = init_engine()
+        from model import EVALUATION_DEPTHS
+
         logger.info("Evaluate resume endpoint called")
         
         # Parse request body
-        body = json.loads(event['body'])
+        body = json.loads(request_body(event))
         resume_data = body.get('resume_data')
         requirements = body.get('requirements')
+        depth = body.get('depth', 'full')
+        gate_first = body.get('gate_first', False)
+        profile = body.get('profile', False)
+        
+        # A string such as "false" would otherwise read as true
+        invalid_option = option_error(body, 'gate_first', 'profile')
+        if invalid_option:
+            logger.warning(f"Invalid option: {invalid_option}")
+            return {
+                'statusCode': 400,
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                },
+                'body': json.dumps({'error': invalid_option})
+            }
+
+        if depth not in EVALUATION_DEPTHS:
+            logger.warning(f"Invalid evaluation depth: {depth}")
+            return {
+                'statusCode': 400,
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                },
+                'body': json.dumps({'error': f"Invalid depth, expected one of: {', '.join(EVALUATION_DEPTHS)}"})
+            }
         
         logger.info(f"Resume data received: {json.dumps(resume_data)[:100]}...")
         logger.info(f"Requirements received: {json.dumps(requirements)[:100]}...")
@@ -215,75 +358,63 @@ def evaluate_resume(event, context):
             requirements = ensure_json_serializable(requirements)
             
             # Validate and fix resume_data before evaluation
-            if 'experience' not in resume_data or not resume_data['experience']:
-                resume_data['experience'] = [{'duration': 'Not specified', 'description': 'Experience information could not be extracted from the resume'}]
-            
-            if 'education' not in resume_data or not resume_data['education']:
-                resume_data['education'] = [{'degree': 'Not specified', 'institution': 'Not specified'}]
-            
-            if 'skills' not in resume_data or not resume_data['skills']:
-                resume_data['skills'] = ['Skills information could not be extracted from the resume']
+            fill_missing_fields(resume_data)
             
-            if 'summary' not in resume_data or not resume_data['summary']:
-                resume_data['summary'] = 'Summary information could not be extracted from the resume'
-            
-            eval_system = CVEvaluationSystem()
-            eval_system.set_requirements(requirements)
+            eval_system = evaluation_engine(requirements)
             
             # Create a dictionary with a single entry for the resume
             data_for_evaluation = {'resume_1': resume_data}
             
             # Evaluate
-            results = eval_system.evaluate_multiple_cvs(data_for_evaluation)
-            logger.info("Evaluation completed successfully")
+            if profile:
+                eval_system.enable_profiling(attach_timings=True, profiler=PROFILER)
+                results = eval_system.evaluate_multiple_cvs(data_for_evaluation, depth, gate_first=gate_first)
+                # Stage histograms of every profiled request this container served
+                results['profile_summary'] = PROFILER.summary()
+            else:
+                results = RESULT_CACHE.evaluate(eval_system, data_for_evaluation, depth, gate_first=gate_first)
+            logger.info(f"Evaluation completed successfully, cache: {RESULT_CACHE.stats()}")
             
             # Ensure results are JSON serializable
             results = ensure_json_serializable(results)
             
-            # Test JSON serialization to catch issues early
-            try:
-                json_str = json.dumps(results)
-                json.loads(json_str)  # Verify it can be parsed back
-                logger.info(f"Successfully serialized results, length: {len(json_str)}")
-            except Exception as json_err:
-                logger.error(f"JSON serialization test failed: {str(json_err)}")
-                # Fall back to simpler structure with correct format
-                results = {
-                    'individual_reports': [{
-                        'cv_id': 'resume_1',
-                        'industry': 'general',
-                        'report': {
-                            'evaluation_summary': {
-                                'total_score': 50,
-                                'decision': 'Maybe Consider',
-                                'strengths': [],
-                                'weaknesses': ['Error in JSON serialization']
-                            },
-                            'score_breakdown': {},
-                            'full_feedback': ['Error processing results, basic evaluation provided']
+            # Serialize the body once; fall back to simpler structure with correct format
+            body = serialize_response(results, lambda _: {
+                'individual_reports': [{
+                    'cv_id': 'resume_1',
+                    'industry': 'general',
+                    'report': {
+                        'evaluation_summary': {
+                            'total_score': 50,
+                            'decision': 'Maybe Consider',
+                            'strengths': [],
+                            'weaknesses': ['Error in JSON serialization']
                         },
-                        'meets_requirements': {'overall': False}
-                    }],
-                    'summary_report': {
-                        'total_cvs_evaluated': 1,
-                        'average_score': 50,
-                        'meets_requirements_count': 0,
-                        'meets_requirements_percentage': 0,
-                        'industry_distribution': {'general': 1},
-                        'decision_distribution': {'Maybe Consider': 1},
-                        'common_strengths': [],
-                        'common_weaknesses': [['Error in JSON serialization', 1]]
-                    }
+                        'score_breakdown': {},
+                        'full_feedback': ['Error processing results, basic evaluation provided']
+                    },
+                    'meets_requirements': {'overall': False}
+                }],
+                'summary_report': {
+                    'total_cvs_evaluated': 1,
+                    'average_score': 50,
+                    'meets_requirements_count': 0,
+                    'meets_requirements_percentage': 0,
+                    'industry_distribution': {'general': 1},
+                    'decision_distribution': {'Maybe Consider': 1},
+                    'common_strengths': [],
+                    'common_weaknesses': [['Error in JSON serialization', 1]]
                 }
+            })
             
-            return {
-                'statusCode': 200,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                },
-                'body': json.dumps(results)
+            headers = {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
             }
+            if cold_start:
+                # Init time is reported apart from the evaluation it preceded
+                headers['X-Engine-Init-Ms'] = str(INIT_DURATION_MS)
+            return encode_response(event, 200, headers, body)
         except Exception as e:
             logger.error(f"Error during evaluation: {str(e)}")
             logger.error(traceback.format_exc())
@@ -369,6 +500,103 @@ def evaluate_resume(event, context):
             'body': json.dumps(error_response)
         }
 
+def evaluate_resumes(event, context):
+    """
+    Evaluates a batch of resumes against one set of job requirements
+    Expected input:
+      - resume_data: List of parsed resumes, at most MAX_BATCH_RESUMES
+      - requirements: Job requirements, compiled once for the whole batch
+      - resume_ids (optional): cv_id of each resume's report, in the same
+        order (default 'resume_1', 'resume_2', ...)
+      - depth, gate_first (optional): as for evaluate_resume
+    Reports keep the order of resume_data. A resume that can't be evaluated
+    gets an 'Error' report of its own rather than failing the batch.
+    """
+    headers = {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    }
+
+    def error(status_code, message):
+        logger.warning(message)
+        return {'statusCode': status_code, 'headers': headers, 'body': json.dumps({'error': message})}
+
+    try:
+        if is_warmup_event(event):
+            cold_start = init_engine()
+            return {
+                'statusCode': 200,
+                'headers': {'Content-Type': 'application/json'},
+                'body': json.dumps({'warmup': True, 'cold_start': cold_start, 'init_duration_ms': INIT_DURATION_MS})
+            }
+        cold_start = init_engine()
+        from model import EVALUATION_DEPTHS
+        from parallel_evaluation import default_workers
+
+        logger.info("Evaluate resumes endpoint called")
+
+        # Parse request body
+        try:
+            body = json.loads(request_body(event))
+        except (TypeError, ValueError) as e:
+            return error(400, f'Invalid request body: {str(e)}')
+        if not isinstance(body, dict):
+            return error(400, 'Invalid request body: expected a JSON object')
+        resumes = body.get('resume_data')
+        requirements = body.get('requirements')
+        resume_ids = body.get('resume_ids')
+        depth = body.get('depth', 'full')
+        gate_first = body.get('gate_first', False)
+
+        invalid_option = option_error(body, 'gate_first')
+        if invalid_option:
+            return error(400, invalid_option)
+        if depth not in EVALUATION_DEPTHS:
+            return error(400, f"Invalid depth, expected one of: {', '.join(EVALUATION_DEPTHS)}")
+        if not isinstance(resumes, list) or not resumes or not requirements:
+            return error(400, 'Missing resume_data list or requirements')
+        if len(resumes) > MAX_BATCH_RESUMES:
+            return error(413, f'Too many resumes: {len(resumes)}, at most {MAX_BATCH_RESUMES} per request')
+        if resume_ids is None:
+            resume_ids = [f'resume_{index}' for index in range(1, len(resumes) + 1)]
+        elif not isinstance(resume_ids, list) or len(resume_ids) != len(resumes) \
+                or len(set(map(str, resume_ids))) != len(resumes):
+            return error(400, 'resume_ids must be a list of distinct ids, one per resume')
+
+        logger.info(f"Evaluating {len(resumes)} resumes, requirements: {json.dumps(requirements)[:100]}...")
+
+        resumes = ensure_json_serializable(resumes)
+        requirements = ensure_json_serializable(requirements)
+        for resume_data in resumes:
+            # Anything but an object is reported as an error by the evaluation
+            if isinstance(resume_data, dict):
+                fill_missing_fields(resume_data)
+
+        eval_system = evaluation_engine(requirements)
+        data_for_evaluation = dict(zip(map(str, resume_ids), resumes))
+        workers = default_workers() if len(resumes) >= MIN_PARALLEL_BATCH else None
+        results = RESULT_CACHE.evaluate(eval_system, data_for_evaluation, depth, gate_first=gate_first,
+                                        workers=workers)
+        errors = sum(1 for report in results['individual_reports'] if 'error' in report)
+        logger.info(f"Evaluated {len(resumes)} resumes, {errors} failed, cache: {RESULT_CACHE.stats()}")
+
+        results = ensure_json_serializable(results)
+        body = serialize_response(results, lambda _: {'error': 'Error in JSON serialization'})
+
+        if cold_start:
+            # Init time is reported apart from the evaluation it preceded
+            headers['X-Engine-Init-Ms'] = str(INIT_DURATION_MS)
+        return encode_response(event, 200, headers, body)
+
+    except Exception as e:
+        logger.error(f"Error in evaluate_resumes: {str(e)}")
+        logger.error(traceback.format_exc())
+        return {
+            'statusCode': 500,
+            'headers': headers,
+            'body': json.dumps({'error': f'System error: {str(e)}'})
+        }
+
 def parse_pdf_to_cv_data(pdf_path):
     """Parse a PDF CV into the format expected by our model"""
     try:
@@ -386,6 +614,8 @@ def parse_pdf_to_cv_data(pdf_path):
                 'total_experience_years': 0
             }
         
+        import pdfplumber
+
         # Configure pdfplumber settings with compatible parameters
         laparams = {
             'all_texts': True,
@@ -544,4 +774,5 @@ def parseResume(event, context):
 
 # Export the Lambda handlers
 parseResume = parseResume
-evaluateResume = evaluate_resume
\ No newline at end of file
+evaluateResume = evaluate_resume
+evaluateResumes = evaluate_resumes
\ No newline at end of file
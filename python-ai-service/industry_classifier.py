@@ -0,0 +1,70 @@
+from types import MappingProxyType
+
+
+class IndustryClassifier:
+    """
+    Weighted keyword classifier over a fixed set of industries.
+
+    The keyword tables are compiled once into postings from term id to
+    (industry, weight) pairs, using the term ids of a KeywordAutomaton that
+    contains every table term. Classifying a CV is then a walk over the
+    terms its single scan already found; nothing is rebuilt per call.
+    """
+
+    def __init__(self, tables, automaton, default='general'):
+        self.industries = tuple(tables)
+        self.default = default
+        self.tables = MappingProxyType({
+            industry: MappingProxyType(dict(keywords)) for industry, keywords in tables.items()
+        })
+
+        postings = {}
+        for index, keywords in enumerate(self.tables.values()):
+            for term, weight in keywords.items():
+                postings.setdefault(automaton.term_id(term), []).append((index, weight))
+        self._postings = MappingProxyType({term_id: tuple(p) for term_id, p in postings.items()})
+        self._automaton = automaton
+
+    def rank(self, hits):
+        """IndustryRanking from the KeywordHits of the CV text"""
+        scores = [0] * len(self.industries)
+        postings = self._postings
+        for term_id in postings.keys() & hits.term_ids:
+            for index, weight in postings[term_id]:
+                scores[index] += weight
+        return IndustryRanking(self, scores)
+
+    def classify(self, text):
+        """IndustryRanking for a plain, already lowercased text"""
+        return self.rank(self._automaton.scan([text]).hits())
+
+
+class IndustryRanking:
+    """
+    Scores of every industry for one CV, best first.
+
+    Ties keep the order of the classifier tables, so the first listed
+    industry wins; a CV scoring zero everywhere is the default industry.
+    """
+
+    __slots__ = ('ranked', 'industry', 'margin', 'confidence')
+
+    def __init__(self, classifier, scores):
+        self.ranked = sorted(zip(classifier.industries, scores), key=lambda item: -item[1])
+        top = self.ranked[0][1] if self.ranked else 0
+        runner_up = self.ranked[1][1] if len(self.ranked) > 1 else 0
+        total = sum(scores)
+
+        self.industry = self.ranked[0][0] if top > 0 else classifier.default
+        # Lead of the winner over the runner-up, and its share of all the
+        # keyword weight found in the CV
+        self.margin = top - runner_up
+        self.confidence = round(top / total, 3) if total > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            'industry': self.industry,
+            'scores': [{'industry': industry, 'score': score} for industry, score in self.ranked],
+            'margin': self.margin,
+            'confidence': self.confidence
+        }
@@ -0,0 +1,210 @@
+import re
+from bisect import bisect_right
+from itertools import compress, product
+
+# Words are runs of letters and digits; '&' joins a word such as 'p&l'
+_WORD = re.compile(r"[^\W_]+(?:&[^\W_]+)*")
+
+# Endings under which a term word also matches, e.g. 'audit' in 'audits',
+# 'audited' and 'auditing', even when the inflected word is a term word of
+# its own. -d only follows a final 'e', as in 'produced', so that 'ba'
+# does not match 'bad'.
+INFLECTION_ENDINGS = ('s', 'es', 'ed', 'ing')
+_VOWELS = 'aeiou'
+
+
+def inflections(word):
+    """Inflected forms of a word: plural or third person, past and -ing"""
+    forms = {word + ending for ending in INFLECTION_ENDINGS}
+    if word.endswith('e'):
+        # manage: managed, managing
+        forms.update((word + 'd', word[:-1] + 'ing'))
+    elif word.endswith('y') and len(word) > 1 and word[-2] not in _VOWELS:
+        # policy: policies, supply: supplied
+        forms.update((word[:-1] + 'ies', word[:-1] + 'ied'))
+    elif len(word) > 2 and word[-1] not in _VOWELS + 'wxy' and word[-2] in _VOWELS \
+            and word[-3] not in _VOWELS:
+        # plan: planned, planning
+        forms.update((word + word[-1] + 'ed', word + word[-1] + 'ing'))
+    forms.discard(word)
+    return forms
+
+
+def tokenize(text):
+    """Words of a text, in order; punctuation and hyphens separate words"""
+    return _WORD.findall(text)
+
+
+def normalize(term):
+    """Canonical form of a vocabulary term: its lowercased words, space separated"""
+    return ' '.join(tokenize(term.lower()))
+
+
+class KeywordAutomaton:
+    """
+    Phrase matcher over a set of named keyword vocabularies.
+
+    Terms are lowercased and split into words, and a term only matches a
+    run of whole words of the text, so 'ea' does not match inside 'team' nor
+    'led' inside 'skilled'; words may be inflected (see inflections). A text is
+    tokenized once into interned word ids (words of no term get none) and
+    the terms are found in a single pass over the ids with a trie of word-id
+    sequences, so a scan is linear in the text however many terms there are.
+
+    A term shared by several vocabularies is stored once; a term listed
+    twice in the same vocabulary is counted twice.
+    """
+
+    def __init__(self, vocabularies):
+        self.terms = []
+        self._term_ids = {}
+        self.vocabularies = {}
+        for name, words in vocabularies.items():
+            ids = []
+            for word in words:
+                term = normalize(word)
+                term_id = self._term_ids.get(term)
+                if term_id is None:
+                    term_id = self._term_ids[term] = len(self.terms)
+                    self.terms.append(term)
+                ids.append(term_id)
+            self.vocabularies[name] = tuple(ids)
+
+        self._build()
+
+    def _build(self):
+        # Word ids start at 1 so that 0 never reads as "not a term word"
+        words = {}
+        for term in self.terms:
+            for word in term.split(' '):
+                words.setdefault(word, len(words) + 1)
+
+        # Text word -> the term words it reads as: itself, and the words it
+        # is an inflection of. 'regulations' reads as both 'regulations' and
+        # 'regulation', and 'developed' as 'developed' and 'develop'.
+        readings = {word: [word] for word in words}
+        for word in words:
+            for form in sorted(inflections(word)):
+                readings.setdefault(form, []).append(word)
+
+        # Each text word gets one id: its own as a term word, the id of the
+        # one word it is an inflection of, or a new id if it reads as several
+        self._word_ids = {}
+        alternatives = {word: [word_id] for word, word_id in words.items()}
+        next_id = len(words) + 1
+        for text_word, read_as in readings.items():
+            if text_word in words:
+                word_id = words[text_word]
+            elif len(read_as) == 1:
+                word_id = words[read_as[0]]
+            else:
+                word_id = next_id
+                next_id += 1
+            self._word_ids[text_word] = word_id
+            for word in read_as:
+                if word_id not in alternatives[word]:
+                    alternatives[word].append(word_id)
+
+        # Trie over word ids: word id -> [children, term ids ending here].
+        # A term is reachable by the id of every text word reading as each
+        # of its words.
+        self._root = {}
+        for term_id, term in enumerate(self.terms):
+            if not term:
+                continue
+            for path in product(*(alternatives[word] for word in term.split(' '))):
+                level = self._root
+                node = None
+                for word_id in path:
+                    node = level.setdefault(word_id, [{}, []])
+                    level = node[0]
+                node[1].append(term_id)
+
+    def term_id(self, term):
+        """Id of a registered term"""
+        return self._term_ids[normalize(term)]
+
+    def size(self, name):
+        """Number of entries in a vocabulary, duplicates included"""
+        return len(self.vocabularies[name])
+
+    def scan(self, sections):
+        """
+        Scan lowercased sections as if joined by single spaces.
+
+        Returns a KeywordScan giving the hits of any run of consecutive
+        sections, i.e. of ' '.join(sections[first:last]).
+        """
+        word_ids = self._word_ids.get
+        words = []
+        bounds = [0]
+        for section in sections:
+            words.extend(map(word_ids, _WORD.findall(section)))
+            bounds.append(len(words))
+
+        spans = []
+        n = len(words)
+        root = self._root
+        for i in compress(range(n), words):
+            node = root.get(words[i])
+            j = i
+            while node is not None:
+                children, ends = node
+                for term_id in ends:
+                    spans.append((i, j, term_id))
+                j += 1
+                if j >= n or not children:
+                    break
+                node = children.get(words[j])
+        return KeywordScan(self, bounds, spans)
+
+
+class KeywordScan:
+    """Term spans (first word, last word, term id) of one scan, sliced into runs of sections on demand"""
+
+    def __init__(self, automaton, bounds, spans):
+        self._automaton = automaton
+        self._bounds = bounds
+        self._spans = spans
+
+    def hits(self, first=0, last=None):
+        """KeywordHits for ' '.join(sections[first:last])"""
+        bounds = self._bounds
+        start = bounds[first]
+        end = bounds[-1] if last is None else bounds[last]
+        if start == 0 and end == bounds[-1]:
+            found = {term_id for _, _, term_id in self._spans}
+        else:
+            found = {term_id for i, j, term_id in self._spans if i >= start and j < end}
+        return KeywordHits(self._automaton, found)
+
+    def each(self, first, last):
+        """KeywordHits for every section in first..last-1 on its own"""
+        bounds = self._bounds
+        result = [set() for _ in range(first, last)]
+        for i, j, term_id in self._spans:
+            k = bisect_right(bounds, i) - 1
+            if first <= k < last and j < bounds[k + 1]:
+                result[k - first].add(term_id)
+        return [KeywordHits(self._automaton, found) for found in result]
+
+
+class KeywordHits:
+    """Set of terms found in one span of text, queried per vocabulary"""
+
+    __slots__ = ('_automaton', 'term_ids')
+
+    def __init__(self, automaton, term_ids):
+        self._automaton = automaton
+        self.term_ids = term_ids
+
+    def count(self, name):
+        """How many vocabulary entries occur, duplicates counted twice"""
+        found = self.term_ids
+        if not found:
+            return 0
+        return sum(1 for term_id in self._automaton.vocabularies[name] if term_id in found)
+
+    def any(self, name):
+        found = self.term_ids
+        return bool(found) and any(term_id in found for term_id in self._automaton.vocabularies[name])
@@ -1,8 +1,537 @@
 import re
-from collections import defaultdict
-from datetime import datetime
-from dateutil import parser
+from collections.abc import Mapping
+from functools import cached_property, lru_cache
+from types import MethodType
 import logging
+from keyword_matcher import KeywordAutomaton
+from industry_classifier import IndustryClassifier
+from scoring_plans import SCORING_PLANS, get_plan, check_plans
+from compiled_criteria import CompiledCriteria, EvaluatorCache
+from duration_parser import parse_duration_months
+from summary_report import SummaryAccumulator
+from compact_cv import CompactCV
+from profiling import untimed
+
+# Keyword vocabularies used by the CVEvaluator scorers. They are compiled into
+# a single KeywordAutomaton below so each CV text is scanned once.
+POSITIVE_KEYWORDS = (
+    'achieved', 'increased', 'improved', 'developed',
+    'led', 'managed', 'created', 'implemented',
+    'awarded', 'recognized', 'quantifiable', 'metrics',
+    'saved', 'optimized', 'streamlined', 'reduced',
+    'resolved', 'identified', 'generated', 'secured',
+    'designed', 'built', 'delivered', 'architected',
+    'spearheaded', 'pioneered', 'transformed', 'enhanced'
+)
+
+NEGATIVE_KEYWORDS = (
+    'unemployed', 'terminated', 'fired',
+    'gap', 'criminal', 'conviction'
+)
+
+SOFTWARE_SKILL_KEYWORDS = ('quickbooks', 'excel', 'database', 'crm', 'erp')
+
+# Weighted keywords for industry detection, matched against the whole CV.
+# When two industries tie, the one listed first wins.
+INDUSTRY_DETECTION_KEYWORDS = {
+    'finance': {
+        'financial': 2, 'accounting': 2, 'audit': 2, 'tax': 1.5,
+        'gaap': 1.5, 'reconciliation': 1.5, 'ledger': 1.5,
+        'accounts payable': 2, 'accounts receivable': 2, 'cpa': 1.5,
+        'portfolio': 1.5, 'investment': 1.5, 'derivative': 1.5
+    },
+    'media': {'media': 1, 'marketing': 1, 'public relations': 1, 'content': 1},
+    'hospitality': {'hotel': 1, 'culinary': 1, 'hospitality': 1, 'guest': 1},
+    'social_services': {
+        'victim': 2, 'advocate': 2, 'case management': 2, 'crisis': 1.5,
+        'social work': 2, 'counseling': 1.5, 'community': 1
+    },
+    'customer_service': {
+        'customer service': 2, 'call center': 2, 'client relations': 1.5,
+        'customer advocate': 2, 'support': 1, 'help desk': 1.5
+    },
+    'natural_resources': {
+        'natural resource': 3, 'rangeland': 3, 'conservation': 2.5,
+        'environmental': 2, 'wildlife': 2, 'forestry': 2,
+        'agriculture': 2, 'grazing': 2.5, 'watershed': 2,
+        'ecology': 1.5, 'bureau of land management': 2.5,
+        'animal unit months': 2, 'aums': 2, 'soil': 1.5
+    },
+    'retail_fashion': {
+        'retail': 2, 'fashion': 2, 'apparel': 2, 'luxury': 1.5,
+        'merchandise': 1.5, 'boutique': 1.5, 'department store': 2,
+        'sales goals': 1.5, 'client development': 1.5, 'brand imaging': 1.5
+    },
+    'beauty_cosmetics': {
+        'makeup': 3, 'cosmetics': 2, 'beauty': 2, 'artistry': 1.5,
+        'skincare': 1.5, 'stylist': 1.5, 'bridal': 1, 'makeover': 1,
+        'product knowledge': 1.5, 'clienteling': 1.5
+    },
+    'hospitality_food': {
+        'food server': 3, 'restaurant': 2, 'pos system': 2, 'cash handling': 2,
+        'upselling': 1.5, 'food safety': 1.5, 'wait staff': 1.5, 'crew trainer': 1.5,
+        'casino': 1, 'barista': 1, 'bartender': 1
+    },
+    'arts_education': {
+        'art education': 3, 'curriculum': 2, 'teaching': 2, 'lesson plan': 2,
+        'art instructor': 2, 'classroom': 1.5, 'student': 1.5, 'pedagogy': 1.5,
+        'ceramics': 1, 'photography': 1, 'visual arts': 1
+    },
+    'it_architecture': {
+        'mdm': 3, 'master data management': 3, 'architecture': 2,
+        'tibco': 2, 'solution design': 2, 'enterprise': 1.5,
+        'integration': 1.5, 'data modeling': 1.5, 'technical lead': 1.5
+    },
+    'education_administration': {
+        'principal': 3, 'deputy principal': 3, 'education administration': 2,
+        'school improvement': 2, 'curriculum': 1.5, 'policy development': 1.5,
+        'budget management': 1.5, 'staff evaluation': 1.5, 'academic leadership': 1.5
+    },
+    'military_aviation': {
+        'aviation': 3, 'warrant officer': 3, 'pilot': 2, 'flight': 2,
+        'standardization': 1.5, 'aircrew': 1.5, 'rotary-wing': 1.5,
+        'combat': 1, 'medevac': 1, 'nvg': 1
+    },
+    'entry_level_service': {
+        'customer service': 3, 'retail': 2, 'food service': 2,
+        'security': 1.5, 'warehouse': 1.5, 'forklift': 1,
+        'cashier': 1, 'call center': 1, 'shift manager': 1
+    },
+    'financial_services': {
+        'vice president': 3, 'portfolio': 2, 'underwrote': 2,
+        'fannie mae': 1.5, 'freddie mac': 1.5, 'treasury': 1.5,
+        'loan production': 1.5, 'credit union': 1, 'small business banking': 2
+    },
+    'entry_level_finance': {
+        'internship': 2, 'assistant': 2, 'graduate': 1.5,
+        'entry level': 2, 'financial modeling': 1.5, 'analysis': 1.5,
+        'student': 1, 'master': 1, 'bachelor': 1
+    },
+    'bpo_operations': {
+        'bpo': 3, 'call center': 2, 'operations management': 2,
+        'kpi': 1.5, 'sales performance': 1.5, 'conversion metrics': 1.5,
+        'p&l': 1, 'gross margin': 1, 'direct sales': 1.5
+    }
+}
+
+# Term lists of the industry-specific scorers, keyed by scorer name
+SCORER_VOCABULARIES = {
+    'operations_management': [
+        'operations management', 'team management', 'site management', 'p&l',
+        'gross margin', 'revenue growth', 'resource allocation',
+        'workforce planning'
+    ],
+    'bpo_leadership': [
+        'team leadership', 'staff development', 'mentoring',
+        'performance management', 'training', 'coaching',
+        'employee engagement', 'supervision'
+    ],
+    'performance_metrics': [
+        'kpi', 'key performance', 'metrics', 'conversion rate', 'close ratio',
+        'arpu', 'performance improvement', 'target achievement'
+    ],
+    'process_improvement': [
+        'process improvement', 'efficiency', 'workflow', 'optimization',
+        'streamlining', 'best practices', 'standardization', 'methodology'
+    ],
+    'customer_relations': [
+        'customer service', 'client relations', 'customer support',
+        'help desk', 'call center', 'client retention',
+        'customer satisfaction', 'service quality'
+    ],
+    'multilingual': [
+        'english', 'spanish', 'french', 'german', 'portuguese', 'mandarin',
+        'hindi', 'arabic'
+    ],
+    'problem_solving': [
+        'problem solving', 'conflict resolution', 'issue resolution',
+        'troubleshooting', 'complaint handling', 'dispute resolution',
+        'quick resolution', 'effective solution'
+    ],
+    'service_tech_skills': [
+        'crm', 'help desk', 'ticketing system', 'call center', 'phone system',
+        'knowledge base', 'service cloud', 'live chat'
+    ],
+    'financial_analysis': [
+        'financial analysis', 'cash flow', 'valuation', 'risk assessment',
+        'credit analysis', 'modeling', 'forecasting', 'scenario analysis'
+    ],
+    'client_management': [
+        'client management', 'account management', 'client relations',
+        'stakeholder management', 'client retention', 'client satisfaction',
+        'service level', 'sla', 'client acquisition',
+        'relationship management', 'portfolio growth', 'cross-selling',
+        'retention', 'needs assessment', 'consultative'
+    ],
+    'regulatory_compliance': [
+        'compliance', 'regulatory', 'fannie mae', 'freddie mac', 'fha', 'va',
+        'audit', 'policy', 'procedures'
+    ],
+    'portfolio_management': [
+        'portfolio', 'underwriting', 'loan production', 'asset management',
+        'risk management', 'diversification', 'performance metrics'
+    ],
+    'finance_tech_skills': [
+        'excel', 'financial modeling', 'vba', 'database', 'crm',
+        'loan origination', 'bloomberg', 'reuters'
+    ],
+    'entry_level_analysis': [
+        'financial analysis', 'data analysis', 'research', 'valuation',
+        'modeling', 'forecasting', 'market research', 'investment analysis'
+    ],
+    'entry_tech_skills': [
+        'excel', 'powerpoint', 'word', 'vba', 'financial modeling',
+        'statistical analysis', 'database', 'prezi'
+    ],
+    'client_service': [
+        'client service', 'customer service', 'assistance', 'support',
+        'consultation', 'recommendations', 'needs assessment'
+    ],
+    'aviation_technical_skills': [
+        'flight planning', 'mission systems', 'avionics',
+        'emergency procedures', 'nvg operations', 'instrumentation',
+        'aircraft systems', 'maintenance', 'checklists'
+    ],
+    'military_leadership': [
+        'commander', 'supervisor', 'mentor', 'team lead', 'standardization',
+        'evaluation', 'performance review', 'resource management'
+    ],
+    'training_development': [
+        'training program', 'curriculum', 'lesson plan', 'instructor',
+        'teaching', 'coaching', 'professional development', 'mentoring'
+    ],
+    'safety_compliance': [
+        'safety', 'compliance', 'regulations', 'checklists', 'procedures',
+        'standards', 'risk management', 'emergency'
+    ],
+    'customer_service': [
+        'customer service', 'client relations', 'customer satisfaction',
+        'guest service', 'complaint resolution', 'customer needs',
+        'point of sale', 'cash handling'
+    ],
+    'teamwork': [
+        'teamwork', 'collaboration', 'team player', 'shift coordination',
+        'staff training', 'mentoring', 'peer support', 'crew'
+    ],
+    'multitasking': [
+        'multitasking', 'multiple tasks', 'simultaneous', 'while also',
+        'concurrently', 'during', 'at the same time', 'in addition to'
+    ],
+    'service_safety': [
+        'safety', 'security', 'compliance', 'regulations', 'procedures',
+        'emergency', 'incident report', 'patrol'
+    ],
+    'technical_skills': [
+        'tibco mdm', 'data modeling', 'oracle', 'sql server', 'java', 'j2ee',
+        'xml', 'ems', 'business events', 'integration', 'data quality',
+        'patterns'
+    ],
+    'project_management': [
+        'project management', 'delivery management', 'status reporting',
+        'resource planning', 'stakeholder management', 'timeline',
+        'milestones', 'go-live', 'implementation'
+    ],
+    'team_leadership': [
+        'team lead', 'mentor', 'coach', 'supervise', 'performance review',
+        'resource management', 'technical guidance', 'knowledge transfer'
+    ],
+    'solution_design': [
+        'solution design', 'architecture', 'technical design',
+        'system architecture', 'workflows', 'rule bases',
+        'integration design', 'data flow'
+    ],
+    'leadership': [
+        'principal', 'deputy principal', 'director', 'school leadership',
+        'campus management', 'strategic planning', 'decision making'
+    ],
+    'policy_implementation': [
+        'policy development', 'compliance', 'state laws',
+        'federal requirements', 'education code', 'board policy',
+        'regulations'
+    ],
+    'budget_management': [
+        'budget management', 'fiscal oversight', 'expenditure monitoring',
+        'fund allocation', 'financial planning', 'resource allocation'
+    ],
+    'staff_development': [
+        'staff development', 'professional growth', 'teacher training',
+        'performance evaluation', 'mentoring', 'coaching'
+    ],
+    'food_safety': [
+        'food safety', 'sanitation', 'health codes', 'hygiene', 'cleanliness',
+        'food handling'
+    ],
+    'pos_systems': [
+        'pos system', 'point of sale', 'cash register', 'order processing',
+        'payment processing'
+    ],
+    'upselling': [
+        'upsell', 'up-sell', 'increase sales', 'additional items',
+        'promote specials', 'suggestive selling'
+    ],
+    'curriculum_development': [
+        'curriculum design', 'lesson planning', 'educational standards',
+        'rubric', 'assessment', 'learning objectives'
+    ],
+    'artistic_skills': [
+        'photography', 'ceramics', 'painting', 'drawing', 'sculpture',
+        'printmaking', 'graphic design', 'digital art', 'mixed media'
+    ],
+    'technology_integration': [
+        'technology integration', 'computer lab', 'digital tools', 'software',
+        'multimedia', 'interactive', 'online resources'
+    ],
+    'business_development': [
+        'business growth', 'expand', 'develop', 'new market',
+        'vendor relations', 'brand awareness', 'community relations',
+        'strategic plan', 'maximize opportunities'
+    ],
+    'artistry_skills': [
+        'makeup application', 'hair styling', 'airbrushing',
+        'special effects', 'prosthetics', 'digital design', 'face chart',
+        'photo shoot', 'fashion show'
+    ],
+    'product_knowledge': [
+        'product knowledge', 'ingredients', 'brand training',
+        'schooling sessions', 'artistry training', 'certification'
+    ],
+    'field_experience': [
+        'field work', 'inventory', 'assessment', 'monitoring', 'inspection',
+        'compliance check', 'range unit', 'allotment', 'AUMs',
+        'animal unit months', 'grazing', 'conservation', 'watershed',
+        'ecological', 'rehabilitation'
+    ],
+    'regulatory_knowledge': [
+        'regulation', 'compliance', 'policy', 'code of federal', 'CFR',
+        'legal', 'permit', 'authorization', 'resolution', 'mitigation',
+        'environmental assessment', 'EA', 'NEPA'
+    ],
+    'natural_resources_skills': [
+        'ArcGIS', 'TAAMs', 'GPS', 'Trimble', 'Garmin', 'range management',
+        'soil conservation', 'watershed', 'ecological', 'inventory',
+        'monitoring', 'compliance', 'regulatory', 'environmental',
+        'conservation'
+    ],
+    'case_management': [
+        'case management', 'service plan', 'treatment plan', 'assessment'
+    ],
+    'crisis_intervention': [
+        'crisis', 'emergency', 'intervention', 'trauma', 'safety plan'
+    ],
+    'client_relations': [
+        'client', 'patient', 'relationship', 'rapport', 'trust'
+    ],
+    'tech_skills': [
+        'software', 'system', 'database', 'microsoft', 'spreadsheet'
+    ],
+    'finance_skills': [
+        'underwriting', 'risk management', 'compliance', 'loan processing',
+        'GAAP', 'financial reporting', 'accounts payable',
+        'accounts receivable'
+    ],
+    'compliance': [
+        'compliance', 'regulation', 'audit', 'policy', 'standard'
+    ],
+    'creativity': [
+        'created', 'developed', 'produced'
+    ],
+    'operations': [
+        'operations', 'managed', 'team'
+    ]
+}
+
+# Words of the degree, job title and academic record checks
+DEGREE_KEYWORDS = {
+    'phd': ('phd', 'doctor', 'doctorate', 'doctoral'),
+    'master': ('master', 'mba'),
+    'bachelor': ('bachelor', 'bs', 'ba'),
+    'associate': ('associate', 'a.a.s')
+}
+TITLE_KEYWORDS = {
+    'operational': ('pilot', 'aircrew', 'maintainer', 'operator'),
+    'teaching': ('instructor', 'teacher')
+}
+ACADEMIC_KEYWORDS = {
+    'scholarship': ('scholarship',),
+    'honor': ('honor',)
+}
+
+def _automaton_vocabularies():
+    vocabularies = dict(SCORER_VOCABULARIES)
+    vocabularies['positive'] = POSITIVE_KEYWORDS
+    vocabularies['negative'] = NEGATIVE_KEYWORDS
+    vocabularies['software'] = SOFTWARE_SKILL_KEYWORDS
+    for industry, plan in SCORING_PLANS.items():
+        vocabularies['industry:' + industry] = plan.positive_keywords
+        vocabularies['skills:' + industry] = plan.skill_keywords
+    for industry, keywords in INDUSTRY_DETECTION_KEYWORDS.items():
+        vocabularies['detect:' + industry] = list(keywords)
+    for level, words in DEGREE_KEYWORDS.items():
+        vocabularies['degree:' + level] = words
+        # The degree name alone, as education quality scores it
+        vocabularies['degree-name:' + level] = (level,)
+    for kind, words in TITLE_KEYWORDS.items():
+        vocabularies['title:' + kind] = words
+    for name, words in ACADEMIC_KEYWORDS.items():
+        vocabularies['academic:' + name] = words
+    return vocabularies
+
+KEYWORD_AUTOMATON = KeywordAutomaton(_automaton_vocabularies())
+INDUSTRY_CLASSIFIER = IndustryClassifier(INDUSTRY_DETECTION_KEYWORDS, KEYWORD_AUTOMATON)
+
+@lru_cache(maxsize=8192)
+def text_hits(text):
+    """KeywordHits of a short lowercased text such as a degree or job title"""
+    return KEYWORD_AUTOMATON.scan([text]).hits()
+
+# Version of the scoring rules; bump it whenever a change alters any score,
+# check or report, so cached results are never reused across the change
+SCORING_ENGINE_VERSION = '4'
+
+# How much of a report to build:
+#   score    - scores and requirement checks only, no text is generated
+#   standard - adds the decision and the strengths/weaknesses
+#   full     - adds candidate info, the full feedback and the extracted data
+EVALUATION_DEPTHS = ('score', 'standard', 'full')
+
+# Requirement checks in order of cost, as gate-first evaluation runs them;
+# the industry gates need the industry's scores and always come last
+REQUIREMENT_GATES = ('min_experience', 'education_level', 'required_skills', 'keywords')
+
+# Education levels a requirement can ask for, lowest first
+EDUCATION_LEVELS = ['associate', 'bachelor', 'master', 'phd']
+
+def check_depth(depth):
+    if depth not in EVALUATION_DEPTHS:
+        raise ValueError(f"depth must be one of {', '.join(EVALUATION_DEPTHS)}, got {depth!r}")
+    return depth
+
+class CVDocument:
+    """
+    Normalized view of a single CV, built once per evaluation.
+
+    Section texts are joined and lowercased here so that industry detection,
+    every scorer and the requirement checks share the same strings instead of
+    rebuilding them on each call. Derived texts are computed on first use.
+    """
+
+    def __init__(self, cv_data, reference_date=None):
+        # A compact record is decoded once, into the dict every section and
+        # the report's extracted_data come from
+        self.data = cv_data = cv_data.to_dict() if isinstance(cv_data, CompactCV) else cv_data
+        # Date ongoing roles end at; None means now
+        self.reference_date = reference_date
+        self.summary = cv_data.get('summary', '')
+        self.experience = cv_data.get('experience', [])
+        self.education = cv_data.get('education', [])
+        self.skills = cv_data.get('skills', [])
+        self.accomplishments = cv_data.get('accomplishments', [])
+
+    @classmethod
+    def of(cls, cv_data):
+        """Return cv_data unchanged if it is already a CVDocument"""
+        return cv_data if isinstance(cv_data, cls) else cls(cv_data)
+
+    @cached_property
+    def experience_months(self):
+        """Length in months of every experience entry"""
+        return [parse_duration_months(exp.get('duration', ''), self.reference_date) for exp in self.experience]
+
+    @cached_property
+    def total_experience_years(self):
+        return round(sum(self.experience_months) / 12, 1)
+
+    @cached_property
+    def experience_text_raw(self):
+        return ' '.join([exp.get('description', '') for exp in self.experience])
+
+    @cached_property
+    def narrative_raw(self):
+        """Summary followed by experience descriptions, original casing"""
+        return ' '.join([self.summary, self.experience_text_raw])
+
+    @cached_property
+    def summary_lower(self):
+        return self.summary.lower()
+
+    @cached_property
+    def narrative(self):
+        """Lowercased summary and experience descriptions"""
+        return ' '.join([self.summary_lower, ' '.join(self.experience_descriptions)])
+
+    @cached_property
+    def corpus(self):
+        """Lowercased summary, experience descriptions and skills"""
+        return ' '.join([self.narrative, self.skills_text])
+
+    @cached_property
+    def keyword_text(self):
+        """Lowercased summary, skills and experience, in the order keyword criteria use"""
+        return ' '.join([self.summary_lower, self.skills_text, ' '.join(self.experience_descriptions)])
+
+    @cached_property
+    def skills_text(self):
+        return ' '.join(self.skills_lower)
+
+    @cached_property
+    def skills_lower(self):
+        return [skill.lower() for skill in self.skills]
+
+    @cached_property
+    def experience_descriptions(self):
+        """Lowercased description of each experience entry"""
+        return [exp.get('description', '').lower() for exp in self.experience]
+
+    @cached_property
+    def accomplishments_lower(self):
+        return [ach.lower() for ach in self.accomplishments]
+
+    # Keyword hits. The corpus is scanned once, section by section, and the
+    # hits of the narrative, each experience and each skill are sliced from
+    # that scan; a keyword only counts for the text it lies entirely inside.
+
+    @cached_property
+    def _corpus_scan(self):
+        sections = [self.summary_lower]
+        sections.extend(self.experience_descriptions or [''])
+        sections.extend(self.skills_lower or [''])
+        return KEYWORD_AUTOMATON.scan(sections)
+
+    @cached_property
+    def _narrative_sections(self):
+        return 1 + max(1, len(self.experience_descriptions))
+
+    @cached_property
+    def corpus_hits(self):
+        return self._corpus_scan.hits()
+
+    @cached_property
+    def narrative_hits(self):
+        return self._corpus_scan.hits(0, self._narrative_sections)
+
+    @cached_property
+    def experience_hits(self):
+        """Hits per experience description"""
+        return self._corpus_scan.each(1, 1 + len(self.experience_descriptions))
+
+    @cached_property
+    def skill_hits(self):
+        """Hits per skill entry"""
+        first = self._narrative_sections
+        return self._corpus_scan.each(first, first + len(self.skills_lower))
+
+    @cached_property
+    def accomplishment_hits(self):
+        """Hits per accomplishment"""
+        return KEYWORD_AUTOMATON.scan(self.accomplishments_lower).each(0, len(self.accomplishments_lower))
+
+    @cached_property
+    def section_names(self):
+        return [s.lower() for s in self.data.keys()]
+
+    @cached_property
+    def narrative_tokens(self):
+        return self.narrative.split()
 
 class CVEvaluationSystem:
     def __init__(self):
@@ -129,8 +658,14 @@ class CVEvaluationSystem:
         }
         
         self.required_cv_fields = ['summary', 'experience', 'education', 'skills']
+        # Date ongoing roles are measured to; None means the time of evaluation
+        self.reference_date = None
+        # Stage timing of every evaluated CV; None (the default) is off
+        self.profiler = None
 
     def set_requirements(self, requirements):
+        # Evaluators are cached by a fingerprint of the criteria, so changed
+        # criteria never reuse an evaluator built for the old ones
         for key, value in requirements.items():
             if key in self.evaluation_criteria:
                 if key == 'industry_specific_weights' and isinstance(value, dict):
@@ -139,7 +674,13 @@ class CVEvaluationSystem:
                     self.evaluation_criteria[key] = value
 
     def _validate_cv_data(self, cv_data):
-        """Validate and fix the structure of CV data"""
+        """
+        Validate and fix the structure of CV data. Returns the CV as a dict:
+        a dict is fixed in place, a compact record is decoded and the
+        decoded dict is fixed, leaving the record as it is.
+        """
+        if isinstance(cv_data, CompactCV):
+            cv_data = cv_data.to_dict()
         if not isinstance(cv_data, dict):
             raise ValueError("CV data must be a dictionary")
         
@@ -159,179 +700,205 @@ class CVEvaluationSystem:
         for field in ['experience', 'education', 'skills']:
             if field in cv_data and not isinstance(cv_data[field], list):
                 cv_data[field] = [cv_data[field]] if field != 'skills' else [str(cv_data[field])]
-
-    def evaluate_multiple_cvs(self, cvs_data):
-        reports = []
-        for cv_id, cv_data in cvs_data.items():
-            try:
-                # Validate and fix CV data instead of raising exceptions
-                self._validate_cv_data(cv_data)
-                industry = self._detect_industry(cv_data)
-                evaluation = self._evaluate_cv(cv_data, industry)
-                report = self._generate_report(evaluation, cv_data, industry)
-                meets_reqs = self._check_requirements(evaluation, industry)
-                reports.append({
-                    'cv_id': cv_id,
-                    'industry': industry,
-                    'report': report,
-                    'meets_requirements': meets_reqs
-                })
-            except Exception as e:
-                logging.error(f"Error evaluating CV {cv_id}: {str(e)}")
-                # Create a placeholder report with proper structure
-                reports.append({
-                    'cv_id': cv_id,
-                    'industry': 'unknown',
-                    'report': {
-                        'evaluation_summary': {
-                            'total_score': 0,
-                            'decision': 'Error',
-                            'strengths': [],
-                            'weaknesses': [f'Error: {str(e)}']
-                        },
-                        'score_breakdown': {},
-                        'full_feedback': [f'Error: {str(e)}'],
-                        'extracted_data': cv_data if isinstance(cv_data, dict) else {}
-                    },
-                    'meets_requirements': {'error': True},
-                    'error': str(e)
-                })
+        return cv_data
+
+    def evaluate_multiple_cvs(self, cvs_data, depth='full', workers=None, chunk_size=None, gate_first=False):
+        """
+        Evaluate every CV of cvs_data, a dict of cv_id -> CV data or a
+        CompactBatch of them (see compact_cv.py).
+
+        With workers > 1 the CVs are spread, chunk_size at a time, over a
+        pool of worker processes. Reports keep the order of cvs_data either
+        way, and CVs then are validated on copies rather than in place.
+        depth='score' with workers is the bulk screening path.
+
+        With gate_first, the hard requirements are checked before scoring,
+        cheapest first, and a CV failing one only gets a minimal 'Rejected'
+        report naming the gate (see _rejection_report).
+        """
+        check_depth(depth)
+        reports = None
+        if workers is not None and workers > 1:
+            from parallel_evaluation import evaluate_parallel
+            reports = evaluate_parallel(self, cvs_data, depth, self._batch_criteria(), workers, chunk_size,
+                                        gate_first)
+        if reports is None:
+            reports = list(self.iter_evaluate(cvs_data, depth, gate_first=gate_first))
 
         return {
             'individual_reports': reports,
             'summary_report': self._generate_summary_report(reports)
         }
 
-    def _detect_industry(self, cv_data):
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-
-        # Enhanced industry detection with new categories
-        finance_keywords = {
-            'financial': 2, 'accounting': 2, 'audit': 2, 'tax': 1.5,
-            'gaap': 1.5, 'reconciliation': 1.5, 'ledger': 1.5,
-            'accounts payable': 2, 'accounts receivable': 2, 'cpa': 1.5,
-            'portfolio': 1.5, 'investment': 1.5, 'derivative': 1.5
-        }
-
-        media_keywords = ['media', 'marketing', 'public relations', 'content']
-        hospitality_keywords = ['hotel', 'culinary', 'hospitality', 'guest']
-
-        social_services_keywords = {
-            'victim': 2, 'advocate': 2, 'case management': 2, 'crisis': 1.5,
-            'social work': 2, 'counseling': 1.5, 'community': 1
-        }
-
-        customer_service_keywords = {
-            'customer service': 2, 'call center': 2, 'client relations': 1.5,
-            'customer advocate': 2, 'support': 1, 'help desk': 1.5
-        }
-
-        natural_resources_keywords = {
-            'natural resource': 3, 'rangeland': 3, 'conservation': 2.5,
-            'environmental': 2, 'wildlife': 2, 'forestry': 2,
-            'agriculture': 2, 'grazing': 2.5, 'watershed': 2,
-            'ecology': 1.5, 'bureau of land management': 2.5,
-            'animal unit months': 2, 'aums': 2, 'soil': 1.5
-        }
-
-        retail_fashion_keywords = {
-            'retail': 2, 'fashion': 2, 'apparel': 2, 'luxury': 1.5,
-            'merchandise': 1.5, 'boutique': 1.5, 'department store': 2,
-            'sales goals': 1.5, 'client development': 1.5, 'brand imaging': 1.5
-        }
-
-        beauty_cosmetics_keywords = {
-            'makeup': 3, 'cosmetics': 2, 'beauty': 2, 'artistry': 1.5,
-            'skincare': 1.5, 'stylist': 1.5, 'bridal': 1, 'makeover': 1,
-            'product knowledge': 1.5, 'clienteling': 1.5
-        }
-
-        hospitality_food_keywords = {
-            'food server': 3, 'restaurant': 2, 'pos system': 2, 'cash handling': 2,
-            'upselling': 1.5, 'food safety': 1.5, 'wait staff': 1.5, 'crew trainer': 1.5,
-            'casino': 1, 'barista': 1, 'bartender': 1
-        }
-
-        arts_education_keywords = {
-            'art education': 3, 'curriculum': 2, 'teaching': 2, 'lesson plan': 2,
-            'art instructor': 2, 'classroom': 1.5, 'student': 1.5, 'pedagogy': 1.5,
-            'ceramics': 1, 'photography': 1, 'visual arts': 1
-        }
-
-        it_architecture_keywords = {
-            'mdm': 3, 'master data management': 3, 'architecture': 2,
-            'tibco': 2, 'solution design': 2, 'enterprise': 1.5,
-            'integration': 1.5, 'data modeling': 1.5, 'technical lead': 1.5
-        }
+    def iter_evaluate(self, cvs_iterable, depth='full', summary=None, gate_first=False):
+        """
+        Evaluate CVs lazily, yielding each individual report as soon as it is ready.
+
+        cvs_iterable is a mapping of cv_id -> CV data, such as a dict or a
+        CompactBatch, or any iterable of (cv_id, cv_data) pairs, so CVs can
+        be streamed in as well. When a
+        SummaryAccumulator is given as summary, every report is added to it
+        before being yielded; summary.finalize() then gives the summary report.
+        gate_first is as for evaluate_multiple_cvs.
+        """
+        check_depth(depth)
+        if isinstance(cvs_iterable, Mapping):
+            cvs_iterable = cvs_iterable.items()
+        compiled = self._batch_criteria()
+        for cv_id, cv_data in cvs_iterable:
+            report = self._evaluate_one(cv_id, cv_data, depth, compiled, gate_first)
+            if summary is not None:
+                summary.add(report)
+            yield report
+
+    def _batch_criteria(self):
+        """Compiled criteria shared by the CVs of a batch, or None if invalid"""
+        try:
+            return self._compiled_criteria()
+        except Exception:
+            # Invalid criteria are reported by every CV's evaluation instead
+            return None
 
-        education_admin_keywords = {
-            'principal': 3, 'deputy principal': 3, 'education administration': 2,
-            'school improvement': 2, 'curriculum': 1.5, 'policy development': 1.5,
-            'budget management': 1.5, 'staff evaluation': 1.5, 'academic leadership': 1.5
-        }
+    def _evaluate_one(self, cv_id, cv_data, depth='full', compiled=None, gate_first=False):
+        profiler = self.profiler
+        if profiler is None:
+            return self._evaluate_stages(cv_id, cv_data, depth, compiled, gate_first, None, untimed)
 
-        military_aviation_keywords = {
-            'aviation': 3, 'warrant officer': 3, 'pilot': 2, 'flight': 2,
-            'standardization': 1.5, 'aircrew': 1.5, 'rotary-wing': 1.5,
-            'combat': 1, 'medevac': 1, 'nvg': 1
-        }
+        timer = profiler.timer()
+        result = self._evaluate_stages(cv_id, cv_data, depth, compiled, gate_first, timer, timer.measure)
+        profiler.record(timer.finish())
+        if profiler.attach_timings:
+            result['report']['timings'] = timer.to_dict()
+        return result
 
-        entry_level_service_keywords = {
-            'customer service': 3, 'retail': 2, 'food service': 2,
-            'security': 1.5, 'warehouse': 1.5, 'forklift': 1,
-            'cashier': 1, 'call center': 1, 'shift manager': 1
+    def _evaluate_stages(self, cv_id, cv_data, depth, compiled, gate_first, timer, measure):
+        try:
+            # Validate and fix CV data instead of raising exceptions
+            cv_data = self._validate_cv_data(cv_data)
+            doc = CVDocument(cv_data, self.reference_date)
+            if gate_first:
+                checks = measure('check_gates', self._check_gates, doc)
+                if not all(checks.values()):
+                    return self._rejection_report(cv_id, cv_data, 'unknown', checks, depth)
+            industry = measure('detect_industry', self._detect_industry, doc)
+            if gate_first:
+                evaluator = EVALUATOR_CACHE.get(compiled or self._compiled_criteria(), industry)
+                if not measure('passes_gates', evaluator.passes_gates, doc):
+                    checks['industry_specific'] = False
+                    return self._rejection_report(cv_id, cv_data, industry, checks, depth)
+            evaluation = self._evaluate_cv(doc, industry, depth, compiled, timer)
+            report = measure('generate_report', self._generate_report, evaluation, doc, industry, depth)
+            meets_reqs = measure('check_requirements', self._check_requirements, evaluation, industry, doc)
+            return {
+                'cv_id': cv_id,
+                'industry': industry,
+                'report': report,
+                'meets_requirements': meets_reqs
+            }
+        except Exception as e:
+            logging.error(f"Error evaluating CV {cv_id}: {str(e)}")
+            return self._error_report(cv_id, cv_data, e, depth)
+
+    def enable_profiling(self, attach_timings=False, profiler=None):
+        """
+        Time the stages of every CV this system evaluates from now on; returns
+        the Profiler collecting them (see profiling.py). Given a profiler,
+        its histograms keep growing across enable/disable calls.
+        """
+        if profiler is None:
+            from profiling import Profiler
+            profiler = Profiler()
+        profiler.attach_timings = attach_timings
+        self.profiler = profiler
+        return profiler
+
+    def disable_profiling(self):
+        """Stop timing stages; returns the Profiler that was collecting them"""
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def rank_top_k(self, cvs_data, k=20, depth='full'):
+        """
+        The k best scoring CVs of cvs_data, best first.
+
+        Only candidates that can still reach the top k are fully scored, and
+        only the final top k get feedback and a report; see ranking.py.
+        """
+        from ranking import rank_top_k
+        return rank_top_k(self, cvs_data, k, depth)
+
+    def rescore(self, cvs_data, retained, depth='full'):
+        """
+        evaluate_multiple_cvs recomputing only the scores that changed criteria
+        affect, given the RetainedScores of the previous run; see delta_scoring.py.
+        """
+        from delta_scoring import rescore
+        return rescore(self, cvs_data, retained, depth)
+
+    def _error_report(self, cv_id, cv_data, error, depth='full'):
+        """Placeholder report, with the usual structure, for a CV that failed"""
+        report = {
+            'evaluation_summary': {
+                'total_score': 0,
+                'decision': 'Error',
+                'strengths': [],
+                'weaknesses': [f'Error: {str(error)}']
+            },
+            'score_breakdown': {}
         }
-
-        financial_services_keywords = {
-            'vice president': 3, 'portfolio': 2, 'underwrote': 2,
-            'fannie mae': 1.5, 'freddie mac': 1.5, 'treasury': 1.5,
-            'loan production': 1.5, 'credit union': 1, 'small business banking': 2
+        if depth == 'full':
+            report['full_feedback'] = [f'Error: {str(error)}']
+            if isinstance(cv_data, CompactCV):
+                cv_data = cv_data.to_dict()
+            report['extracted_data'] = cv_data if isinstance(cv_data, dict) else {}
+        return {
+            'cv_id': cv_id,
+            'industry': 'unknown',
+            'report': report,
+            'meets_requirements': {'error': True},
+            'error': str(error)
         }
 
-        entry_level_finance_keywords = {
-            'internship': 2, 'assistant': 2, 'graduate': 1.5,
-            'entry level': 2, 'financial modeling': 1.5, 'analysis': 1.5,
-            'student': 1, 'master': 1, 'bachelor': 1
-        }
+    def classify_industry(self, cv_data):
+        """
+        Score every industry for a CV.
 
-        bpo_operations_keywords = {
-            'bpo': 3, 'call center': 2, 'operations management': 2,
-            'kpi': 1.5, 'sales performance': 1.5, 'conversion metrics': 1.5,
-            'p&l': 1, 'gross margin': 1, 'direct sales': 1.5
-        }
+        Returns the ranked scores along with the detected industry, the
+        margin over the runner-up and the winner's share of the keyword
+        weight found, as a JSON-serializable dict.
+        """
+        return INDUSTRY_CLASSIFIER.rank(CVDocument.of(cv_data).corpus_hits).to_dict()
 
-        scores = {
-            'finance': sum(weight for word, weight in finance_keywords.items() if word in text),
-            'media': sum(1 for word in media_keywords if word in text),
-            'hospitality': sum(1 for word in hospitality_keywords if word in text),
-            'social_services': sum(weight for word, weight in social_services_keywords.items() if word in text),
-            'customer_service': sum(weight for word, weight in customer_service_keywords.items() if word in text),
-            'natural_resources': sum(weight for word, weight in natural_resources_keywords.items() if word in text),
-            'retail_fashion': sum(weight for word, weight in retail_fashion_keywords.items() if word in text),
-            'beauty_cosmetics': sum(weight for word, weight in beauty_cosmetics_keywords.items() if word in text),
-            'hospitality_food': sum(weight for word, weight in hospitality_food_keywords.items() if word in text),
-            'arts_education': sum(weight for word, weight in arts_education_keywords.items() if word in text),
-            'it_architecture': sum(weight for word, weight in it_architecture_keywords.items() if word in text),
-            'education_administration': sum(weight for word, weight in education_admin_keywords.items() if word in text),
-            'military_aviation': sum(weight for word, weight in military_aviation_keywords.items() if word in text),
-            'entry_level_service': sum(weight for word, weight in entry_level_service_keywords.items() if word in text),
-            'financial_services': sum(weight for word, weight in financial_services_keywords.items() if word in text),
-            'entry_level_finance': sum(weight for word, weight in entry_level_finance_keywords.items() if word in text),
-            'bpo_operations': sum(weight for word, weight in bpo_operations_keywords.items() if word in text)
-        }
+    def _detect_industry(self, cv_data):
+        return INDUSTRY_CLASSIFIER.rank(CVDocument.of(cv_data).corpus_hits).industry
 
-        max_industry = max(scores, key=scores.get)
-        return max_industry if scores[max_industry] > 0 else 'general'
+    def _compiled_criteria(self):
+        return EVALUATOR_CACHE.compile(self.evaluation_criteria)
 
-    def _evaluate_cv(self, cv_data, industry):
-        evaluator = CVEvaluator(self.evaluation_criteria, industry)
-        return evaluator.evaluate(cv_data)
+    def _evaluate_cv(self, cv_data, industry, depth='full', compiled=None, timer=None):
+        evaluator = EVALUATOR_CACHE.get(compiled or self._compiled_criteria(), industry)
+        return evaluator.evaluate(CVDocument.of(cv_data), depth, timer)
 
-    def _generate_report(self, evaluation, cv_data, industry):
+    def _generate_report(self, evaluation, cv_data, industry, depth='full'):
+        if depth == 'score':
+            return {
+                'evaluation_summary': {
+                    'total_score': evaluation['total_score'],
+                    'industry': industry
+                },
+                'score_breakdown': evaluation['score_breakdown']
+            }
+        if depth == 'standard':
+            return {
+                'evaluation_summary': {
+                    'total_score': evaluation['total_score'],
+                    'decision': self._make_decision(evaluation['total_score'], industry),
+                    'strengths': [fb for fb in evaluation['feedback'] if 'strong' in fb or 'impressive' in fb],
+                    'weaknesses': [fb for fb in evaluation['feedback'] if 'could be improved' in fb or 'missing' in fb],
+                    'industry': industry
+                },
+                'score_breakdown': evaluation['score_breakdown']
+            }
         return {
             'candidate_info': self._extract_candidate_info(cv_data),
             'evaluation_summary': {
@@ -343,10 +910,18 @@ class CVEvaluationSystem:
             },
             'score_breakdown': evaluation['score_breakdown'],
             'full_feedback': evaluation['feedback'],
-            'extracted_data': cv_data
+            'extracted_data': CVDocument.of(cv_data).data
         }
 
-    def _check_requirements(self, evaluation, industry):
+    def _check_requirements(self, evaluation, industry, doc=None):
+        scores = evaluation['score_breakdown']
+        doc = CVDocument.of(doc if doc is not None else evaluation['extracted_data'])
+        checks = self._check_criteria(scores, doc)
+        checks['industry_specific'] = get_plan(industry).passes_gates(scores)
+        return checks
+
+    def _check_criteria(self, scores, doc):
+        """Requirement checks against the criteria; industry gates are left passing"""
         checks = {
             'min_experience': True,
             'required_skills': True,
@@ -354,202 +929,105 @@ class CVEvaluationSystem:
             'keywords': True,
             'industry_specific': True
         }
+        for gate in ('min_experience', 'required_skills', 'education_level', 'keywords'):
+            passed = self._check_gate(gate, doc, scores)
+            if passed is not None:
+                checks[gate] = passed
+        return checks
 
+    def _check_gate(self, gate, doc, scores=None):
+        """One criteria requirement check, or None if the criteria do not set it"""
         criteria = self.evaluation_criteria
-        scores = evaluation['score_breakdown']
-        data = evaluation['extracted_data']
-
-        if criteria['min_experience_years'] > 0:
-            checks['min_experience'] = scores['total_experience_years'] >= criteria['min_experience_years']
-
-        if criteria['required_skills']:
-            missing = [s for s in criteria['required_skills']
-                      if s.lower() not in ' '.join(data.get('skills', [])).lower()]
-            checks['required_skills'] = not missing
-
-        if criteria['education_level']:
-            levels = ['associate', 'bachelor', 'master', 'phd']
-            req_idx = levels.index(criteria['education_level'])
-            highest = self._get_highest_education(data.get('education', []))
-            curr_idx = levels.index(highest.lower()) if highest and highest.lower() in levels else -1
-            checks['education_level'] = curr_idx >= req_idx
-
-        if criteria['keywords']:
-            text = ' '.join([
-                data.get('summary', ''),
-                ' '.join(data.get('skills', [])),
-                ' '.join([exp.get('description', '') for exp in data.get('experience', [])])
-            ]).lower()
-            matches = sum(1 for kw in criteria['keywords'] if kw.lower() in text)
-            checks['keywords'] = matches >= len(criteria['keywords']) * 0.5
-
-        # Industry-specific checks
-        if industry == 'finance':
-            checks['industry_specific'] = (
-                scores.get('technical_skills_score', 0) >= 60 and
-                scores.get('compliance_score', 0) >= 50
-            )
-        elif industry == 'media':
-            checks['industry_specific'] = (
-                scores.get('creativity_score', 0) >= 50 and
-                scores.get('project_management_score', 0) >= 40
-            )
-        elif industry == 'hospitality':
-            checks['industry_specific'] = (
-                scores.get('customer_service_score', 0) >= 70 and
-                scores.get('operations_score', 0) >= 50
-            )
-        elif industry == 'social_services':
-            checks['industry_specific'] = (
-                scores.get('case_management_score', 0) >= 60 and
-                scores.get('crisis_intervention_score', 0) >= 50
-            )
-        elif industry == 'customer_service':
-            checks['industry_specific'] = (
-                scores.get('customer_service_score', 0) >= 65 and
-                scores.get('problem_solving_score', 0) >= 50
-            )
-        elif industry == 'natural_resources':
-            checks['industry_specific'] = (
-                scores.get('field_experience_score', 0) >= 70 and
-                scores.get('regulatory_knowledge_score', 0) >= 60
-            )
-        elif industry == 'retail_fashion':
-            checks['industry_specific'] = (
-                scores.get('sales_performance_score', 0) >= 60 and
-                scores.get('team_leadership_score', 0) >= 50 and
-                scores.get('business_development_score', 0) >= 40
-            )
-        elif industry == 'beauty_cosmetics':
-            checks['industry_specific'] = (
-                scores.get('artistry_skills_score', 0) >= 60 and
-                scores.get('product_knowledge_score', 0) >= 50 and
-                scores.get('creativity_score', 0) >= 40
-            )
-        elif industry == 'hospitality_food':
-            checks['industry_specific'] = (
-                scores.get('customer_service_score', 0) >= 70 and
-                scores.get('food_safety_score', 0) >= 60 and
-                scores.get('pos_systems_score', 0) >= 40
-            )
-        elif industry == 'arts_education':
-            checks['industry_specific'] = (
-                scores.get('curriculum_development_score', 0) >= 60 and
-                scores.get('teaching_experience_score', 0) >= 50 and
-                scores.get('artistic_skills_score', 0) >= 40
-            )
-        elif industry == 'it_architecture':
-            checks['industry_specific'] = (
-                scores.get('technical_skills_score', 0) >= 70 and
-                scores.get('project_management_score', 0) >= 50 and
-                scores.get('solution_design_score', 0) >= 40
-            )
-        elif industry == 'education_administration':
-            checks['industry_specific'] = (
-                scores.get('leadership_score', 0) >= 70 and
-                scores.get('policy_implementation_score', 0) >= 50 and
-                scores.get('budget_management_score', 0) >= 40
-            )
-        elif industry == 'military_aviation':
-            checks['industry_specific'] = (
-                scores.get('technical_skills_score', 0) >= 70 and
-                scores.get('leadership_score', 0) >= 60 and
-                scores.get('safety_compliance_score', 0) >= 50
-            )
-        elif industry == 'entry_level_service':
-            checks['industry_specific'] = (
-                scores.get('customer_service_score', 0) >= 65 and
-                scores.get('teamwork_score', 0) >= 50 and
-                scores.get('multitasking_score', 0) >= 40
-            )
-        elif industry == 'financial_services':
-            checks['industry_specific'] = (
-                scores.get('financial_analysis_score', 0) >= 70 and
-                scores.get('client_management_score', 0) >= 50 and
-                scores.get('regulatory_compliance_score', 0) >= 40
-            )
-        elif industry == 'entry_level_finance':
-            checks['industry_specific'] = (
-                scores.get('financial_analysis_score', 0) >= 60 and
-                scores.get('academic_achievement_score', 0) >= 50 and
-                scores.get('technical_skills_score', 0) >= 40
-            )
-        elif industry == 'bpo_operations':
-            checks['industry_specific'] = (
-                scores.get('operations_management_score', 0) >= 70 and
-                scores.get('team_leadership_score', 0) >= 50 and
-                scores.get('performance_metrics_score', 0) >= 40
-            )
-        elif industry == 'customer_service':
-            checks['industry_specific'] = (
-                scores.get('customer_relations_score', 0) >= 70 and
-                scores.get('problem_solving_score', 0) >= 50 and
-                scores.get('technical_skills_score', 0) >= 40
-            )
-        else:  # general
-            checks['industry_specific'] = (
-                scores.get('experience_quality', 0) >= 50 and
-                scores.get('education_quality', 0) >= 40 and
-                scores.get('skills_relevance', 0) >= 40
-            )
 
+        if gate == 'min_experience':
+            if criteria['min_experience_years'] > 0:
+                years = scores['total_experience_years'] if scores is not None else doc.total_experience_years
+                return years >= criteria['min_experience_years']
+
+        elif gate == 'required_skills':
+            if criteria['required_skills']:
+                skills_text = doc.skills_text
+                missing = [s for s in criteria['required_skills'] if s.lower() not in skills_text]
+                return not missing
+
+        elif gate == 'education_level':
+            if criteria['education_level']:
+                req_idx = self._required_education_index()
+                highest = self._get_highest_education(doc.education)
+                curr_idx = EDUCATION_LEVELS.index(highest.lower()) if highest and highest.lower() in EDUCATION_LEVELS else -1
+                return curr_idx >= req_idx
+
+        elif gate == 'keywords':
+            if criteria['keywords']:
+                text = doc.keyword_text
+                matches = sum(1 for kw in criteria['keywords'] if kw.lower() in text)
+                return matches >= len(criteria['keywords']) * 0.5
+
+        return None
+
+    def _check_gates(self, doc):
+        """
+        Criteria requirement checks in order of cost, stopping at the first
+        failure; returns the checks made so far.
+        """
+        # An unknown education_level fails every CV, gate-first or not
+        if self.evaluation_criteria['education_level']:
+            self._required_education_index()
+
+        checks = {}
+        for gate in REQUIREMENT_GATES:
+            passed = self._check_gate(gate, doc)
+            if passed is not None:
+                checks[gate] = passed
+                if not passed:
+                    break
         return checks
 
+    def _required_education_index(self):
+        """Rank of the required education level; ValueError if it is unknown"""
+        return EDUCATION_LEVELS.index(self.evaluation_criteria['education_level'])
+
+    def _rejection_report(self, cv_id, cv_data, industry, checks, depth='full'):
+        """Minimal report for a CV that failed a requirement gate"""
+        gate = next(name for name, passed in checks.items() if not passed)
+        report = {
+            'evaluation_summary': {
+                'total_score': 0,
+                'decision': 'Rejected',
+                'rejected_at': gate,
+                'strengths': [],
+                'weaknesses': [f'Rejected at requirement gate: {gate}']
+            },
+            'score_breakdown': {}
+        }
+        if depth == 'full':
+            report['extracted_data'] = cv_data
+        return {
+            'cv_id': cv_id,
+            'industry': industry,
+            'report': report,
+            'meets_requirements': checks,
+            'rejected_at': gate
+        }
+
     def _extract_candidate_info(self, cv_data):
-        summary = cv_data.get('summary', '')
+        doc = CVDocument.of(cv_data)
+        summary = doc.summary
         email = re.search(r'[\w\.-]+@[\w\.-]+', summary)
         phone = re.search(r'(\+?\d[\d\s-]{7,}\d)', summary)
         return {
             'name': self._extract_name(summary),
             'email': email.group(0) if email else 'Not found',
             'phone': phone.group(0) if phone else 'Not found',
-            'experience_years': self._calculate_total_experience(cv_data.get('experience', [])),
-            'highest_education': self._get_highest_education(cv_data.get('education', []))
+            'experience_years': doc.total_experience_years,
+            'highest_education': self._get_highest_education(doc.education)
         }
 
     def _extract_name(self, text):
         lines = text.split('\n')
         return lines[0].strip() if lines else "Not found"
 
-    def _calculate_total_experience(self, experiences):
-        total_months = sum(self._parse_duration(exp.get('duration', '')) for exp in experiences)
-        return round(total_months / 12, 1)
 
-    def _parse_duration(self, duration_str):
-        try:
-            if not duration_str:
-                return 0
-            
-            # Handle present/current case
-            if 'present' in duration_str.lower() or 'current' in duration_str.lower():
-                end_date = datetime.now()
-            else:
-                end_date = None
-            
-            # Improved date parsing with dateutil
-            date_pattern = r'(\d{1,2}/\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4})'
-            dates = re.findall(date_pattern, duration_str, re.IGNORECASE)
-            
-            if len(dates) >= 2:
-                start = parser.parse(dates[0])
-                end = parser.parse(dates[1]) if not end_date else datetime.now()
-                return (end.year - start.year) * 12 + (end.month - start.month)
-            
-            # Fallback to simple year/month extraction
-            years_match = re.search(r'(\d+)\s*year', duration_str, re.IGNORECASE)
-            months_match = re.search(r'(\d+)\s*month', duration_str, re.IGNORECASE)
-            
-            total_months = 0
-            if years_match:
-                total_months += int(years_match.group(1)) * 12
-            if months_match:
-                total_months += int(months_match.group(1))
-            
-            return total_months if total_months > 0 else 12  # Default to 1 year if can't parse
-            
-        except Exception as e:
-            logging.warning(f"Error parsing duration '{duration_str}': {str(e)}")
-            return 12  # Fallback to 1 year
 
     def _get_highest_education(self, education_list):
         if not education_list:
@@ -557,14 +1035,14 @@ class CVEvaluationSystem:
             
         levels = []
         for edu in education_list:
-            degree = edu.get('degree', '').lower()
-            if 'phd' in degree or 'doctor' in degree:
+            degree = text_hits(edu.get('degree', '').lower())
+            if degree.any('degree:phd'):
                 levels.append(4)
-            elif 'master' in degree or 'mba' in degree:
+            elif degree.any('degree:master'):
                 levels.append(3)
-            elif 'bachelor' in degree or 'bs' in degree or 'ba' in degree:
+            elif degree.any('degree:bachelor'):
                 levels.append(2)
-            elif 'associate' in degree or 'a.a.s' in degree:
+            elif degree.any('degree:associate'):
                 levels.append(1)
             else:
                 levels.append(0)
@@ -580,29 +1058,7 @@ class CVEvaluationSystem:
         }.get(highest_level, 'Other')
 
     def _make_decision(self, score, industry):
-        thresholds = {
-            'finance': (85, 70, 55),
-            'media': (80, 65, 50),
-            'hospitality': (75, 60, 45),
-            'social_services': (80, 65, 50),
-            'customer_service': (75, 60, 45),
-            'natural_resources': (80, 65, 50),
-            'retail_fashion': (80, 65, 50),
-            'beauty_cosmetics': (80, 65, 50),
-            'hospitality_food': (75, 60, 45),
-            'arts_education': (80, 65, 50),
-            'it_architecture': (85, 70, 55),
-            'education_administration': (80, 65, 50),
-            'military_aviation': (85, 70, 55),
-            'entry_level_service': (75, 60, 45),
-            'financial_services': (85, 70, 55),
-            'entry_level_finance': (80, 65, 50),
-            'bpo_operations': (80, 65, 50),
-            'customer_service': (75, 60, 45),
-            'general': (80, 65, 50)
-        }
-        
-        high, med, low = thresholds.get(industry, (80, 65, 50))
+        high, med, low = get_plan(industry).thresholds
         
         if score >= high: return "Highly Recommended"
         if score >= med: return "Recommended"
@@ -610,1159 +1066,267 @@ class CVEvaluationSystem:
         return "Not Recommended"
 
     def _generate_summary_report(self, reports):
-        total = len(reports)
-        
-        # Extract scores safely with error checking
-        scores = []
-        for r in reports:
-            try:
-                if 'report' in r and 'evaluation_summary' in r['report'] and 'total_score' in r['report']['evaluation_summary']:
-                    scores.append(r['report']['evaluation_summary']['total_score'])
-            except Exception:
-                continue
-        
-        avg = sum(scores) / len(scores) if scores else 0
-        
-        # Count meets requirements safely
-        meets = 0
-        for r in reports:
-            try:
-                if 'meets_requirements' in r and isinstance(r['meets_requirements'], dict) and all(r['meets_requirements'].values()):
-                    meets += 1
-            except Exception:
-                continue
-        
-        # Build industry distribution safely
-        industry_dist = defaultdict(int)
-        for r in reports:
-            try:
-                industry_dist[r.get('industry', 'unknown')] += 1
-            except Exception:
-                industry_dist['unknown'] += 1
-        
-        # Build decision distribution safely
-        decisions = defaultdict(int)
-        for r in reports:
-            try:
-                decision = r['report']['evaluation_summary'].get('decision', 'Unknown')
-                decisions[decision] += 1
-            except Exception:
-                decisions['Error'] += 1
-        
-        # Safely extract strengths and weaknesses
-        all_strengths = []
-        all_weaknesses = []
-        for r in reports:
-            try:
-                strengths = r['report']['evaluation_summary'].get('strengths', [])
-                weaknesses = r['report']['evaluation_summary'].get('weaknesses', [])
-                all_strengths.extend(strengths)
-                all_weaknesses.extend(weaknesses)
-            except Exception:
-                continue
-        
-        top_strengths = sorted(((s, all_strengths.count(s)) for s in set(all_strengths)), key=lambda x: -x[1])[:3]
-        top_weaknesses = sorted(((w, all_weaknesses.count(w)) for w in set(all_weaknesses)), key=lambda x: -x[1])[:3]
-        
-        # Include error information
-        errors = []
-        for r in reports:
-            if 'error' in r:
-                errors.append(r['error'])
-        
-        return {
-            'total_cvs_evaluated': total,
-            'average_score': round(avg, 1),
-            'meets_requirements_count': meets,
-            'meets_requirements_percentage': round((meets / total) * 100, 1) if total else 0,
-            'industry_distribution': dict(industry_dist),
-            'decision_distribution': dict(decisions),
-            'common_strengths': top_strengths,
-            'common_weaknesses': top_weaknesses,
-            'errors': errors
-        }
+        return SummaryAccumulator.of(reports).finalize()
+
+class KeywordScorer:
+    """
+    Industry scorer driven by how many terms of one vocabulary a CV contains.
+
+    Text regions ('narrative', 'corpus') count the vocabulary entries found;
+    entry regions ('skills', 'experience', 'accomplishments') count the
+    entries containing any of them. The count scores min(100, count *
+    per_match), or otherwise its percentage of the vocabulary size, capped at
+    100 if capped is set. Instances are used as CVEvaluator methods.
+    """
+
+    TEXT_REGIONS = {'narrative': 'narrative_hits', 'corpus': 'corpus_hits'}
+    ENTRY_REGIONS = {
+        'skills': 'skill_hits',
+        'experience': 'experience_hits',
+        'accomplishments': 'accomplishment_hits'
+    }
+
+    def __init__(self, region, vocabulary, per_match=None, capped=False):
+        if region not in self.TEXT_REGIONS and region not in self.ENTRY_REGIONS:
+            raise ValueError(f"Unknown keyword scorer region: {region}")
+        self.region = region
+        self.vocabulary = vocabulary
+        self.per_match = per_match
+        self.capped = capped
+        self.size = len(SCORER_VOCABULARIES[vocabulary])
+
+    def __get__(self, instance, owner):
+        return self if instance is None else MethodType(self, instance)
+
+    def __call__(self, evaluator, doc):
+        return self.score(self.matches(doc))
+
+    def hits(self, doc):
+        """KeywordHits of the region, or a list of them for entry regions"""
+        if self.region in self.TEXT_REGIONS:
+            return getattr(doc, self.TEXT_REGIONS[self.region])
+        return getattr(doc, self.ENTRY_REGIONS[self.region])
+
+    def matches(self, doc):
+        hits = self.hits(doc)
+        if self.region in self.TEXT_REGIONS:
+            return hits.count(self.vocabulary)
+        return sum(1 for entry in hits if entry.any(self.vocabulary))
+
+    def score(self, matches):
+        if self.per_match is not None:
+            return min(100, matches * self.per_match)
+        percentage = (matches / self.size) * 100
+        return min(100, percentage) if self.capped else percentage
+
+    def ceiling(self, doc):
+        """
+        Highest score the CV could get: 100, but for an uncapped entry
+        region, which scores its entries as a percentage of the vocabulary
+        size, len(entries) / size * 100 if that is more.
+        """
+        if self.per_match is not None or self.capped or self.region in self.TEXT_REGIONS:
+            return 100
+        return max(100, len(self.hits(doc)) / self.size * 100)
 
 class CVEvaluator:
     def __init__(self, criteria, industry):
-        self.criteria = criteria
+        self.compiled = CompiledCriteria.of(criteria)
+        self.criteria = self.compiled.criteria
         self.industry = industry
+        self.plan = get_plan(industry)
         
         # Pre-compile regex patterns
         self.quantifiable_pattern = re.compile(r'\$\d+[MBK]?|\d+\s*(%|percent)|reduced by \d+', re.IGNORECASE)
         self.gpa_pattern = re.compile(r'gpa\s*[:of]?\s*(\d\.\d+)', re.IGNORECASE)
-        
-        # Convert keyword lists to sets for faster lookups
-        self.positive_keywords = {
-            'achieved', 'increased', 'improved', 'developed',
-            'led', 'managed', 'created', 'implemented',
-            'awarded', 'recognized', 'quantifiable', 'metrics',
-            'saved', 'optimized', 'streamlined', 'reduced',
-            'resolved', 'identified', 'generated', 'secured',
-            'designed', 'built', 'delivered', 'architected',
-            'spearheaded', 'pioneered', 'transformed', 'enhanced'
-        }
-        
-        self.negative_keywords = {
-            'unemployed', 'terminated', 'fired',
-            'gap', 'criminal', 'conviction'
-        }
-        
-        # Enhanced industry-specific positive keywords
-        self.industry_positive_keywords = {
-            'finance': [
-                'compliance', 'audit', 'risk assessment', 'portfolio',
-                'underwriting', 'reconciliation', 'GAAP', 'financial reporting',
-                'investment', 'derivatives', 'valuation', 'exposure', 'IBOR',
-                'data governance', 'data quality', 'data architecture'
-            ],
-            'media': ['campaign', 'press release', 'social media', 'content creation'],
-            'hospitality': ['guest satisfaction', 'front office', 'reservation'],
-            'social_services': [
-                'case management', 'crisis intervention', 'advocacy',
-                'trauma-informed', 'victim services', 'community outreach'
-            ],
-            'customer_service': [
-                'customer satisfaction', 'call center', 'client relations',
-                'troubleshooting', 'problem resolution', 'service excellence'
-            ],
-            'natural_resources': [
-                'conservation', 'rangeland', 'watershed', 'ecological',
-                'regulatory', 'compliance', 'inventory', 'assessment',
-                'mitigation', 'rehabilitation', 'grazing', 'AUMs',
-                'animal unit months', 'range unit', 'allotment',
-                'ArcGIS', 'TAAMs', 'noxious weed', 'soil conservation'
-            ],
-            'retail_fashion': [
-                'sales growth', 'client retention', 'revenue increase',
-                'team development', 'merchandising', 'visual presentation',
-                'brand standards', 'key holder', 'inventory management'
-            ],
-            'beauty_cosmetics': [
-                'artistry training', 'product knowledge', 'client consultation',
-                'makeup application', 'bridal makeup', 'photo shoot',
-                'fashion show', 'counter management', 'social media promotion'
-            ],
-            'hospitality_food': [
-                'customer satisfaction', 'food handling', 'sanitation',
-                'point of sale', 'menu knowledge', 'beverage service',
-                'shift supervisor', 'training staff', 'health codes'
-            ],
-            'arts_education': [
-                'curriculum design', 'lesson planning', 'student assessment',
-                'art exhibition', 'teaching methods', 'classroom management',
-                'art techniques', 'visual arts', 'creative development'
-            ],
-            'it_architecture': [
-                'solution architecture', 'technical leadership', 'system integration',
-                'data governance', 'project delivery', 'stakeholder management',
-                'performance tuning', 'best practices', 'enterprise systems'
-            ],
-            'education_administration': [
-                'student outcomes', 'academic excellence', 'staff development',
-                'compliance management', 'strategic planning', 'performance metrics',
-                'educational leadership', 'policy implementation', 'budget oversight'
-            ],
-            'military_aviation': [
-                'flight hours', 'instructor pilot', 'mission planning',
-                'safety compliance', 'crew resource management',
-                'standard operating procedures', 'training development',
-                'aerial operations', 'emergency procedures'
-            ],
-            'entry_level_service': [
-                'customer satisfaction', 'point of sale', 'inventory management',
-                'shift management', 'team collaboration', 'conflict resolution',
-                'safety protocols', 'multitasking', 'process improvement'
-            ],
-            'financial_services': [
-                'loan portfolio', 'risk management', 'regulatory compliance',
-                'client acquisition', 'cross-selling', 'financial modeling',
-                'cash flow analysis', 'credit analysis', 'underwriting'
-            ],
-            'entry_level_finance': [
-                'financial analysis', 'academic projects', 'research',
-                'data analysis', 'valuation', 'financial statements',
-                'market research', 'investment analysis', 'excel modeling'
-            ],
-            'bpo_operations': [
-                'operations management', 'performance metrics', 'kpi improvement',
-                'team leadership', 'process improvement', 'client management',
-                'sales conversion', 'revenue growth', 'profit margin'
-            ],
-            'customer_service': [
-                'customer satisfaction', 'problem resolution', 'multilingual support',
-                'client retention', 'service quality', 'call handling',
-                'complaint management', 'customer experience', 'service metrics'
-            ]
-        }
 
-    def evaluate(self, cv_data):
+    def evaluate(self, cv_data, depth='full', timer=None):
+        """
+        Score a CV; depth (see EVALUATION_DEPTHS) decides what else is built.
+        With a StageTimer, every score and the feedback are timed one by one.
+        """
+        doc = CVDocument.of(cv_data)
+        if timer is not None:
+            return self._evaluate_timed(doc, depth, timer)
         base_scores = {
-            'section_completeness': self._evaluate_completeness(cv_data),
-            'experience_quality': self._evaluate_experience(cv_data.get('experience', [])),
-            'education_quality': self._evaluate_education(cv_data.get('education', [])),
-            'skills_relevance': self._evaluate_skills(cv_data.get('skills', [])),
-            'achievements_quality': self._evaluate_achievements(cv_data.get('accomplishments', [])),
-            'keyword_matching': self._evaluate_keywords(cv_data),
-            'structure_quality': self._evaluate_structure(cv_data),
-            'total_experience_years': self._calculate_total_experience(cv_data.get('experience', []))
+            'section_completeness': self._evaluate_completeness(doc),
+            'experience_quality': self._evaluate_experience(doc),
+            'education_quality': self._evaluate_education(doc.education),
+            'skills_relevance': self._evaluate_skills(doc),
+            'achievements_quality': self._evaluate_achievements(doc),
+            'keyword_matching': self._evaluate_keywords(doc),
+            'structure_quality': self._evaluate_structure(doc),
+            'total_experience_years': doc.total_experience_years
         }
         
-        industry_scores = self._evaluate_industry_specific(cv_data)
+        industry_scores = self._evaluate_industry_specific(doc)
         base_scores.update(industry_scores)
         
-        weights = self._get_weights()
-        total_score = sum(base_scores[k] * weights.get(k, 0) for k in base_scores)
-        total_score = max(0, min(100, total_score))
-        
-        return {
-            'total_score': round(total_score, 1),
-            'score_breakdown': base_scores,
-            'feedback': self._generate_feedback(base_scores, cv_data),
-            'extracted_data': cv_data
+        evaluation = {
+            'total_score': self.total_score(base_scores),
+            'score_breakdown': base_scores
         }
-
-    def _get_weights(self):
-        weights = {
-            'section_completeness': 0.10,
-            'experience_quality': 0.30,
-            'education_quality': 0.15,
-            'skills_relevance': 0.20,
-            'achievements_quality': 0.10,
-            'keyword_matching': 0.05,
-            'structure_quality': 0.05,
-            'technical_skills_score': 0.05
+        if check_depth(depth) != 'score':
+            evaluation['feedback'] = self._generate_feedback(base_scores, doc.data)
+        if depth == 'full':
+            evaluation['extracted_data'] = doc.data
+        return evaluation
+
+    def _evaluate_timed(self, doc, depth, timer):
+        base_scores = {key: timer.measure('score.' + key, scorer, doc) for key, scorer in self.scorers().items()}
+        evaluation = {
+            'total_score': self.total_score(base_scores),
+            'score_breakdown': base_scores
         }
-        
-        if self.industry == 'finance':
-            weights.update({
-                'experience_quality': 0.35,
-                'technical_skills_score': 0.15,
-                'compliance_score': 0.10
-            })
-        elif self.industry == 'media':
-            weights.update({
-                'creativity_score': 0.15,
-                'project_management_score': 0.10
-            })
-        elif self.industry == 'hospitality':
-            weights.update({
-                'customer_service_score': 0.20,
-                'operations_score': 0.15
-            })
-        elif self.industry == 'social_services':
-            weights.update({
-                'case_management_score': 0.25,
-                'crisis_intervention_score': 0.20,
-                'client_relations_score': 0.15
-            })
-        elif self.industry == 'customer_service':
-            weights.update({
-                'customer_service_score': 0.35,
-                'problem_solving_score': 0.15,
-                'technical_skills_score': 0.10
-            })
-        elif self.industry == 'natural_resources':
-            weights.update({
-                'field_experience_score': 0.35,
-                'technical_skills_score': 0.25,
-                'regulatory_knowledge_score': 0.20,
-                'education_quality': 0.20,
-                'experience_quality': 0.25
-            })
-        elif self.industry == 'retail_fashion':
-            weights.update({
-                'sales_performance_score': 0.30,
-                'team_leadership_score': 0.25,
-                'customer_service_score': 0.25,
-                'business_development_score': 0.20
-            })
-        elif self.industry == 'beauty_cosmetics':
-            weights.update({
-                'artistry_skills_score': 0.30,
-                'customer_service_score': 0.25,
-                'sales_performance_score': 0.20,
-                'product_knowledge_score': 0.15,
-                'creativity_score': 0.10
-            })
-        elif self.industry == 'hospitality_food':
-            weights.update({
-                'customer_service_score': 0.35,
-                'food_safety_score': 0.20,
-                'pos_systems_score': 0.15,
-                'upselling_score': 0.15,
-                'teamwork_score': 0.15
-            })
-        elif self.industry == 'arts_education':
-            weights.update({
-                'curriculum_development_score': 0.30,
-                'teaching_experience_score': 0.25,
-                'artistic_skills_score': 0.20,
-                'technology_integration_score': 0.15,
-                'leadership_score': 0.10
-            })
-        elif self.industry == 'it_architecture':
-            weights.update({
-                'technical_skills_score': 0.30,
-                'project_management_score': 0.25,
-                'team_leadership_score': 0.20,
-                'solution_design_score': 0.15,
-                'industry_knowledge_score': 0.10
-            })
-        elif self.industry == 'education_administration':
-            weights.update({
-                'leadership_score': 0.30,
-                'policy_implementation_score': 0.25,
-                'budget_management_score': 0.20,
-                'staff_development_score': 0.15,
-                'academic_improvement_score': 0.10
-            })
-        elif self.industry == 'military_aviation':
-            weights.update({
-                'technical_skills_score': 0.25,
-                'leadership_score': 0.25,
-                'training_development_score': 0.20,
-                'safety_compliance_score': 0.15,
-                'operational_experience_score': 0.15
-            })
-        elif self.industry == 'entry_level_service':
-            weights.update({
-                'customer_service_score': 0.35,
-                'teamwork_score': 0.25,
-                'multitasking_score': 0.20,
-                'technical_skills_score': 0.10,
-                'safety_compliance_score': 0.10
-            })
-        elif self.industry == 'financial_services':
-            weights.update({
-                'financial_analysis_score': 0.30,
-                'client_management_score': 0.25,
-                'regulatory_compliance_score': 0.20,
-                'portfolio_management_score': 0.15,
-                'technical_skills_score': 0.10
-            })
-        elif self.industry == 'entry_level_finance':
-            weights.update({
-                'financial_analysis_score': 0.35,
-                'academic_achievement_score': 0.25,
-                'technical_skills_score': 0.20,
-                'client_service_score': 0.15,
-                'teamwork_score': 0.05
-            })
-        elif self.industry == 'bpo_operations':
-            weights.update({
-                'operations_management_score': 0.30,
-                'team_leadership_score': 0.25,
-                'performance_metrics_score': 0.20,
-                'client_management_score': 0.15,
-                'process_improvement_score': 0.10
-            })
-            
-        return weights
+        if check_depth(depth) != 'score':
+            evaluation['feedback'] = timer.measure('generate_feedback', self._generate_feedback, base_scores, doc.data)
+        if depth == 'full':
+            evaluation['extracted_data'] = doc.data
+        return evaluation
+
+    def total_score(self, scores):
+        """Weighted total of a score breakdown, summed in breakdown order"""
+        weights = self.plan.weights
+        total_score = sum(scores[k] * weights.get(k, 0) for k in scores)
+        return round(max(0, min(100, total_score)), 1)
+
+    def scorers(self):
+        """
+        Score key -> function(doc) for every score of the breakdown, in
+        breakdown order, so scores can be computed one at a time.
+        """
+        scorers = {
+            'section_completeness': self._evaluate_completeness,
+            'experience_quality': self._evaluate_experience,
+            'education_quality': lambda doc: self._evaluate_education(doc.education),
+            'skills_relevance': self._evaluate_skills,
+            'achievements_quality': self._evaluate_achievements,
+            'keyword_matching': self._evaluate_keywords,
+            'structure_quality': self._evaluate_structure,
+            'total_experience_years': lambda doc: doc.total_experience_years
+        }
+        for key, scorer in self.plan.scorers:
+            scorers[key] = getattr(self, scorer)
+        return scorers
 
-    def _evaluate_industry_specific(self, cv_data):
-        scores = {}
-        
-        if self.industry == 'finance':
-            scores.update({
-                'technical_skills_score': self._evaluate_finance_skills(cv_data.get('skills', [])),
-                'compliance_score': self._evaluate_compliance(cv_data)
-            })
-        elif self.industry == 'media':
-            scores.update({
-                'creativity_score': self._evaluate_creativity(cv_data),
-                'project_management_score': self._evaluate_project_management(cv_data.get('experience', []))
-            })
-        elif self.industry == 'hospitality':
-            scores.update({
-                'customer_service_score': self._evaluate_customer_service(cv_data),
-                'operations_score': self._evaluate_operations(cv_data.get('experience', []))
-            })
-        elif self.industry == 'social_services':
-            scores.update({
-                'case_management_score': self._evaluate_case_management(cv_data),
-                'crisis_intervention_score': self._evaluate_crisis_intervention(cv_data),
-                'client_relations_score': self._evaluate_client_relations(cv_data)
-            })
-        elif self.industry == 'customer_service':
-            scores.update({
-                'customer_service_score': self._evaluate_customer_service(cv_data),
-                'problem_solving_score': self._evaluate_problem_solving(cv_data),
-                'technical_skills_score': self._evaluate_tech_skills(cv_data.get('skills', []))
-            })
-        elif self.industry == 'natural_resources':
-            scores.update({
-                'field_experience_score': self._evaluate_field_experience(cv_data),
-                'regulatory_knowledge_score': self._evaluate_regulatory_knowledge(cv_data),
-                'technical_skills_score': self._evaluate_natural_resources_skills(cv_data.get('skills', []))
-            })
-        elif self.industry == 'retail_fashion':
-            scores.update({
-                'sales_performance_score': self._evaluate_sales_performance(cv_data),
-                'team_leadership_score': self._evaluate_team_leadership(cv_data),
-                'business_development_score': self._evaluate_business_development(cv_data)
-            })
-        elif self.industry == 'beauty_cosmetics':
-            scores.update({
-                'artistry_skills_score': self._evaluate_artistry_skills(cv_data),
-                'product_knowledge_score': self._evaluate_product_knowledge(cv_data),
-                'creativity_score': self._evaluate_creativity(cv_data)
-            })
-        elif self.industry == 'hospitality_food':
-            scores.update({
-                'food_safety_score': self._evaluate_food_safety(cv_data),
-                'pos_systems_score': self._evaluate_pos_systems(cv_data),
-                'upselling_score': self._evaluate_upselling(cv_data),
-                'teamwork_score': self._evaluate_teamwork(cv_data)
-            })
-        elif self.industry == 'arts_education':
-            scores.update({
-                'curriculum_development_score': self._evaluate_curriculum_development(cv_data),
-                'teaching_experience_score': self._evaluate_teaching_experience(cv_data),
-                'artistic_skills_score': self._evaluate_artistic_skills(cv_data),
-                'technology_integration_score': self._evaluate_technology_integration(cv_data)
-            })
-        elif self.industry == 'it_architecture':
-            scores.update({
-                'technical_skills_score': self._evaluate_technical_skills(cv_data),
-                'project_management_score': self._evaluate_project_management(cv_data),
-                'team_leadership_score': self._evaluate_team_leadership(cv_data),
-                'solution_design_score': self._evaluate_solution_design(cv_data)
-            })
-        elif self.industry == 'education_administration':
-            scores.update({
-                'leadership_score': self._evaluate_leadership(cv_data),
-                'policy_implementation_score': self._evaluate_policy_implementation(cv_data),
-                'budget_management_score': self._evaluate_budget_management(cv_data),
-                'staff_development_score': self._evaluate_staff_development(cv_data)
-            })
-        elif self.industry == 'military_aviation':
-            scores.update({
-                'technical_skills_score': self._evaluate_aviation_technical_skills(cv_data),
-                'leadership_score': self._evaluate_military_leadership(cv_data),
-                'training_development_score': self._evaluate_training_development(cv_data),
-                'safety_compliance_score': self._evaluate_safety_compliance(cv_data),
-                'operational_experience_score': self._evaluate_operational_experience(cv_data)
-            })
-        elif self.industry == 'entry_level_service':
-            scores.update({
-                'customer_service_score': self._evaluate_customer_service(cv_data),
-                'teamwork_score': self._evaluate_teamwork(cv_data),
-                'multitasking_score': self._evaluate_multitasking(cv_data),
-                'technical_skills_score': self._evaluate_service_tech_skills(cv_data),
-                'safety_compliance_score': self._evaluate_service_safety(cv_data)
-            })
-        elif self.industry == 'financial_services':
-            scores.update({
-                'financial_analysis_score': self._evaluate_financial_analysis(cv_data),
-                'client_management_score': self._evaluate_client_management(cv_data),
-                'regulatory_compliance_score': self._evaluate_regulatory_compliance(cv_data),
-                'portfolio_management_score': self._evaluate_portfolio_management(cv_data),
-                'technical_skills_score': self._evaluate_finance_tech_skills(cv_data)
-            })
-        elif self.industry == 'entry_level_finance':
-            scores.update({
-                'financial_analysis_score': self._evaluate_entry_level_analysis(cv_data),
-                'academic_achievement_score': self._evaluate_academic_achievement(cv_data),
-                'technical_skills_score': self._evaluate_entry_tech_skills(cv_data),
-                'client_service_score': self._evaluate_client_service(cv_data),
-                'teamwork_score': self._evaluate_teamwork(cv_data)
-            })
-        elif self.industry == 'bpo_operations':
-            scores.update({
-                'operations_management_score': self._evaluate_operations_management(cv_data),
-                'team_leadership_score': self._evaluate_bpo_leadership(cv_data),
-                'performance_metrics_score': self._evaluate_performance_metrics(cv_data),
-                'client_management_score': self._evaluate_client_management(cv_data),
-                'process_improvement_score': self._evaluate_process_improvement(cv_data)
-            })
-        elif self.industry == 'customer_service':
-            scores.update({
-                'customer_relations_score': self._evaluate_customer_relations(cv_data),
-                'multilingual_score': self._evaluate_multilingual(cv_data),
-                'problem_solving_score': self._evaluate_problem_solving(cv_data),
-                'technical_skills_score': self._evaluate_service_tech_skills(cv_data),
-                'teamwork_score': self._evaluate_teamwork(cv_data)
-            })
-            
-        return scores
+    def passes_gates(self, doc):
+        """The industry requirement check, computing only the scores it needs"""
+        scorers = self.scorers()
+        return self.plan.passes_gates({key: scorers[key](doc) for key, _ in self.plan.gates if key in scorers})
+
+    def _evaluate_industry_specific(self, doc):
+        return {key: getattr(self, scorer)(doc) for key, scorer in self.plan.scorers}
 
-    def _parse_duration(self, duration_str):
-        try:
-            if not duration_str:
-                return 0
-                
-            # Handle present/current case
-            if 'present' in duration_str.lower() or 'current' in duration_str.lower():
-                end_date = datetime.now()
-            else:
-                end_date = None
-                
-            # Improved date parsing with dateutil
-            date_pattern = r'(\d{1,2}/\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4})'
-            dates = re.findall(date_pattern, duration_str, re.IGNORECASE)
-            
-            if len(dates) >= 2:
-                start = parser.parse(dates[0])
-                end = parser.parse(dates[1]) if not end_date else datetime.now()
-                return (end.year - start.year) * 12 + (end.month - start.month)
-                
-            # Fallback to simple year/month extraction
-            years_match = re.search(r'(\d+)\s*year', duration_str, re.IGNORECASE)
-            months_match = re.search(r'(\d+)\s*month', duration_str, re.IGNORECASE)
-            
-            total_months = 0
-            if years_match:
-                total_months += int(years_match.group(1)) * 12
-            if months_match:
-                total_months += int(months_match.group(1))
-                
-            return total_months if total_months > 0 else 12  # Default to 1 year if can't parse
-            
-        except Exception as e:
-            logging.warning(f"Error parsing duration '{duration_str}': {str(e)}")
-            return 12  # Fallback to 1 year
 
     # Add new evaluation methods for BPO operations industry
-    def _evaluate_operations_management(self, cv_data):
-        ops_terms = [
-            'operations management', 'team management', 'site management',
-            'p&l', 'gross margin', 'revenue growth',
-            'resource allocation', 'workforce planning'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in ops_terms if term in text)
-        return (matches / len(ops_terms)) * 100 if ops_terms else 0
-
-    def _evaluate_bpo_leadership(self, cv_data):
-        leadership_terms = [
-            'team leadership', 'staff development', 'mentoring',
-            'performance management', 'training', 'coaching',
-            'employee engagement', 'supervision'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in leadership_terms if term in text)
-        return (matches / len(leadership_terms)) * 100 if leadership_terms else 0
-
-    def _evaluate_performance_metrics(self, cv_data):
-        metric_terms = [
-            'kpi', 'key performance', 'metrics',
-            'conversion rate', 'close ratio', 'arpu',
-            'performance improvement', 'target achievement'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in metric_terms if term in text)
-        return min(100, matches * 20)
-
-    def _evaluate_process_improvement(self, cv_data):
-        improvement_terms = [
-            'process improvement', 'efficiency', 'workflow',
-            'optimization', 'streamlining', 'best practices',
-            'standardization', 'methodology'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in improvement_terms if term in text)
-        return min(100, matches * 20)
+    _evaluate_operations_management = KeywordScorer('narrative', 'operations_management')
+    _evaluate_bpo_leadership = KeywordScorer('narrative', 'bpo_leadership')
+    _evaluate_performance_metrics = KeywordScorer('narrative', 'performance_metrics', per_match=20)
+    _evaluate_process_improvement = KeywordScorer('narrative', 'process_improvement', per_match=20)
 
     # Add new evaluation methods for customer service industry
-    def _evaluate_customer_relations(self, cv_data):
-        service_terms = [
-            'customer service', 'client relations', 'customer support',
-            'help desk', 'call center', 'client retention',
-            'customer satisfaction', 'service quality'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in service_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_multilingual(self, cv_data):
-        languages = [
-            'english', 'spanish', 'french',
-            'german', 'portuguese', 'mandarin',
-            'hindi', 'arabic'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-        
-        matches = sum(1 for lang in languages if lang in text)
-        return min(100, matches * 25)  # 25 points per language up to 100
-
-    def _evaluate_problem_solving(self, cv_data):
-        problem_terms = [
-            'problem solving', 'conflict resolution', 'issue resolution',
-            'troubleshooting', 'complaint handling', 'dispute resolution',
-            'quick resolution', 'effective solution'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in problem_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_service_tech_skills(self, cv_data):
-        tech_skills = [
-            'crm', 'help desk', 'ticketing system',
-            'call center', 'phone system', 'knowledge base',
-            'service cloud', 'live chat'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-        
-        matches = sum(1 for skill in tech_skills if skill in text)
-        return (matches / len(tech_skills)) * 100 if tech_skills else 0
+    _evaluate_customer_relations = KeywordScorer('narrative', 'customer_relations', per_match=25)
+    _evaluate_multilingual = KeywordScorer('corpus', 'multilingual', per_match=25)  # 25 points per language up to 100
+    _evaluate_problem_solving = KeywordScorer('narrative', 'problem_solving', per_match=25)
+    _evaluate_service_tech_skills = KeywordScorer('corpus', 'service_tech_skills')
 
     # Add new evaluation methods for financial services industry
-    def _evaluate_financial_analysis(self, cv_data):
-        analysis_terms = [
-            'financial analysis', 'cash flow', 'valuation',
-            'risk assessment', 'credit analysis', 'modeling',
-            'forecasting', 'scenario analysis'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in analysis_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_client_management(self, cv_data):
-        client_terms = [
-            'client management', 'account management', 'client relations',
-            'stakeholder management', 'client retention', 'client satisfaction',
-            'service level', 'sla', 'client acquisition', 'relationship management',
-            'portfolio growth', 'cross-selling', 'retention', 'needs assessment',
-            'consultative'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in client_terms if term in text)
-        return min(100, matches * 15)  # Reduced multiplier since we have more terms now
-
-    def _evaluate_regulatory_compliance(self, cv_data):
-        compliance_terms = [
-            'compliance', 'regulatory', 'fannie mae',
-            'freddie mac', 'fha', 'va', 'audit',
-            'policy', 'procedures'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in compliance_terms if term in text)
-        return min(100, matches * 20)
-
-    def _evaluate_portfolio_management(self, cv_data):
-        portfolio_terms = [
-            'portfolio', 'underwriting', 'loan production',
-            'asset management', 'risk management', 'diversification',
-            'performance metrics'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in portfolio_terms if term in text)
-        return min(100, matches * 20)
-
-    def _evaluate_finance_tech_skills(self, cv_data):
-        tech_skills = [
-            'excel', 'financial modeling', 'vba',
-            'database', 'crm', 'loan origination',
-            'bloomberg', 'reuters'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-        
-        matches = sum(1 for skill in tech_skills if skill in text)
-        return (matches / len(tech_skills)) * 100 if tech_skills else 0
+    _evaluate_financial_analysis = KeywordScorer('narrative', 'financial_analysis', per_match=25)
+    _evaluate_client_management = KeywordScorer('narrative', 'client_management', per_match=15)  # Reduced multiplier since we have more terms now
+    _evaluate_regulatory_compliance = KeywordScorer('narrative', 'regulatory_compliance', per_match=20)
+    _evaluate_portfolio_management = KeywordScorer('narrative', 'portfolio_management', per_match=20)
+    _evaluate_finance_tech_skills = KeywordScorer('corpus', 'finance_tech_skills')
 
     # Add new evaluation methods for entry-level finance
-    def _evaluate_entry_level_analysis(self, cv_data):
-        analysis_terms = [
-            'financial analysis', 'data analysis', 'research',
-            'valuation', 'modeling', 'forecasting',
-            'market research', 'investment analysis'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in analysis_terms if term in text)
-        return min(100, matches * 25)
+    _evaluate_entry_level_analysis = KeywordScorer('narrative', 'entry_level_analysis', per_match=25)
 
-    def _evaluate_academic_achievement(self, cv_data):
+    def _evaluate_academic_achievement(self, doc):
         score = 0
-        education = cv_data.get('education', [])
         
-        for edu in education:
+        for edu in doc.education:
             if 'gpa' in edu.get('description', '').lower():
-                gpa_match = re.search(r'gpa\s*[:of]?\s*(\d\.\d+)', edu.get('description', ''), re.IGNORECASE)
+                gpa_match = self.gpa_pattern.search(edu.get('description', ''))
                 if gpa_match:
                     gpa = float(gpa_match.group(1))
                     if gpa >= 3.5: score += 50
                     elif gpa >= 3.0: score += 30
             
-            if 'scholarship' in edu.get('description', '').lower():
+            description = text_hits(edu.get('description', '').lower())
+            if description.any('academic:scholarship'):
                 score += 20
                 
-            if 'honor' in edu.get('description', '').lower():
+            if description.any('academic:honor'):
                 score += 10
                 
         return min(100, score)
 
-    def _evaluate_entry_tech_skills(self, cv_data):
-        tech_skills = [
-            'excel', 'powerpoint', 'word', 'vba',
-            'financial modeling', 'statistical analysis',
-            'database', 'prezi'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-        
-        matches = sum(1 for skill in tech_skills if skill in text)
-        return (matches / len(tech_skills)) * 100 if tech_skills else 0
-
-    def _evaluate_client_service(self, cv_data):
-        service_terms = [
-            'client service', 'customer service', 'assistance',
-            'support', 'consultation', 'recommendations',
-            'needs assessment'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in service_terms if term in text)
-        return min(100, matches * 20)
+    _evaluate_entry_tech_skills = KeywordScorer('corpus', 'entry_tech_skills')
+    _evaluate_client_service = KeywordScorer('narrative', 'client_service', per_match=20)
 
     # Add new evaluation methods for military/aviation industry
-    def _evaluate_aviation_technical_skills(self, cv_data):
-        skills = [
-            'flight planning', 'mission systems', 'avionics',
-            'emergency procedures', 'nvg operations', 'instrumentation',
-            'aircraft systems', 'maintenance', 'checklists'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-        
-        matches = sum(1 for skill in skills if skill in text)
-        return (matches / len(skills)) * 100 if skills else 0
-
-    def _evaluate_military_leadership(self, cv_data):
-        leadership_terms = [
-            'commander', 'supervisor', 'mentor',
-            'team lead', 'standardization', 'evaluation',
-            'performance review', 'resource management'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in leadership_terms if term in text)
-        return min(100, matches * 20)
+    _evaluate_aviation_technical_skills = KeywordScorer('corpus', 'aviation_technical_skills')
+    _evaluate_military_leadership = KeywordScorer('narrative', 'military_leadership', per_match=20)
+    _evaluate_training_development = KeywordScorer('narrative', 'training_development', per_match=20)
+    _evaluate_safety_compliance = KeywordScorer('narrative', 'safety_compliance', per_match=20)
 
-    def _evaluate_training_development(self, cv_data):
-        indicators = [
-            'training program', 'curriculum', 'lesson plan',
-            'instructor', 'teaching', 'coaching',
-            'professional development', 'mentoring'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in indicators if term in text)
-        return min(100, matches * 20)
-
-    def _evaluate_safety_compliance(self, cv_data):
-        safety_terms = [
-            'safety', 'compliance', 'regulations',
-            'checklists', 'procedures', 'standards',
-            'risk management', 'emergency'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in safety_terms if term in text)
-        return min(100, matches * 20)
-
-    def _evaluate_operational_experience(self, cv_data):
+    def _evaluate_operational_experience(self, doc):
         # Score based on years of operational experience
-        operational_titles = ['pilot', 'aircrew', 'maintainer', 'operator']
         total_years = 0
         
-        for exp in cv_data.get('experience', []):
-            if any(title in exp.get('title', '').lower() for title in operational_titles):
+        for exp, months in zip(doc.experience, doc.experience_months):
+            if text_hits(exp.get('title', '').lower()).any('title:operational'):
                 duration = exp.get('duration', '')
                 if duration:
-                    years = self._parse_duration(duration) / 12
+                    years = months / 12
                     total_years += years
                     
         return min(100, total_years * 20)  # 20 points per year up to 100
 
     # Add new evaluation methods for entry-level service industry
-    def _evaluate_customer_service(self, cv_data):
-        service_terms = [
-            'customer service', 'client relations', 'customer satisfaction',
-            'guest service', 'complaint resolution', 'customer needs',
-            'point of sale', 'cash handling'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in service_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_teamwork(self, cv_data):
-        teamwork_terms = [
-            'teamwork', 'collaboration', 'team player',
-            'shift coordination', 'staff training', 'mentoring',
-            'peer support', 'crew'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in teamwork_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_multitasking(self, cv_data):
-        multitask_terms = [
-            'multitasking', 'multiple tasks', 'simultaneous',
-            'while also', 'concurrently', 'during',
-            'at the same time', 'in addition to'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in multitask_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_service_safety(self, cv_data):
-        safety_terms = [
-            'safety', 'security', 'compliance',
-            'regulations', 'procedures', 'emergency',
-            'incident report', 'patrol'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in safety_terms if term in text)
-        return min(100, matches * 20)
+    _evaluate_customer_service = KeywordScorer('narrative', 'customer_service', per_match=25)
+    _evaluate_teamwork = KeywordScorer('narrative', 'teamwork', per_match=25)
+    _evaluate_multitasking = KeywordScorer('narrative', 'multitasking', per_match=25)
+    _evaluate_service_safety = KeywordScorer('narrative', 'service_safety', per_match=20)
 
     # Add new evaluation methods for IT architecture industry
-    def _evaluate_technical_skills(self, cv_data):
-        skills = [
-            'tibco mdm', 'data modeling', 'oracle', 'sql server',
-            'java', 'j2ee', 'xml', 'ems', 'business events',
-            'integration', 'data quality', 'patterns'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-        
-        matches = sum(1 for skill in skills if skill in text)
-        return (matches / len(skills)) * 100 if skills else 0
-
-    def _evaluate_project_management(self, cv_data):
-        indicators = [
-            'project management', 'delivery management', 'status reporting',
-            'resource planning', 'stakeholder management', 'timeline',
-            'milestones', 'go-live', 'implementation'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in indicators if term in text)
-        return min(100, matches * 20)
-
-    def _evaluate_team_leadership(self, cv_data):
-        leadership_terms = [
-            'team lead', 'mentor', 'coach', 'supervise',
-            'performance review', 'resource management',
-            'technical guidance', 'knowledge transfer'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in leadership_terms if term in text)
-        return min(100, matches * 20)
-
-    def _evaluate_solution_design(self, cv_data):
-        design_terms = [
-            'solution design', 'architecture', 'technical design',
-            'system architecture', 'workflows', 'rule bases',
-            'integration design', 'data flow'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in design_terms if term in text)
-        return min(100, matches * 20)
+    _evaluate_technical_skills = KeywordScorer('corpus', 'technical_skills')
+    _evaluate_project_management = KeywordScorer('narrative', 'project_management', per_match=20)
+    _evaluate_team_leadership = KeywordScorer('narrative', 'team_leadership', per_match=20)
+    _evaluate_solution_design = KeywordScorer('narrative', 'solution_design', per_match=20)
 
     # Add new evaluation methods for education administration industry
-    def _evaluate_leadership(self, cv_data):
-        leadership_terms = [
-            'principal', 'deputy principal', 'director',
-            'school leadership', 'campus management',
-            'strategic planning', 'decision making'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in leadership_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_policy_implementation(self, cv_data):
-        policy_terms = [
-            'policy development', 'compliance', 'state laws',
-            'federal requirements', 'education code',
-            'board policy', 'regulations'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in policy_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_budget_management(self, cv_data):
-        budget_terms = [
-            'budget management', 'fiscal oversight',
-            'expenditure monitoring', 'fund allocation',
-            'financial planning', 'resource allocation'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in budget_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_staff_development(self, cv_data):
-        development_terms = [
-            'staff development', 'professional growth',
-            'teacher training', 'performance evaluation',
-            'mentoring', 'coaching'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in development_terms if term in text)
-        return min(100, matches * 20)
+    _evaluate_leadership = KeywordScorer('narrative', 'leadership', per_match=25)
+    _evaluate_policy_implementation = KeywordScorer('narrative', 'policy_implementation', per_match=25)
+    _evaluate_budget_management = KeywordScorer('narrative', 'budget_management', per_match=25)
+    _evaluate_staff_development = KeywordScorer('narrative', 'staff_development', per_match=20)
 
     # Add new evaluation methods for hospitality/food service industry
-    def _evaluate_food_safety(self, cv_data):
-        keywords = [
-            'food safety', 'sanitation', 'health codes',
-            'hygiene', 'cleanliness', 'food handling'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for kw in keywords if kw in text)
-        return min(100, matches * 25)  # Each match adds 25 points up to 100
-
-    def _evaluate_pos_systems(self, cv_data):
-        pos_terms = [
-            'pos system', 'point of sale', 'cash register',
-            'order processing', 'payment processing'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-        
-        matches = sum(1 for term in pos_terms if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_upselling(self, cv_data):
-        indicators = [
-            'upsell', 'up-sell', 'increase sales',
-            'additional items', 'promote specials',
-            'suggestive selling'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in indicators if term in text)
-        return min(100, matches * 25)
+    _evaluate_food_safety = KeywordScorer('narrative', 'food_safety', per_match=25)  # Each match adds 25 points up to 100
+    _evaluate_pos_systems = KeywordScorer('corpus', 'pos_systems', per_match=25)
+    _evaluate_upselling = KeywordScorer('narrative', 'upselling', per_match=25)
 
     # Add new evaluation methods for arts education industry
-    def _evaluate_curriculum_development(self, cv_data):
-        indicators = [
-            'curriculum design', 'lesson planning',
-            'educational standards', 'rubric',
-            'assessment', 'learning objectives'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in indicators if term in text)
-        return min(100, matches * 25)
+    _evaluate_curriculum_development = KeywordScorer('narrative', 'curriculum_development', per_match=25)
 
-    def _evaluate_teaching_experience(self, cv_data):
+    def _evaluate_teaching_experience(self, doc):
         # Score based on years of teaching experience
         total_years = 0
         
-        for exp in cv_data.get('experience', []):
-            if 'instructor' in exp.get('title', '').lower() or 'teacher' in exp.get('title', '').lower():
+        for exp, months in zip(doc.experience, doc.experience_months):
+            if text_hits(exp.get('title', '').lower()).any('title:teaching'):
                 duration = exp.get('duration', '')
                 if duration:
-                    years = self._parse_duration(duration) / 12
+                    years = months / 12
                     total_years += years
                     
         return min(100, total_years * 10)
 
-    def _evaluate_artistic_skills(self, cv_data):
-        skills = [
-            'photography', 'ceramics', 'painting',
-            'drawing', 'sculpture', 'printmaking',
-            'graphic design', 'digital art', 'mixed media'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-        
-        matches = sum(1 for skill in skills if skill in text)
-        return (matches / len(skills)) * 100 if skills else 0
-
-    def _evaluate_technology_integration(self, cv_data):
-        tech_terms = [
-            'technology integration', 'computer lab',
-            'digital tools', 'software', 'multimedia',
-            'interactive', 'online resources'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in tech_terms if term in text)
-        return min(100, matches * 25)
+    _evaluate_artistic_skills = KeywordScorer('corpus', 'artistic_skills')
+    _evaluate_technology_integration = KeywordScorer('narrative', 'technology_integration', per_match=25)
 
     # Add new evaluation methods for retail/fashion industry
-    def _evaluate_sales_performance(self, cv_data):
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
+    def _evaluate_sales_performance(self, doc):
+        text = doc.narrative
         
         # Look for sales performance indicators
         indicators = [
@@ -1776,195 +1340,54 @@ class CVEvaluator:
         matches = sum(1 for pattern in indicators if re.search(pattern, text))
         return min(100, matches * 25)  # Each match adds 25 points up to 100
 
-    def _evaluate_business_development(self, cv_data):
-        dev_terms = [
-            'business growth', 'expand', 'develop', 'new market',
-            'vendor relations', 'brand awareness', 'community relations',
-            'strategic plan', 'maximize opportunities'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in dev_terms if term in text)
-        return min(100, matches * 20)
+    _evaluate_business_development = KeywordScorer('narrative', 'business_development', per_match=20)
 
     # Add new evaluation methods for beauty/cosmetics industry
-    def _evaluate_artistry_skills(self, cv_data):
-        skills = [
-            'makeup application', 'hair styling', 'airbrushing',
-            'special effects', 'prosthetics', 'digital design',
-            'face chart', 'photo shoot', 'fashion show'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])]),
-            ' '.join(cv_data.get('skills', []))
-        ]).lower()
-        
-        matches = sum(1 for skill in skills if skill in text)
-        return (matches / len(skills)) * 100 if skills else 0
-
-    def _evaluate_product_knowledge(self, cv_data):
-        indicators = [
-            'product knowledge', 'ingredients', 'brand training',
-            'schooling sessions', 'artistry training', 'certification'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for term in indicators if term in text)
-        return min(100, matches * 25)
-
-    def _evaluate_field_experience(self, cv_data):
-        keywords = [
-            'field work', 'inventory', 'assessment', 'monitoring',
-            'inspection', 'compliance check', 'range unit', 'allotment',
-            'AUMs', 'animal unit months', 'grazing', 'conservation',
-            'watershed', 'ecological', 'rehabilitation'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for kw in keywords if kw in text)
-        return min(100, (matches / len(keywords)) * 100) if keywords else 0
-
-    def _evaluate_regulatory_knowledge(self, cv_data):
-        keywords = [
-            'regulation', 'compliance', 'policy', 'code of federal',
-            'CFR', 'legal', 'permit', 'authorization', 'resolution',
-            'mitigation', 'environmental assessment', 'EA', 'NEPA'
-        ]
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for kw in keywords if kw in text)
-        return min(100, (matches / len(keywords)) * 100) if keywords else 0
-
-    def _evaluate_natural_resources_skills(self, skills):
-        relevant_skills = [
-            'ArcGIS', 'TAAMs', 'GPS', 'Trimble', 'Garmin',
-            'range management', 'soil conservation', 'watershed',
-            'ecological', 'inventory', 'monitoring', 'compliance',
-            'regulatory', 'environmental', 'conservation'
-        ]
-        
-        matches = sum(1 for skill in skills if any(rs in skill.lower() for rs in relevant_skills))
-        return (matches / len(relevant_skills)) * 100 if relevant_skills else 0
-
-    def _evaluate_case_management(self, cv_data):
-        keywords = ['case management', 'service plan', 'treatment plan', 'assessment']
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for kw in keywords if kw in text)
-        return (matches / len(keywords)) * 100
-
-    def _evaluate_crisis_intervention(self, cv_data):
-        keywords = ['crisis', 'emergency', 'intervention', 'trauma', 'safety plan']
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for kw in keywords if kw in text)
-        return (matches / len(keywords)) * 100
-
-    def _evaluate_client_relations(self, cv_data):
-        keywords = ['client', 'patient', 'relationship', 'rapport', 'trust']
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for kw in keywords if kw in text)
-        return (matches / len(keywords)) * 100
-
-    def _evaluate_tech_skills(self, skills):
-        tech_skills = ['software', 'system', 'database', 'microsoft', 'spreadsheet']
-        
-        matches = sum(1 for skill in skills if any(ts in skill.lower() for ts in tech_skills))
-        return (matches / len(tech_skills)) * 100 if tech_skills else 0
-
-    def _evaluate_finance_skills(self, skills):
-        finance_skills = [
-            'underwriting', 'risk management', 'compliance', 'loan processing',
-            'GAAP', 'financial reporting', 'accounts payable', 'accounts receivable'
-        ]
-        
-        matches = sum(1 for skill in skills if any(fs in skill.lower() for fs in finance_skills))
-        return (matches / len(finance_skills)) * 100 if finance_skills else 0
-
-    def _evaluate_compliance(self, cv_data):
-        compliance_keywords = ['compliance', 'regulation', 'audit', 'policy', 'standard']
-        
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
-        
-        matches = sum(1 for kw in compliance_keywords if kw in text)
-        return (matches / len(compliance_keywords)) * 100
-
-    def _evaluate_creativity(self, cv_data):
-        creative_achievements = sum(1 for ach in cv_data.get('accomplishments', [])
-                                  if any(word in ach.lower() for word in ['created', 'developed', 'produced']))
-        return min(100, creative_achievements * 20)
-
-    def _evaluate_operations(self, experiences):
-        ops_experience = sum(1 for exp in experiences
-                            if any(word in exp.get('description', '').lower()
-                                  for word in ['operations', 'managed', 'team']))
-        return min(100, ops_experience * 15)
-
-    def _evaluate_completeness(self, cv_data):
-        required = set(self.criteria['required_sections'])
+    _evaluate_artistry_skills = KeywordScorer('corpus', 'artistry_skills')
+    _evaluate_product_knowledge = KeywordScorer('narrative', 'product_knowledge', per_match=25)
+    _evaluate_field_experience = KeywordScorer('narrative', 'field_experience', capped=True)
+    _evaluate_regulatory_knowledge = KeywordScorer('narrative', 'regulatory_knowledge', capped=True)
+    _evaluate_natural_resources_skills = KeywordScorer('skills', 'natural_resources_skills')
+    _evaluate_case_management = KeywordScorer('narrative', 'case_management')
+    _evaluate_crisis_intervention = KeywordScorer('narrative', 'crisis_intervention')
+    _evaluate_client_relations = KeywordScorer('narrative', 'client_relations')
+    _evaluate_tech_skills = KeywordScorer('skills', 'tech_skills')
+    _evaluate_finance_skills = KeywordScorer('skills', 'finance_skills')
+    _evaluate_compliance = KeywordScorer('narrative', 'compliance')
+    _evaluate_creativity = KeywordScorer('accomplishments', 'creativity', per_match=20)
+    _evaluate_operations = KeywordScorer('experience', 'operations', per_match=15)
+
+    def _evaluate_completeness(self, doc):
+        required = self.compiled.required_section_set
+        cv_data = doc.data
         present = set(k for k in required if cv_data.get(k) and
                      (not isinstance(cv_data[k], (list, str)) or len(cv_data[k]) > 0))
         return (len(present) / len(required)) * 100 if required else 100
 
-    def _evaluate_experience(self, experiences):
+    def _evaluate_experience(self, doc):
+        experiences = doc.experience
         if not experiences:
             return 0
             
         total = 0
-        for exp in experiences:
+        industry_vocabulary = 'industry:' + self.plan.industry
+        for duration, desc, hits in zip(doc.experience_months, doc.experience_descriptions, doc.experience_hits):
             score = 50  # Base score
             
-            duration = self._parse_duration(exp.get('duration', ''))
             if duration > 36: score += 25
             elif duration > 24: score += 15
             elif duration > 12: score += 10
             
-            desc = exp.get('description', '').lower()
-            positive_words = sum(1 for w in self.positive_keywords if w in desc)
+            positive_words = hits.count('positive')
             score += min(25, positive_words * 3)
             
-            if self.industry in self.industry_positive_keywords:
-                industry_words = sum(1 for w in self.industry_positive_keywords[self.industry] if w in desc)
-                score += min(15, industry_words * 3)
+            industry_words = hits.count(industry_vocabulary)
+            score += min(15, industry_words * 3)
                 
-            negative_words = sum(1 for w in self.negative_keywords if w in desc)
+            negative_words = hits.count('negative')
             score -= negative_words * 5
             
-            if re.search(r'\$\d+[MBK]?|\d+\s*(%|percent)|reduced by \d+', desc, re.IGNORECASE):
+            if self.quantifiable_pattern.search(desc):
                 score += 10
                 
             total += max(0, min(100, score))
@@ -1979,18 +1402,18 @@ class CVEvaluator:
         for edu in education:
             score = 40  # Base score
             
-            degree = edu.get('degree', '').lower()
-            if 'phd' in degree: score += 30
-            elif 'master' in degree: score += 20
-            elif 'bachelor' in degree: score += 15
-            elif 'associate' in degree: score += 10
+            degree = text_hits(edu.get('degree', '').lower())
+            if degree.any('degree-name:phd'): score += 30
+            elif degree.any('degree-name:master'): score += 20
+            elif degree.any('degree-name:bachelor'): score += 15
+            elif degree.any('degree-name:associate'): score += 10
             
             institution = edu.get('institution', '').lower()
             if 'university' in institution: score += 10
             elif 'college' in institution: score += 5
             
             if 'gpa' in edu.get('description', '').lower():
-                gpa_match = re.search(r'gpa\s*[:of]?\s*(\d\.\d+)', edu.get('description', ''), re.IGNORECASE)
+                gpa_match = self.gpa_pattern.search(edu.get('description', ''))
                 if gpa_match:
                     gpa = float(gpa_match.group(1))
                     if gpa >= 3.5: score += 10
@@ -2000,62 +1423,28 @@ class CVEvaluator:
             
         return (total / len(education)) if education else 0
 
-    def _evaluate_skills(self, skills):
+    def _evaluate_skills(self, doc):
+        skills = doc.skills_lower
         if not skills:
             return 0
             
         total = 0
-        required_skills = self.criteria.get('required_skills', [])
+        required_skills = self.compiled.required_skills
         
-        for skill in skills:
+        skill_vocabulary = 'skills:' + self.plan.industry
+        for skill, skill_hits in zip(skills, doc.skill_hits):
             score = 5  # Base score
             
             if len(skill.split()) > 1:
                 score += 3
                 
-            if required_skills and any(req.lower() in skill.lower() for req in required_skills):
+            if required_skills and any(req in skill for req in required_skills):
                 score += 2
                 
-            industry_keywords = []
-            if self.industry == 'finance':
-                industry_keywords = ['risk', 'compliance', 'gaap', 'accounting', 'portfolio', 'audit']
-            elif self.industry == 'media':
-                industry_keywords = ['content', 'social media', 'branding', 'campaign', 'public relations']
-            elif self.industry == 'hospitality':
-                industry_keywords = ['guest', 'service', 'hospitality', 'reservation', 'front desk']
-            elif self.industry == 'social_services':
-                industry_keywords = ['case management', 'crisis', 'advocacy', 'social work']
-            elif self.industry == 'customer_service':
-                industry_keywords = ['customer service', 'troubleshooting', 'support', 'help desk']
-            elif self.industry == 'natural_resources':
-                industry_keywords = ['arcgis', 'taams', 'conservation', 'wildlife', 'environmental']
-            elif self.industry == 'retail_fashion':
-                industry_keywords = ['sales', 'merchandising', 'retail', 'clienteling']
-            elif self.industry == 'beauty_cosmetics':
-                industry_keywords = ['makeup', 'cosmetics', 'artistry', 'skincare']
-            elif self.industry == 'hospitality_food':
-                industry_keywords = ['food safety', 'pos system', 'upselling', 'sanitation']
-            elif self.industry == 'arts_education':
-                industry_keywords = ['curriculum', 'teaching', 'visual arts', 'art education']
-            elif self.industry == 'it_architecture':
-                industry_keywords = ['architecture', 'data modeling', 'solution design', 'integration']
-            elif self.industry == 'education_administration':
-                industry_keywords = ['leadership', 'policy', 'budget', 'staff development']
-            elif self.industry == 'military_aviation':
-                industry_keywords = ['aviation', 'flight', 'safety compliance', 'training']
-            elif self.industry == 'entry_level_service':
-                industry_keywords = ['customer service', 'multitasking', 'safety', 'teamwork']
-            elif self.industry == 'financial_services':
-                industry_keywords = ['financial analysis', 'compliance', 'portfolio management', 'client relations']
-            elif self.industry == 'entry_level_finance':
-                industry_keywords = ['financial modeling', 'analysis', 'valuation', 'excel']
-            elif self.industry == 'bpo_operations':
-                industry_keywords = ['operations management', 'kpi', 'performance metrics', 'client management']
-                
-            if any(kw in skill.lower() for kw in industry_keywords):
+            if skill_hits.any(skill_vocabulary):
                 score += 3
                 
-            if any(software in skill.lower() for software in ['quickbooks', 'excel', 'database', 'crm', 'erp']):
+            if skill_hits.any('software'):
                 score += 2
                 
             total += min(10, score)
@@ -2063,66 +1452,56 @@ class CVEvaluator:
         max_possible = len(skills) * 10
         return (total / max_possible) * 100 if max_possible > 0 else 0
 
-    def _evaluate_achievements(self, achievements):
+    def _evaluate_achievements(self, doc):
+        achievements = doc.accomplishments
         if not achievements:
             return 0
             
         total = 0
-        for ach in achievements:
+        for ach, hits in zip(achievements, doc.accomplishment_hits):
             score = 30  # Base score
             
             if self.quantifiable_pattern.search(ach):
                 score += 30
                 
-            # Convert to lowercase once
-            ach_lower = ach.lower()
-            action_words = sum(1 for w in self.positive_keywords if w in ach_lower)
+            action_words = hits.count('positive')
             score += min(40, action_words * 10)
             
             total += min(100, score)
             
         return (total / len(achievements)) if achievements else 0
 
-    def _evaluate_keywords(self, cv_data):
-        if not self.criteria['keywords']:
+    def _evaluate_keywords(self, doc):
+        keywords = self.compiled.keywords
+        if not keywords:
             return 50
             
-        text = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join(cv_data.get('skills', [])),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ]).lower()
+        text = doc.keyword_text
         
-        matched_keywords = sum(1 for kw in self.criteria['keywords'] if kw.lower() in text)
-        match_percentage = (matched_keywords / len(self.criteria['keywords'])) * 100
+        matched_keywords = sum(1 for kw in keywords if kw in text)
+        match_percentage = (matched_keywords / len(keywords)) * 100
         
         return min(100, match_percentage * 1.5)
 
-    def _evaluate_structure(self, cv_data):
+    def _evaluate_structure(self, doc):
         score = 50
         
-        sections = [s.lower() for s in cv_data.keys()]
+        sections = doc.section_names
         if 'experience' in sections and 'education' in sections:
             if sections.index('experience') < sections.index('education'):
                 score += 20
                 
-        content = ' '.join([
-            cv_data.get('summary', ''),
-            ' '.join([exp.get('description', '') for exp in cv_data.get('experience', [])])
-        ])
+        content = doc.narrative_raw
         
         bullet_points = content.count('•') + content.count('- ')
         if bullet_points >= 3: score += 15
         
-        words = len(content.split())
+        words = len(doc.narrative_tokens)
         if 300 <= words <= 800: score += 15
         elif words > 1200: score -= 10
         
         return max(0, min(100, score))
 
-    def _calculate_total_experience(self, experiences):
-        total_months = sum(self._parse_duration(exp.get('duration', '')) for exp in experiences)
-        return round(total_months / 12, 1)
 
     def _generate_feedback(self, scores, cv_data):
         feedback = []
@@ -2179,7 +1558,7 @@ class CVEvaluator:
         if scores['skills_relevance'] < 60:
             skills_feedback.extend([
                 "Skills Mismatch: Your listed skills don't sufficiently align with typical requirements for this industry. ",
-                f"For {self.industry} roles, prioritize: " + ', '.join(self.industry_positive_keywords.get(self.industry, [])) + ". ",
+                f"For {self.industry} roles, prioritize: " + ', '.join(self.plan.positive_keywords) + ". ",
                 "Remove outdated or irrelevant skills, and group remaining ones into logical categories (Technical, Professional, etc.)."
             ])
         elif scores['skills_relevance'] >= 80:
@@ -2219,565 +1598,12 @@ class CVEvaluator:
             )
             
         # Industry-specific feedback
-        if self.industry == 'finance':
-            if scores.get('technical_skills_score', 0) < 60:
-                feedback.append(
-                    "Your technical skills in finance could be strengthened. Highlight expertise in risk management, compliance frameworks, "
-                    "and financial analysis tools like Bloomberg or QuickBooks. Mention certifications or hands-on system experience. "
-                    "Employers in finance expect robust technical proficiency to manage complex financial operations."
-                )
-        elif self.industry == 'social_services':
-            if scores.get('case_management_score', 0) < 60:
-                feedback.append(
-                    "Case management experience could be more clearly emphasized. Share examples of client assessments, treatment planning, "
-                    "and service coordination. Describe any measurable outcomes or program success you contributed to. "
-                    "Social services employers value hands-on experience with diverse populations."
-                )
-                
-            if scores.get('crisis_intervention_score', 0) < 50:
-                feedback.append(
-                    "Your crisis intervention skills could be showcased better. Mention situations where you de-escalated crises, "
-                    "provided emergency support, or worked with high-risk individuals. Certifications in mental health first aid or crisis management "
-                    "would add credibility to your profile."
-                )
-        elif self.industry == 'customer_service':
-            if scores.get('customer_service_score', 0) < 65:
-                feedback.append(
-                    "Customer service achievements could be highlighted more strongly. Share metrics like customer satisfaction ratings, "
-                    "awards, or success stories. Recruiters look for evidence of excellent interpersonal skills and service consistency. "
-                    "Consider adding short customer testimonials if appropriate."
-                )
-                
-            if scores.get('problem_solving_score', 0) < 50:
-                feedback.append(
-                    "Problem-solving examples could be improved. Describe real scenarios where you resolved customer complaints, "
-                    "improved service processes, or developed creative solutions under pressure. Concrete examples can greatly boost your appeal."
-                )
-        elif self.industry == 'natural_resources':
-            if scores.get('field_experience_score', 0) < 60:
-                feedback.append(
-                    "More emphasis on field experience would strengthen your CV. Highlight work on environmental surveys, inspections, "
-                    "conservation projects, or land management tasks. Mention certifications and technical fieldwork skills to stand out."
-                )
-                
-            if scores.get('regulatory_knowledge_score', 0) < 50:
-                feedback.append(
-                    "Regulatory knowledge should be more prominent. Share your understanding of environmental laws like NEPA, "
-                    "CFR regulations, or other compliance procedures you've followed. This showcases your preparedness for regulatory roles."
-                )
-                
-            if scores.get('technical_skills_score', 0) < 50:
-                feedback.append(
-                    "Technical skills such as GIS, GPS data collection, and environmental software should be highlighted. "
-                    "Discuss hands-on tools used in past projects. Specific technical proficiencies make a big difference in natural resources careers."
-                )
-        elif self.industry == 'retail_fashion':
-            if scores.get('sales_performance_score', 0) < 60:
-                feedback.append(
-                    "Your sales achievements could be better emphasized. Mention specific sales targets achieved, upselling success, "
-                    "or customer loyalty improvements. Numbers and results build credibility and attract retail hiring managers."
-                )
-                
-            if scores.get('team_leadership_score', 0) < 50:
-                feedback.append(
-                    "Leadership examples in retail settings are important. Share stories where you motivated teams, improved sales performance, "
-                    "or mentored junior associates. Team leadership in fast-paced environments is highly sought after."
-                )
-                
-            if scores.get('business_development_score', 0) < 50:
-                feedback.append(
-                    "Business development initiatives should be more visible. Highlight strategies you contributed to for store growth, "
-                    "new customer acquisition, or brand partnerships that enhanced performance."
-                )
-        elif self.industry == 'beauty_cosmetics':
-            if scores.get('artistry_skills_score', 0) < 60:
-                feedback.append(
-                    "Artistry skills could be elaborated with more examples. Talk about specific makeup styles you specialize in, "
-                    "client transformations, editorial shoots, or competitions participated in. Demonstrating creativity helps you stand out."
-                )
-                
-            if scores.get('product_knowledge_score', 0) < 50:
-                feedback.append(
-                    "Product knowledge is critical. List familiarity with major brands, participation in product launches, "
-                    "or experience conducting client education. Depth of product expertise can significantly impress employers."
-                )
-                
-            if scores.get('creativity_score', 0) < 50:
-                feedback.append(
-                    "Your creativity could be more visible. Share original makeup looks, creative campaigns, or innovative client transformations. "
-                    "Visual portfolios, even small ones, can showcase your artistic impact."
-                )
-        elif self.industry == 'hospitality_food':
-            if scores.get('food_safety_score', 0) < 60:
-                feedback.append(
-                    "Food safety experience should be more prominent. Mention certifications like ServSafe, "
-                    "successful inspections, or personal commitment to sanitation protocols. Health compliance is essential in food roles."
-                )
-                
-            if scores.get('pos_systems_score', 0) < 50:
-                feedback.append(
-                    "POS system experience could be better highlighted. Familiarity with platforms like Square, Toast, or Aloha "
-                    "can be a deciding factor in hospitality hiring. Be specific about the systems you've operated."
-                )
-                
-            if scores.get('upselling_score', 0) < 50:
-                feedback.append(
-                    "Your upselling success could be better demonstrated. Discuss how you increased average order value, "
-                    "met promotional targets, or contributed to revenue boosts through effective sales strategies."
-                )
-                
-            if scores.get('teamwork_score', 0) < 50:
-                feedback.append(
-                    "Teamwork examples in fast-paced hospitality settings should be stronger. Mention collaboration across shifts, "
-                    "event coordination, or leadership in high-demand scenarios. Teamwork stories show adaptability."
-                )
-        elif self.industry == 'arts_education':
-            if scores.get('curriculum_development_score', 0) < 60:
-                feedback.append(
-                    "Curriculum development experience should be more prominent. Mention any programs you designed, interdisciplinary courses created, "
-                    "or improvements you led. Demonstrate how your contributions impacted student learning outcomes positively."
-                )
-                
-            if scores.get('teaching_experience_score', 0) < 50:
-                feedback.append(
-                    "Teaching experience could be more detailed. Highlight years taught, age groups, artistic disciplines, and instructional methods. "
-                    "Quantify your impact wherever possible (e.g., student competition wins, increased engagement scores)."
-                )
-                
-            if scores.get('artistic_skills_score', 0) < 50:
-                feedback.append(
-                    "Your diverse artistic skills should be better showcased. Mention mediums you specialize in, exhibitions participated in, "
-                    "or community arts initiatives. Diversity in arts education strengthens your teaching portfolio."
-                )
-                
-            if scores.get('technology_integration_score', 0) < 50:
-                feedback.append(
-                    "Technology integration should be emphasized. Describe how you incorporated digital tools, "
-                    "virtual galleries, online art classes, or edtech platforms into your curriculum delivery."
-                )
-        elif self.industry == 'it_architecture':
-            if scores.get('technical_skills_score', 0) < 60:
-                feedback.append(
-                    "Technical skills in IT Architecture could be strengthened. Highlight expertise with cloud platforms, system integrations, "
-                    "solution architecture frameworks, and key technologies like AWS, Azure, or Kubernetes. Technical certifications also help."
-                )
-                
-            if scores.get('project_management_score', 0) < 50:
-                feedback.append(
-                    "Project management in IT delivery should be clearer. Mention timelines handled, cross-team coordination, "
-                    "and success in deploying complex systems. Use metrics if possible (e.g., 'delivered project 15% under budget')."
-                )
-                
-            if scores.get('team_leadership_score', 0) < 50:
-                feedback.append(
-                    "Team leadership examples should be highlighted. Discuss how you mentored junior architects, led design teams, "
-                    "or drove cross-functional collaboration across technical and business units."
-                )
-                
-            if scores.get('solution_design_score', 0) < 50:
-                feedback.append(
-                    "Solution design examples could be stronger. Explain how you conceptualized architectures that solved business problems, "
-                    "improved scalability, or optimized performance."
-                )
-        elif self.industry == 'education_administration':
-            if scores.get('leadership_score', 0) < 60:
-                feedback.append(
-                    "Leadership achievements could be stronger. Mention strategic initiatives you led, programs launched, "
-                    "or reforms introduced. Leadership in education often involves cross-functional influence and stakeholder engagement."
-                )
-                
-            if scores.get('policy_implementation_score', 0) < 50:
-                feedback.append(
-                    "Policy implementation work should be clearer. Describe developing school or district policies, "
-                    "compliance improvements, or how you ensured regulatory adherence and measurable results."
-                )
-                
-            if scores.get('budget_management_score', 0) < 50:
-                feedback.append(
-                    "Budget management experience needs more emphasis. Share successes in allocating resources, balancing budgets, "
-                    "or leading financial planning initiatives that improved efficiency."
-                )
-                
-            if scores.get('staff_development_score', 0) < 50:
-                feedback.append(
-                    "Staff development should be highlighted. Talk about workshops you created, mentorship programs initiated, "
-                    "or teacher development strategies that boosted performance and morale."
-                )
-        elif self.industry == 'military_aviation':
-            if scores.get('technical_skills_score', 0) < 60:
-                feedback.append(
-                    "Technical aviation skills should be emphasized more. Share your knowledge of aviation systems, avionics, flight operations, "
-                    "and maintenance procedures. Certification details (e.g., FAA ratings) should be clearly mentioned."
-                )
-                
-            if scores.get('leadership_score', 0) < 50:
-                feedback.append(
-                    "Leadership within aviation environments should be highlighted. Discuss squadron management, unit readiness leadership, "
-                    "or experience supervising flight or maintenance crews under operational pressure."
-                )
-                
-            if scores.get('training_development_score', 0) < 50:
-                feedback.append(
-                    "Training and development experience should be more detailed. Describe programs you built for technical training, "
-                    "safety compliance, or leadership development within military or aviation contexts."
-                )
-                
-            if scores.get('safety_compliance_score', 0) < 50:
-                feedback.append(
-                    "Safety compliance efforts need more visibility. Share achievements maintaining operational safety standards, "
-                    "audit results, or corrective actions led during inspections."
-                )
-        elif self.industry == 'entry_level_service':
-            if scores.get('customer_service_score', 0) < 60:
-                feedback.append(
-                    "Customer service skills should be highlighted with real examples. Mention high-volume handling, satisfaction scores, "
-                    "or customer commendations. Basic service achievements set entry-level candidates apart quickly."
-                )
-                
-            if scores.get('teamwork_score', 0) < 50:
-                feedback.append(
-                    "Teamwork experiences should be clearer. Describe situations where you worked collaboratively, "
-                    "helped cover shifts, or supported team goals during high-pressure periods."
-                )
-                
-            if scores.get('multitasking_score', 0) < 50:
-                feedback.append(
-                    "Multitasking skills should be showcased. Discuss handling multiple tasks simultaneously, "
-                    "juggling customer interactions, administrative work, and operational duties."
-                )
-                
-            if scores.get('technical_skills_score', 0) < 50:
-                feedback.append(
-                    "Basic technical skills should be strengthened. Mention POS systems, Microsoft Office tools, or ticketing systems you operated. "
-                    "Technical comfort boosts employability even for service roles."
-                )
-        elif self.industry == 'financial_services':
-            if scores.get('financial_analysis_score', 0) < 60:
-                feedback.append(
-                    "Financial analysis skills could be stronger. Highlight experience with forecasting, budgeting, risk assessment, "
-                    "or investment strategy development. Quantifiable financial results create a strong impression."
-                )
-                
-            if scores.get('client_management_score', 0) < 50:
-                feedback.append(
-                    "Client relationship management should be emphasized. Discuss relationship building, retention improvements, "
-                    "and how you handled client portfolios or account renewals successfully."
-                )
-                
-            if scores.get('regulatory_compliance_score', 0) < 50:
-                feedback.append(
-                    "Regulatory compliance experience should be clearer. Mention your understanding of SEC, SOX, AML, or Dodd-Frank regulations, "
-                    "and share real examples of compliance project involvement."
-                )
-                
-            if scores.get('portfolio_management_score', 0) < 50:
-                feedback.append(
-                    "Portfolio management contributions should be better detailed. Describe asset allocation strategies, risk diversification, "
-                    "or portfolio growth metrics you achieved."
-                )
-        elif self.industry == 'entry_level_finance':
-            if scores.get('financial_analysis_score', 0) < 60:
-                feedback.append(
-                    "Financial analysis exposure could be improved. Mention internships, university projects, or simulations "
-                    "where you performed forecasting, valuation, or data modeling using Excel or similar tools."
-                )
-                
-            if scores.get('academic_achievement_score', 0) < 50:
-                feedback.append(
-                    "Academic achievements need better emphasis. Highlight GPA (if strong), scholarships, dean's list honors, "
-                    "or finance-related coursework to build credibility for entry-level finance roles."
-                )
-                
-            if scores.get('technical_skills_score', 0) < 50:
-                feedback.append(
-                    "Technical finance skills such as Excel modeling, Python for finance, or Bloomberg Terminal usage "
-                    "should be showcased to demonstrate analytical readiness."
-                )
-                
-            if scores.get('client_service_score', 0) < 50:
-                feedback.append(
-                    "Client service exposure could be improved. Mention internship experiences, university consulting projects, "
-                    "or volunteer work that developed your client-facing skills."
-                )
-        elif self.industry == 'bpo_operations':
-            if scores.get('operations_management_score', 0) < 60:
-                feedback.append(
-                    "Operations management should be emphasized more. Highlight handling KPIs, optimizing workflows, "
-                    "or achieving service-level agreements (SLAs) consistently in BPO environments."
-                )
-                
-            if scores.get('team_leadership_score', 0) < 50:
-                feedback.append(
-                    "Leadership examples managing BPO teams should be shared. Discuss scheduling, performance monitoring, "
-                    "coaching underperformers, or driving team metrics."
-                )
-                
-            if scores.get('performance_metrics_score', 0) < 50:
-                feedback.append(
-                    "Performance metrics achievements could be clearer. Talk about call quality improvements, "
-                    "productivity gains, or first-call resolution rate increases you contributed to."
-                )
-                
-            if scores.get('client_management_score', 0) < 50:
-                feedback.append(
-                    "Client management stories should be highlighted. Mention direct client communications, meeting client KPIs, "
-                    "or upselling additional services within BPO operations."
-                )
-                
-        # Strengths
-        strengths = []
-        
-        # General strengths
-        if scores.get('experience_quality', 0) >= 80:
-            strengths.append("strong and impactful work experience")
-            
-        if scores.get('education_quality', 0) >= 80:
-            strengths.append("solid educational background with good credentials")
-            
-        if scores.get('skills_relevance', 0) >= 80:
-            strengths.append("highly relevant skill set for the industry")
-            
-        if scores.get('achievements_quality', 0) >= 75:
-            strengths.append("impressive list of measurable achievements")
-            
-        if scores.get('structure_quality', 0) >= 80:
-            strengths.append("well-organized and professional CV structure")
-            
-        # Industry-specific strengths
-        if self.industry == 'finance':
-            if scores.get('technical_skills_score', 0) >= 70:
-                strengths.append("strong technical finance capabilities")
-                
-            if scores.get('compliance_score', 0) >= 70:
-                strengths.append("good compliance and risk management knowledge")
-                
-        elif self.industry == 'social_services':
-            if scores.get('case_management_score', 0) >= 70:
-                strengths.append("strong case management experience")
-                
-            if scores.get('crisis_intervention_score', 0) >= 70:
-                strengths.append("effective crisis intervention skills")
-                
-        elif self.industry == 'customer_service':
-            if scores.get('customer_service_score', 0) >= 70:
-                strengths.append("excellent customer service skills")
-                
-            if scores.get('problem_solving_score', 0) >= 65:
-                strengths.append("strong problem-solving abilities")
-                
-        elif self.industry == 'natural_resources':
-            if scores.get('field_experience_score', 0) >= 70:
-                strengths.append("extensive field experience in natural resource projects")
-                
-            if scores.get('regulatory_knowledge_score', 0) >= 65:
-                strengths.append("good knowledge of environmental regulations and compliance")
-                
-            if scores.get('technical_skills_score', 0) >= 65:
-                strengths.append("strong technical skills in GIS and field technologies")
-                
-        elif self.industry == 'retail_fashion':
-            if scores.get('sales_performance_score', 0) >= 70:
-                strengths.append("excellent retail sales performance")
-                
-            if scores.get('team_leadership_score', 0) >= 65:
-                strengths.append("good team leadership in retail environments")
-                
-        elif self.industry == 'beauty_cosmetics':
-            if scores.get('artistry_skills_score', 0) >= 70:
-                strengths.append("strong makeup artistry skills")
-                
-            if scores.get('product_knowledge_score', 0) >= 65:
-                strengths.append("deep beauty product knowledge")
-                
-        elif self.industry == 'hospitality_food':
-            if scores.get('customer_service_score', 0) >= 70:
-                strengths.append("excellent customer service in hospitality")
-                
-            if scores.get('food_safety_score', 0) >= 65:
-                strengths.append("good food safety and sanitation practices")
-                
-        elif self.industry == 'arts_education':
-            if scores.get('teaching_experience_score', 0) >= 70:
-                strengths.append("strong teaching experience")
-                
-            if scores.get('curriculum_development_score', 0) >= 65:
-                strengths.append("effective curriculum development skills")
-                
-        elif self.industry == 'it_architecture':
-            if scores.get('technical_skills_score', 0) >= 70:
-                strengths.append("robust technical skills in IT architecture")
-                
-            if scores.get('solution_design_score', 0) >= 65:
-                strengths.append("solid solution design capabilities")
-                
-        elif self.industry == 'education_administration':
-            if scores.get('leadership_score', 0) >= 70:
-                strengths.append("strong leadership in educational institutions")
-                
-            if scores.get('policy_implementation_score', 0) >= 65:
-                strengths.append("effective policy development and implementation")
-                
-        elif self.industry == 'military_aviation':
-            if scores.get('technical_skills_score', 0) >= 70:
-                strengths.append("strong technical aviation skills")
-                
-            if scores.get('leadership_score', 0) >= 65:
-                strengths.append("solid leadership in aviation operations")
-                
-        elif self.industry == 'entry_level_service':
-            if scores.get('customer_service_score', 0) >= 70:
-                strengths.append("strong customer interaction and service delivery skills")
-                
-            if scores.get('multitasking_score', 0) >= 65:
-                strengths.append("excellent multitasking abilities")
-                
-        elif self.industry == 'financial_services':
-            if scores.get('financial_analysis_score', 0) >= 70:
-                strengths.append("strong financial analysis and investment skills")
-                
-            if scores.get('portfolio_management_score', 0) >= 65:
-                strengths.append("good portfolio management capabilities")
-                
-        elif self.industry == 'entry_level_finance':
-            if scores.get('financial_analysis_score', 0) >= 70:
-                strengths.append("good financial analysis understanding for entry-level")
-                
-            if scores.get('academic_achievement_score', 0) >= 65:
-                strengths.append("strong academic performance in finance studies")
-                
-        elif self.industry == 'bpo_operations':
-            if scores.get('operations_management_score', 0) >= 70:
-                strengths.append("strong operations management in BPO sector")
-                
-            if scores.get('performance_metrics_score', 0) >= 65:
-                strengths.append("good performance metrics and KPI management skills")
-                
-        # Weaknesses
-        weaknesses = []
-        
-        # General weaknesses
-        if scores.get('experience_quality', 0) < 60:
-            weaknesses.append("work experience section is weak and lacks quantifiable achievements")
-            
-        if scores.get('education_quality', 0) < 60:
-            weaknesses.append("education details are limited or missing important information")
-            
-        if scores.get('skills_relevance', 0) < 60:
-            weaknesses.append("skills section lacks relevance to the target industry")
-            
-        if scores.get('achievements_quality', 0) < 50:
-            weaknesses.append("achievements are minimal and not measurable with results")
-            
-        if scores.get('structure_quality', 0) < 60:
-            weaknesses.append("CV structure is poorly organized, making it hard to skim")
-            
-        # Industry-specific weaknesses
-        if self.industry == 'finance':
-            if scores.get('technical_skills_score', 0) < 60:
-                weaknesses.append("technical finance skills like risk management and financial modeling are insufficient")
-                
-            if scores.get('compliance_score', 0) < 50:
-                weaknesses.append("compliance and regulatory understanding is weak, which is critical in finance roles")
-                
-        elif self.industry == 'social_services':
-            if scores.get('case_management_score', 0) < 60:
-                weaknesses.append("case management experience is not clearly demonstrated")
-                
-            if scores.get('crisis_intervention_score', 0) < 50:
-                weaknesses.append("crisis intervention skills are missing or underrepresented")
-                
-        elif self.industry == 'customer_service':
-            if scores.get('customer_service_score', 0) < 65:
-                weaknesses.append("customer service accomplishments are insufficiently detailed")
-                
-            if scores.get('problem_solving_score', 0) < 50:
-                weaknesses.append("problem-solving examples are missing or vague")
-                
-        elif self.industry == 'natural_resources':
-            if scores.get('field_experience_score', 0) < 60:
-                weaknesses.append("field experience in natural resource projects is lacking")
-                
-            if scores.get('regulatory_knowledge_score', 0) < 50:
-                weaknesses.append("regulatory and compliance knowledge is weak")
-                
-            if scores.get('technical_skills_score', 0) < 50:
-                weaknesses.append("technical skills such as GIS and environmental tools are poorly represented")
-                
-        elif self.industry == 'retail_fashion':
-            if scores.get('sales_performance_score', 0) < 60:
-                weaknesses.append("sales performance results are weak or missing")
-                
-            if scores.get('team_leadership_score', 0) < 50:
-                weaknesses.append("team leadership experience in retail settings is underdeveloped")
-                
-        elif self.industry == 'beauty_cosmetics':
-            if scores.get('artistry_skills_score', 0) < 60:
-                weaknesses.append("artistry skills and techniques are not showcased well")
-                
-            if scores.get('product_knowledge_score', 0) < 50:
-                weaknesses.append("product knowledge about cosmetics brands is insufficient")
-                
-        elif self.industry == 'hospitality_food':
-            if scores.get('food_safety_score', 0) < 60:
-                weaknesses.append("food safety training and certifications are not clearly mentioned")
-                
-            if scores.get('pos_systems_score', 0) < 50:
-                weaknesses.append("experience with POS systems in hospitality is limited")
-                
-        elif self.industry == 'arts_education':
-            if scores.get('curriculum_development_score', 0) < 60:
-                weaknesses.append("curriculum development contributions are minimal or missing")
-                
-            if scores.get('teaching_experience_score', 0) < 50:
-                weaknesses.append("teaching experience across diverse age groups is poorly detailed")
-                
-        elif self.industry == 'it_architecture':
-            if scores.get('technical_skills_score', 0) < 60:
-                weaknesses.append("technical architecture skills and certifications are insufficient")
-                
-            if scores.get('solution_design_score', 0) < 50:
-                weaknesses.append("solution design experience is missing or too general")
-                
-        elif self.industry == 'education_administration':
-            if scores.get('leadership_score', 0) < 60:
-                weaknesses.append("leadership achievements in education administration are lacking")
-                
-            if scores.get('policy_implementation_score', 0) < 50:
-                weaknesses.append("policy implementation experience is missing or weak")
-                
-        elif self.industry == 'military_aviation':
-            if scores.get('technical_skills_score', 0) < 60:
-                weaknesses.append("aviation technical skills need better representation")
-                
-            if scores.get('safety_compliance_score', 0) < 50:
-                weaknesses.append("safety compliance experience in aviation is underdeveloped")
-                
-        elif self.industry == 'entry_level_service':
-            if scores.get('customer_service_score', 0) < 60:
-                weaknesses.append("customer service abilities at the entry level are weak")
-                
-            if scores.get('multitasking_score', 0) < 50:
-                weaknesses.append("multitasking skills for service roles are poorly demonstrated")
-                
-        elif self.industry == 'financial_services':
-            if scores.get('financial_analysis_score', 0) < 60:
-                weaknesses.append("financial analysis expertise is insufficient for financial services roles")
-                
-            if scores.get('regulatory_compliance_score', 0) < 50:
-                weaknesses.append("regulatory compliance understanding is weak")
-                
-        elif self.industry == 'entry_level_finance':
-            if scores.get('financial_analysis_score', 0) < 60:
-                weaknesses.append("financial analysis and modeling experience is weak for entry-level finance roles")
-                
-            if scores.get('academic_achievement_score', 0) < 50:
-                weaknesses.append("academic achievements related to finance are not highlighted well")
-                
-        elif self.industry == 'bpo_operations':
-            if scores.get('operations_management_score', 0) < 60:
-                weaknesses.append("operations management and KPI tracking experience is insufficient")
-                
-            if scores.get('performance_metrics_score', 0) < 50:
-                weaknesses.append("performance metrics and improvement initiatives are poorly represented")
-                
-        return feedback if feedback else ["CV meets basic standards but could benefit from professional refinement"]
\ No newline at end of file
+        for key, below, message in self.plan.feedback:
+            if scores.get(key, 0) < below:
+                feedback.append(message)
+
+        return feedback if feedback else ["CV meets basic standards but could benefit from professional refinement"]
+
+check_plans(CVEvaluator)
+
+EVALUATOR_CACHE = EvaluatorCache(CVEvaluator)
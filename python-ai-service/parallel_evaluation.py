@@ -0,0 +1,63 @@
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Chunks handed to each worker on average; more chunks balance uneven CVs
+CHUNKS_PER_WORKER = 4
+
+# Evaluation state of a worker process, set once by _init_worker
+_worker = None
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def chunked(items, chunk_size):
+    """Consecutive lists of at most chunk_size (cv_id, cv_data) pairs"""
+    for start in range(0, len(items), chunk_size):
+        yield items[start:start + chunk_size]
+
+
+def _init_worker(system, compiled):
+    """
+    Runs once per worker process: keeps the evaluation system and its
+    compiled criteria, so chunks only carry CVs.
+    """
+    global _worker
+    _worker = (system, compiled)
+
+
+def _evaluate_chunk(chunk, depth, gate_first):
+    system, compiled = _worker
+    return [system._evaluate_one(cv_id, cv_data, depth, compiled, gate_first) for cv_id, cv_data in chunk]
+
+
+def evaluate_parallel(system, cvs_data, depth, compiled, workers=None, chunk_size=None, gate_first=False):
+    """
+    Individual reports for cvs_data, computed by a pool of worker processes.
+
+    Reports come back in the order of cvs_data. Returns None when processes
+    cannot be started here (e.g. no /dev/shm on AWS Lambda), in which case the
+    caller evaluates sequentially.
+    """
+    items = list(cvs_data.items())
+    workers = min(workers or default_workers(), len(items))
+    if workers < 2:
+        return None
+    if not chunk_size:
+        chunk_size = max(1, math.ceil(len(items) / (workers * CHUNKS_PER_WORKER)))
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(system, compiled)) as executor:
+            futures = [executor.submit(_evaluate_chunk, chunk, depth, gate_first)
+                       for chunk in chunked(items, chunk_size)]
+            reports = []
+            for future in futures:
+                reports.extend(future.result())
+            return reports
+    except (OSError, NotImplementedError, ImportError) as e:
+        logging.warning(f"Process pool unavailable, evaluating sequentially: {str(e)}")
+        return None
@@ -0,0 +1,130 @@
+import time
+from bisect import bisect_left
+
+# Upper bounds, in milliseconds, of the histogram buckets; slower calls fall
+# in a last, unbounded bucket
+BUCKET_BOUNDS_MS = (
+    0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5,
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000
+)
+
+
+def untimed(stage, function, *args):
+    """Stand-in for StageTimer.measure when profiling is off"""
+    return function(*args)
+
+
+class StageTimer:
+    """Wall time and call count of each stage of one CV's evaluation"""
+
+    __slots__ = ('stages', 'started')
+
+    def __init__(self):
+        # stage -> [seconds, calls]
+        self.stages = {}
+        self.started = time.perf_counter()
+
+    def measure(self, stage, function, *args):
+        """function(*args), timed under stage"""
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = self.stages.get(stage)
+            if entry is None:
+                self.stages[stage] = [elapsed, 1]
+            else:
+                entry[0] += elapsed
+                entry[1] += 1
+
+    def finish(self):
+        """Record the time since the timer started as the 'total' stage"""
+        self.stages['total'] = [time.perf_counter() - self.started, 1]
+        return self
+
+    def to_dict(self):
+        return {stage: {'ms': round(seconds * 1000, 4), 'calls': calls}
+                for stage, (seconds, calls) in self.stages.items()}
+
+
+class Histogram:
+    """Distribution of per-CV times of one stage"""
+
+    __slots__ = ('counts', 'count', 'calls', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms, calls=1):
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.calls += calls
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of CVs"""
+        rank = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        buckets = {f'<={bound}ms': count for bound, count in zip(BUCKET_BOUNDS_MS, self.counts) if count}
+        if self.counts[-1]:
+            buckets[f'>{BUCKET_BOUNDS_MS[-1]}ms'] = self.counts[-1]
+        return {
+            'cvs': self.count,
+            'calls': self.calls,
+            'total_ms': round(self.total, 3),
+            'mean_ms': round(self.total / self.count, 4) if self.count else 0,
+            'p50_ms': round(self.percentile(0.5), 4),
+            'p95_ms': round(self.percentile(0.95), 4),
+            'max_ms': round(self.max, 4),
+            'buckets': buckets
+        }
+
+
+class Profiler:
+    """
+    Per-process stage timings of CV evaluations.
+
+    Enabled with CVEvaluationSystem.enable_profiling(), every CV evaluated
+    by that system gets a StageTimer: industry detection, each score
+    component ('score.<key>'), feedback, report, requirement checks and, with
+    gate_first, the gates are timed, along with the CV's total. Each CV's
+    stage times go into one histogram per stage. With attach_timings, the
+    CV's own timings are also added to its report as 'timings'.
+
+    CVs evaluated in worker processes are recorded by the workers' copies.
+    """
+
+    def __init__(self, attach_timings=False):
+        self.attach_timings = attach_timings
+        self.histograms = {}
+
+    def timer(self):
+        return StageTimer()
+
+    def record(self, timer):
+        for stage, (seconds, calls) in timer.stages.items():
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.add(seconds * 1000, calls)
+
+    def summary(self):
+        """Stage -> histogram statistics, the most time consuming stage first"""
+        ordered = sorted(self.histograms.items(), key=lambda item: item[1].total, reverse=True)
+        return {stage: histogram.to_dict() for stage, histogram in ordered}
+
+    def reset(self):
+        self.histograms = {}
@@ -0,0 +1,138 @@
+import heapq
+import logging
+
+from model import CVDocument, EVALUATOR_CACHE, KeywordScorer, check_depth
+
+# Highest value a weighted score can take, but for the uncapped keyword
+# scorers, whose ceiling depends on the CV (see KeywordScorer.ceiling)
+SCORE_CEILING = 100
+
+# Scores computed first: cheap ones, then the heavily weighted ones, so that
+# the upper bound drops fast. total_experience_years has no ceiling, so it
+# always comes first. Industry scores follow in plan order.
+STAGE_ORDER = (
+    'total_experience_years', 'section_completeness', 'education_quality', 'keyword_matching',
+    'structure_quality', 'experience_quality', 'skills_relevance', 'achievements_quality'
+)
+
+# Slack for the bound being summed in a different order than the total
+BOUND_TOLERANCE = 1e-9
+
+
+class _Candidate:
+    """A fully scored CV waiting in the top-k heap"""
+
+    __slots__ = ('order', 'cv_id', 'doc', 'industry', 'evaluator', 'scores', 'total')
+
+    def __init__(self, order, cv_id, doc, industry, evaluator, scores, total):
+        self.order = order
+        self.cv_id = cv_id
+        self.doc = doc
+        self.industry = industry
+        self.evaluator = evaluator
+        self.scores = scores
+        self.total = total
+
+    def __lt__(self, other):
+        # The heap root is the weakest: lowest total, then latest CV
+        if self.total != other.total:
+            return self.total < other.total
+        return self.order > other.order
+
+
+def _ceiling(scorer, doc):
+    """Highest value scorer can give doc"""
+    keyword_scorer = getattr(scorer, '__func__', None)
+    if isinstance(keyword_scorer, KeywordScorer):
+        return keyword_scorer.ceiling(doc)
+    return SCORE_CEILING
+
+
+def _staged(scorers):
+    order = [key for key in STAGE_ORDER if key in scorers]
+    return order + [key for key in scorers if key not in order]
+
+
+def rank_top_k(system, cvs_data, k=20, depth='full'):
+    """
+    The k best CVs of cvs_data by total_score, with their reports.
+
+    The top list is what sorting evaluate_multiple_cvs(cvs_data, depth) by
+    total score would give, ties kept in input order and failed CVs left
+    out. Once k candidates are held, each CV's scores are computed one at a
+    time while tracking the highest total it could still reach: the scores
+    so far plus this CV's ceiling of every remaining weighted score. A CV
+    is dropped as soon as that bound cannot beat the current k-th best, and
+    feedback and reports are built only for the final top k.
+    """
+    check_depth(depth)
+    compiled = system._batch_criteria()
+    heap = []
+    errors = []
+    considered = fully_scored = pruned = 0
+
+    for order, (cv_id, cv_data) in enumerate(cvs_data.items()):
+        considered += 1
+        try:
+            cv_data = system._validate_cv_data(cv_data)
+            doc = CVDocument(cv_data, system.reference_date)
+            industry = system._detect_industry(doc)
+            evaluator = EVALUATOR_CACHE.get(compiled or system._compiled_criteria(), industry)
+            scorers = evaluator.scorers()
+            weights = evaluator.plan.weights
+
+            threshold = heap[0].total if len(heap) >= k else None
+            ceilings = {key: _ceiling(scorers[key], doc) for key in scorers if weights.get(key, 0) > 0}
+            bound = sum(ceiling * weights[key] for key, ceiling in ceilings.items())
+            scores = {}
+            for key in _staged(scorers):
+                score = scorers[key](doc)
+                scores[key] = score
+                weight = weights.get(key, 0)
+                bound += score * weight - (ceilings[key] * weight if weight > 0 else 0)
+                if threshold is not None and round(min(100, bound) + BOUND_TOLERANCE, 1) <= threshold:
+                    pruned += 1
+                    break
+            else:
+                fully_scored += 1
+                breakdown = {key: scores[key] for key in scorers}
+                candidate = _Candidate(order, cv_id, doc, industry, evaluator, breakdown,
+                                       evaluator.total_score(breakdown))
+                if len(heap) < k:
+                    heapq.heappush(heap, candidate)
+                elif heap[0] < candidate:
+                    heapq.heapreplace(heap, candidate)
+        except Exception as e:
+            logging.error(f"Error evaluating CV {cv_id}: {str(e)}")
+            errors.append({'cv_id': cv_id, 'error': str(e)})
+
+    top = []
+    for candidate in sorted(heap, reverse=True):
+        try:
+            top.append(_report(system, candidate, depth))
+        except Exception as e:
+            logging.error(f"Error evaluating CV {candidate.cv_id}: {str(e)}")
+            errors.append({'cv_id': candidate.cv_id, 'error': str(e)})
+
+    return {
+        'top_candidates': top,
+        'total_cvs_considered': considered,
+        'fully_scored': fully_scored,
+        'pruned': pruned,
+        'errors': errors
+    }
+
+
+def _report(system, candidate, depth):
+    """Individual report of a candidate, as evaluate_multiple_cvs builds it"""
+    evaluation = {'total_score': candidate.total, 'score_breakdown': candidate.scores}
+    if depth != 'score':
+        evaluation['feedback'] = candidate.evaluator._generate_feedback(candidate.scores, candidate.doc.data)
+    if depth == 'full':
+        evaluation['extracted_data'] = candidate.doc.data
+    return {
+        'cv_id': candidate.cv_id,
+        'industry': candidate.industry,
+        'report': system._generate_report(evaluation, candidate.doc, candidate.industry, depth),
+        'meets_requirements': system._check_requirements(evaluation, candidate.industry, candidate.doc)
+    }
@@ -0,0 +1,147 @@
+import base64
+import gzip
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bodies smaller than this are sent as they are: they fit in a packet or
+# two, and gzip and base64 would cost more time than they save
+MIN_COMPRESS_BYTES = 1400
+
+# gzip level by body size, as (largest body in bytes, level): large bodies,
+# such as batch results, get a faster level, as they compress well anyway
+COMPRESSION_LEVELS = ((1024 * 1024, 6), (None, 3))
+
+# Media types API Gateway returns as binary (provider.apiGateway.binaryMediaTypes
+# in serverless.yml). A gzipped body is base64 encoded for API Gateway, which
+# only decodes it if the request's Accept header starts with one of these;
+# otherwise the client would get the base64 text. API Gateway also base64
+# encodes request bodies of these types, so JSON is not one of them: a
+# client opts into gzip by asking for application/octet-stream first.
+BINARY_MEDIA_TYPES = ('application/octet-stream',)
+
+# orjson's dumps if it is installed, json's otherwise; loaded on first use
+_FAST_DUMPS = None
+
+
+def _header(event, name):
+    headers = (event or {}).get('headers') or {}
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value or ''
+    return ''
+
+
+def accepts_gzip(event):
+    """Whether the request's Accept-Encoding allows gzip"""
+    accepted = {}
+    for part in _header(event, 'accept-encoding').split(','):
+        coding, _, params = part.strip().lower().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    return accepted.get('gzip', accepted.get('*', 0.0)) > 0
+
+
+def accepts_binary(event):
+    """Whether API Gateway will decode a base64 body for this request"""
+    accept = _header(event, 'accept').split(',')[0].split(';')[0].strip().lower()
+    return accept in BINARY_MEDIA_TYPES
+
+
+def request_body(event):
+    """The request's body as text; API Gateway base64 encodes bodies of BINARY_MEDIA_TYPES"""
+    body = event.get('body') or ''
+    if event.get('isBase64Encoded'):
+        body = base64.b64decode(body).decode('utf-8')
+    return body
+
+
+def compression_level(size):
+    for largest, level in COMPRESSION_LEVELS:
+        if largest is None or size <= largest:
+            return level
+
+
+def _orjson_dumps(data):
+    import orjson
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # e.g. integers beyond 64 bits, which json handles
+        return json.dumps(data).encode('utf-8')
+
+
+def dumps(data):
+    """data as JSON, in UTF-8 bytes, by orjson if it is installed"""
+    global _FAST_DUMPS
+    if _FAST_DUMPS is None:
+        try:
+            import orjson  # noqa: F401
+            _FAST_DUMPS = _orjson_dumps
+        except ImportError:
+            _FAST_DUMPS = lambda data: json.dumps(data).encode('utf-8')  # noqa: E731
+    return _FAST_DUMPS(data)
+
+
+class EncodingStats:
+    """Bytes of the response bodies of this process, before and after encoding"""
+
+    def __init__(self):
+        self.responses = 0
+        self.compressed = 0
+        self.body_bytes = 0
+        self.sent_bytes = 0
+
+    def record(self, body_bytes, sent_bytes, compressed):
+        self.responses += 1
+        self.compressed += compressed
+        self.body_bytes += body_bytes
+        self.sent_bytes += sent_bytes
+
+    def stats(self):
+        return {
+            'responses': self.responses,
+            'compressed': self.compressed,
+            'body_bytes': self.body_bytes,
+            'sent_bytes': self.sent_bytes,
+            'bytes_saved': self.body_bytes - self.sent_bytes,
+            'ratio': round(self.sent_bytes / self.body_bytes, 3) if self.body_bytes else 1
+        }
+
+
+STATS = EncodingStats()
+
+
+def encode_response(event, status_code, headers, body):
+    """
+    API Gateway response of a JSON body (text or UTF-8 bytes). If the client
+    accepts gzip and binary bodies and the body is at least
+    MIN_COMPRESS_BYTES, it is gzipped at a level picked by its size and
+    base64 encoded as application/octet-stream, unless that doesn't make it
+    smaller.
+    """
+    raw = body.encode('utf-8') if isinstance(body, str) else body
+    headers = dict(headers, Vary='Accept, Accept-Encoding')
+    response = {'statusCode': status_code, 'headers': headers}
+
+    if len(raw) >= MIN_COMPRESS_BYTES and accepts_gzip(event) and accepts_binary(event):
+        compressed = gzip.compress(raw, compresslevel=compression_level(len(raw)), mtime=0)
+        if len(compressed) < len(raw):
+            headers['Content-Type'] = BINARY_MEDIA_TYPES[0]
+            headers['Content-Encoding'] = 'gzip'
+            response['body'] = base64.b64encode(compressed).decode('ascii')
+            response['isBase64Encoded'] = True
+            STATS.record(len(raw), len(compressed), True)
+            logger.info(f"Response body gzipped from {len(raw)} to {len(compressed)} bytes, "
+                        f"totals: {STATS.stats()}")
+            return response
+
+    response['body'] = body if isinstance(body, str) else raw.decode('utf-8')
+    STATS.record(len(raw), len(raw), False)
+    return response
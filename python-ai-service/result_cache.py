@@ -0,0 +1,211 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import datetime
+
+from compact_cv import json_default
+from model import SCORING_ENGINE_VERSION, check_depth
+
+
+def content_hash(data):
+    """Stable hash of JSON-like data, compact CVs included; None if it cannot be serialized"""
+    try:
+        canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=json_default)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Cache of individual CV reports in front of evaluate_multiple_cvs.
+
+    A report is keyed by a hash of the CV data, the criteria fingerprint, the
+    depth and gate-first options, the month ongoing roles are measured to
+    and SCORING_ENGINE_VERSION, so any change to one of them is a miss.
+    Reports live in an in-process LRU of max_entries and, if a directory is
+    given, in one file each there, oldest files evicted beyond max_bytes.
+    Failed evaluations are never cached.
+    """
+
+    def __init__(self, max_entries=1024, directory=None, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._memory = OrderedDict()
+        self._disk_bytes = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'memory_hits': self.hits - self.disk_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0,
+            'memory_entries': len(self._memory),
+            'disk_bytes': self._disk_bytes or 0,
+            'evictions': self.evictions
+        }
+
+    def clear(self):
+        self._memory.clear()
+        if self.directory and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.directory, name))
+        self._disk_bytes = 0
+
+    def context(self, system, depth='full', gate_first=False):
+        """The part of a key shared by every CV of a call; None if uncacheable"""
+        compiled = system._batch_criteria()
+        if compiled is None:
+            return None
+        reference = system.reference_date or datetime.now()
+        return f'{SCORING_ENGINE_VERSION}|{depth}|{int(bool(gate_first))}|' \
+               f'{reference.year}-{reference.month}|{compiled.fingerprint}'
+
+    def key(self, context, cv_data):
+        cv_hash = content_hash(cv_data) if context is not None else None
+        if cv_hash is None:
+            return None
+        return hashlib.sha256(f'{context}|{cv_hash}'.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Cached report for a key as a fresh dict, or None"""
+        text = self._memory.get(key)
+        if text is not None:
+            self._memory.move_to_end(key)
+        else:
+            text = self._read(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, text)
+        self.hits += 1
+        return json.loads(text)
+
+    def put(self, key, report):
+        try:
+            text = json.dumps(report, default=json_default)
+        except (TypeError, ValueError):
+            return
+        self._remember(key, text)
+        self._write(key, text)
+
+    def _remember(self, key, text):
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def _read(self, key):
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+            # Reading marks the file recently used for eviction
+            os.utime(path)
+            return text
+        except OSError:
+            return None
+
+    def _write(self, key, text):
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            used = self._disk_usage()
+            path = self._path(key)
+            replaced = os.path.getsize(path) if os.path.exists(path) else 0
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_path, path)
+            self._disk_bytes = used + len(text.encode('utf-8')) - replaced
+            if self._disk_bytes > self.max_bytes:
+                self._evict_disk()
+        except OSError as e:
+            logging.warning(f"Could not write evaluation cache entry: {str(e)}")
+
+    def _disk_usage(self):
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(size for _, _, size in self._disk_entries())
+        return self._disk_bytes
+
+    def _disk_entries(self):
+        """(last used, path, size) of every cached file"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def _evict_disk(self):
+        """Remove the least recently used files until the tier is down to 90% of max_bytes"""
+        entries = sorted(self._disk_entries())
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * 0.9
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self._disk_bytes = total
+
+    def evaluate(self, system, cvs_data, depth='full', gate_first=False, **options):
+        """
+        system.evaluate_multiple_cvs(cvs_data, depth, ...) with cached reports
+        reused; only the CVs missing from the cache are evaluated, and the
+        summary report is built over all of them.
+        """
+        check_depth(depth)
+        context = self.context(system, depth, gate_first)
+        # Keys are computed before evaluation, which fixes up CVs in place
+        keys = {cv_id: self.key(context, cv_data) for cv_id, cv_data in cvs_data.items()}
+
+        reports = {}
+        missing = {}
+        for cv_id, cv_data in cvs_data.items():
+            report = self.get(keys[cv_id]) if keys[cv_id] else None
+            if report is None:
+                missing[cv_id] = cv_data
+            else:
+                report['cv_id'] = cv_id
+                reports[cv_id] = report
+
+        if missing:
+            results = system.evaluate_multiple_cvs(missing, depth, gate_first=gate_first, **options)
+            for cv_id, report in zip(missing, results['individual_reports']):
+                if keys[cv_id] and 'error' not in report:
+                    self.put(keys[cv_id], report)
+                reports[cv_id] = report
+
+        ordered = [reports[cv_id] for cv_id in cvs_data]
+        return {
+            'individual_reports': ordered,
+            'summary_report': system._generate_summary_report(ordered)
+        }
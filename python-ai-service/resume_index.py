@@ -0,0 +1,259 @@
+import copy
+import json
+import sqlite3
+
+from model import CVDocument, CVEvaluationSystem, EDUCATION_LEVELS
+
+# Bumped whenever the indexed fields change; older indexes are rebuilt from
+# the CV data they store
+INDEX_VERSION = 4
+
+# Rows fetched per query when verifying candidates
+FETCH_BATCH = 500
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY,
+    cv_id TEXT UNIQUE NOT NULL,
+    industry TEXT NOT NULL,
+    education_rank INTEGER NOT NULL,
+    experience_years REAL NOT NULL,
+    ongoing INTEGER NOT NULL,
+    skills_text TEXT NOT NULL,
+    keyword_text TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER NOT NULL,
+    field TEXT NOT NULL,
+    resume_id INTEGER NOT NULL,
+    PRIMARY KEY (term_id, field, resume_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_resume ON postings (resume_id);
+CREATE INDEX IF NOT EXISTS resumes_by_industry ON resumes (industry);
+'''
+
+# Posting fields: words of the skills and of the keyword text
+SKILLS, KEYWORDS = 's', 'k'
+
+
+class ResumeIndex:
+    """
+    On-disk inverted index over parsed CVs, backed by SQLite.
+
+    Each CV is stored with the values the requirement checks read: its
+    lowercased skills and keyword texts, highest education level, total
+    experience years and detected industry, and every word of the two texts
+    is posted to an inverted index. candidates() turns criteria into the
+    CVs that can pass the min_experience, required_skills, education_level
+    and keywords checks without reading any other CV, so only those go to
+    CVEvaluationSystem for scoring.
+
+    The checks use substring matching, so a criterion word is looked up as
+    part of any indexed word and the texts of the matching CVs are then
+    checked exactly. Experience is time dependent for ongoing roles, which
+    are therefore always kept as candidates.
+    """
+
+    def __init__(self, path=':memory:', system=None):
+        self.system = system or CVEvaluationSystem()
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        # term -> id, loaded on the first insert
+        self._terms = None
+        version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+        if version != INDEX_VERSION:
+            self.reindex()
+
+    def close(self):
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+    def add(self, cv_id, cv_data):
+        """Index one CV, replacing any CV stored under the same id"""
+        self.add_many({cv_id: cv_data})
+
+    def add_many(self, cvs_data):
+        with self.connection:
+            for cv_id, cv_data in cvs_data.items():
+                self._store(str(cv_id), cv_data)
+
+    def remove(self, cv_id):
+        with self.connection:
+            self._delete(str(cv_id))
+
+    def reindex(self):
+        """Recompute every indexed field from the stored CV data"""
+        rows = self.connection.execute('SELECT cv_id, data FROM resumes ORDER BY id').fetchall()
+        with self.connection:
+            for cv_id, data in rows:
+                self._store(cv_id, json.loads(data))
+            self.connection.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+
+    def _delete(self, cv_id):
+        row = self.connection.execute('SELECT id FROM resumes WHERE cv_id = ?', (cv_id,)).fetchone()
+        if row:
+            self.connection.execute('DELETE FROM postings WHERE resume_id = ?', row)
+            self.connection.execute('DELETE FROM resumes WHERE id = ?', row)
+
+    def _store(self, cv_id, cv_data):
+        # Indexed values are those evaluation sees after fixing up the CV
+        fixed = self.system._validate_cv_data(copy.deepcopy(cv_data))
+        doc = CVDocument(fixed, self.system.reference_date)
+
+        highest = self.system._get_highest_education(doc.education)
+        highest = highest.lower() if highest else None
+        education_rank = EDUCATION_LEVELS.index(highest) if highest in EDUCATION_LEVELS else -1
+        ongoing = any(
+            isinstance(exp.get('duration'), str) and
+            ('present' in exp['duration'].lower() or 'current' in exp['duration'].lower())
+            for exp in doc.experience
+        )
+
+        self._delete(cv_id)
+        cursor = self.connection.execute(
+            'INSERT INTO resumes (cv_id, industry, education_rank, experience_years, ongoing,'
+            ' skills_text, keyword_text, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (cv_id, self.system._detect_industry(doc), education_rank, doc.total_experience_years,
+             int(ongoing), doc.skills_text, doc.keyword_text, json.dumps(cv_data))
+        )
+        resume_id = cursor.lastrowid
+
+        postings = []
+        for field, text in ((SKILLS, doc.skills_text), (KEYWORDS, doc.keyword_text)):
+            for word in set(text.split()):
+                postings.append((self._term_id(word), field, resume_id))
+        self.connection.executemany('INSERT INTO postings VALUES (?, ?, ?)', postings)
+
+    def _term_id(self, word):
+        if self._terms is None:
+            self._terms = dict(self.connection.execute('SELECT term, id FROM terms'))
+        term_id = self._terms.get(word)
+        if term_id is None:
+            cursor = self.connection.execute('INSERT INTO terms (term) VALUES (?)', (word,))
+            term_id = self._terms[word] = cursor.lastrowid
+        return term_id
+
+    def _containing(self, phrase, field):
+        """
+        Ids of the CVs whose field text can contain phrase: every word of the
+        phrase is part of some indexed word of the CV. None if the phrase has
+        no words, as every text contains it.
+        """
+        found = None
+        for word in phrase.split():
+            term_ids = [row[0] for row in self.connection.execute(
+                'SELECT id FROM terms WHERE instr(term, ?) > 0', (word,))]
+            ids = set()
+            for start in range(0, len(term_ids), FETCH_BATCH):
+                batch = term_ids[start:start + FETCH_BATCH]
+                ids.update(row[0] for row in self.connection.execute(
+                    f'SELECT resume_id FROM postings WHERE term_id IN ({",".join("?" * len(batch))})'
+                    ' AND field = ?', batch + [field]))
+            found = ids if found is None else found & ids
+            if not found:
+                return set()
+        return found
+
+    def _select(self, columns, conditions, params, ids=None):
+        """Rows matching conditions, restricted to the resume ids given, in id order"""
+        where = ''.join(f' AND {condition}' for condition in conditions)
+        if ids is None:
+            yield from self.connection.execute(f'SELECT {columns} FROM resumes WHERE 1{where} ORDER BY id', params)
+            return
+        ids = sorted(ids)
+        for start in range(0, len(ids), FETCH_BATCH):
+            batch = ids[start:start + FETCH_BATCH]
+            yield from self.connection.execute(
+                f'SELECT {columns} FROM resumes WHERE id IN ({",".join("?" * len(batch))}){where} ORDER BY id',
+                batch + params)
+
+    def candidates(self, criteria, industries=None):
+        """
+        cv_ids, in the order they were added, of the CVs that can pass the
+        requirement checks of an evaluation criteria dict, optionally only
+        those detected as one of industries.
+
+        Raises ValueError for an unknown education_level, as evaluation does.
+        """
+        conditions = []
+        params = []
+
+        min_years = criteria.get('min_experience_years') or 0
+        if min_years > 0:
+            conditions.append('(experience_years >= ? OR ongoing)')
+            params.append(min_years)
+
+        education_level = criteria.get('education_level')
+        if education_level:
+            conditions.append('education_rank >= ?')
+            params.append(EDUCATION_LEVELS.index(education_level))
+
+        if industries:
+            industries = list(industries)
+            conditions.append(f'industry IN ({",".join("?" * len(industries))})')
+            params.extend(industries)
+
+        ids = None
+        required_skills = [skill.lower() for skill in criteria.get('required_skills') or ()]
+        for skill in required_skills:
+            found = self._containing(skill, SKILLS)
+            if found is not None:
+                ids = found if ids is None else ids & found
+        if ids is not None and not ids:
+            return []
+
+        keywords = [kw.lower() for kw in criteria.get('keywords') or ()]
+        needed = len(keywords) * 0.5
+        if keywords:
+            counts = {}
+            everywhere = 0
+            for kw in keywords:
+                found = self._containing(kw, KEYWORDS)
+                if found is None:
+                    everywhere += 1
+                    continue
+                for resume_id in found:
+                    counts[resume_id] = counts.get(resume_id, 0) + 1
+            if everywhere < needed:
+                possible = {resume_id for resume_id, count in counts.items() if count + everywhere >= needed}
+                ids = possible if ids is None else ids & possible
+
+        if ids is None:
+            return [cv_id for cv_id, in self._select('cv_id', conditions, params)]
+
+        # Exact substring checks on the texts of the remaining CVs
+        result = []
+        rows = self._select('cv_id, skills_text, keyword_text', conditions, params, ids)
+        for cv_id, skills_text, keyword_text in rows:
+            if any(skill not in skills_text for skill in required_skills):
+                continue
+            if keywords and sum(1 for kw in keywords if kw in keyword_text) < needed:
+                continue
+            result.append(cv_id)
+        return result
+
+    def load(self, cv_ids):
+        """cv_id -> CV data of the given stored CVs, in the order of cv_ids"""
+        cv_ids = [str(cv_id) for cv_id in cv_ids]
+        found = {}
+        for start in range(0, len(cv_ids), FETCH_BATCH):
+            batch = cv_ids[start:start + FETCH_BATCH]
+            rows = self.connection.execute(
+                f'SELECT cv_id, data FROM resumes WHERE cv_id IN ({",".join("?" * len(batch))})', batch)
+            found.update((cv_id, json.loads(data)) for cv_id, data in rows)
+        return {cv_id: found[cv_id] for cv_id in cv_ids if cv_id in found}
+
+    def evaluate(self, system, depth='full', industries=None, **options):
+        """
+        Evaluate the stored CVs that can meet system's criteria; options are
+        passed on to evaluate_multiple_cvs.
+        """
+        cv_ids = self.candidates(system.evaluation_criteria, industries)
+        return system.evaluate_multiple_cvs(self.load(cv_ids), depth, **options)
@@ -0,0 +1,655 @@
+from types import MappingProxyType
+
+# Weights every industry starts from; a plan's weights override these
+BASE_WEIGHTS = {
+    'section_completeness': 0.10,
+    'experience_quality': 0.30,
+    'education_quality': 0.15,
+    'skills_relevance': 0.20,
+    'achievements_quality': 0.10,
+    'keyword_matching': 0.05,
+    'structure_quality': 0.05,
+    'technical_skills_score': 0.05
+}
+
+# Total score cut-offs for "Highly Recommended", "Recommended" and "Maybe Consider"
+DEFAULT_THRESHOLDS = (80, 65, 50)
+
+
+class ScoringPlan:
+    """
+    Everything industry-specific about scoring a CV.
+
+    scorers are (score key, CVEvaluator method name) pairs run in order,
+    weights override BASE_WEIGHTS, gates are (score key, minimum) pairs that
+    must all hold for the industry requirement check (a score the plan does
+    not produce counts as 0), and feedback rules are (score key, below,
+    message) triples. positive_keywords are rewarded in experience
+    descriptions and skill_keywords in individual skills.
+    """
+
+    def __init__(self, industry, scorers=(), weights=None, gates=(), thresholds=DEFAULT_THRESHOLDS,
+                 positive_keywords=(), skill_keywords=(), feedback=()):
+        self.industry = industry
+        self.scorers = tuple(scorers)
+        merged = dict(BASE_WEIGHTS)
+        merged.update(weights or {})
+        self.weights = MappingProxyType(merged)
+        self.gates = tuple(gates)
+        self.thresholds = tuple(thresholds)
+        self.positive_keywords = tuple(positive_keywords)
+        self.skill_keywords = tuple(skill_keywords)
+        self.feedback = tuple(feedback)
+
+    def passes_gates(self, scores):
+        return all(scores.get(key, 0) >= minimum for key, minimum in self.gates)
+
+
+SCORING_PLANS = {}
+
+
+def register_plan(plan):
+    """Add a plan to the registry; registering an industry twice is an error"""
+    if plan.industry in SCORING_PLANS:
+        raise ValueError(f"A scoring plan for '{plan.industry}' is already registered")
+    SCORING_PLANS[plan.industry] = plan
+    return plan
+
+
+def get_plan(industry):
+    """Plan for an industry, or the general plan for an unknown one"""
+    return SCORING_PLANS.get(industry) or SCORING_PLANS['general']
+
+
+def check_plans(evaluator_class):
+    """Raise ValueError if a plan names a scorer evaluator_class does not have"""
+    missing = [
+        f"{plan.industry}: {name}"
+        for plan in SCORING_PLANS.values()
+        for _, name in plan.scorers
+        if not callable(getattr(evaluator_class, name, None))
+    ]
+    if missing:
+        raise ValueError("Unknown scorers in scoring plans: " + ', '.join(missing))
+
+
+register_plan(ScoringPlan(
+    'finance',
+    scorers=[
+        ('technical_skills_score', '_evaluate_finance_skills'),
+        ('compliance_score', '_evaluate_compliance')
+    ],
+    weights={
+        'experience_quality': 0.35,
+        'technical_skills_score': 0.15,
+        'compliance_score': 0.10
+    },
+    gates=[('technical_skills_score', 60), ('compliance_score', 50)],
+    thresholds=(85, 70, 55),
+    positive_keywords=[
+        'compliance', 'audit', 'risk assessment', 'portfolio',
+        'underwriting', 'reconciliation', 'GAAP', 'financial reporting',
+        'investment', 'derivatives', 'valuation', 'exposure', 'IBOR',
+        'data governance', 'data quality', 'data architecture'
+    ],
+    skill_keywords=['risk', 'compliance', 'gaap', 'accounting', 'portfolio', 'audit'],
+    feedback=[
+        ('technical_skills_score', 60,
+         "Your technical skills in finance could be strengthened. Highlight expertise in risk management, compliance frameworks, "
+         "and financial analysis tools like Bloomberg or QuickBooks. Mention certifications or hands-on system experience. "
+         "Employers in finance expect robust technical proficiency to manage complex financial operations.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'media',
+    scorers=[
+        ('creativity_score', '_evaluate_creativity'),
+        ('project_management_score', '_evaluate_project_management')
+    ],
+    weights={
+        'creativity_score': 0.15,
+        'project_management_score': 0.10
+    },
+    gates=[('creativity_score', 50), ('project_management_score', 40)],
+    positive_keywords=['campaign', 'press release', 'social media', 'content creation'],
+    skill_keywords=['content', 'social media', 'branding', 'campaign', 'public relations']
+))
+
+register_plan(ScoringPlan(
+    'hospitality',
+    scorers=[
+        ('customer_service_score', '_evaluate_customer_service'),
+        ('operations_score', '_evaluate_operations')
+    ],
+    weights={
+        'customer_service_score': 0.20,
+        'operations_score': 0.15
+    },
+    gates=[('customer_service_score', 70), ('operations_score', 50)],
+    thresholds=(75, 60, 45),
+    positive_keywords=['guest satisfaction', 'front office', 'reservation'],
+    skill_keywords=['guest', 'service', 'hospitality', 'reservation', 'front desk']
+))
+
+register_plan(ScoringPlan(
+    'social_services',
+    scorers=[
+        ('case_management_score', '_evaluate_case_management'),
+        ('crisis_intervention_score', '_evaluate_crisis_intervention'),
+        ('client_relations_score', '_evaluate_client_relations')
+    ],
+    weights={
+        'case_management_score': 0.25,
+        'crisis_intervention_score': 0.20,
+        'client_relations_score': 0.15
+    },
+    gates=[('case_management_score', 60), ('crisis_intervention_score', 50)],
+    positive_keywords=[
+        'case management', 'crisis intervention', 'advocacy',
+        'trauma-informed', 'victim services', 'community outreach'
+    ],
+    skill_keywords=['case management', 'crisis', 'advocacy', 'social work'],
+    feedback=[
+        ('case_management_score', 60,
+         "Case management experience could be more clearly emphasized. Share examples of client assessments, treatment planning, "
+         "and service coordination. Describe any measurable outcomes or program success you contributed to. "
+         "Social services employers value hands-on experience with diverse populations."),
+        ('crisis_intervention_score', 50,
+         "Your crisis intervention skills could be showcased better. Mention situations where you de-escalated crises, "
+         "provided emergency support, or worked with high-risk individuals. Certifications in mental health first aid or crisis management "
+         "would add credibility to your profile.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'customer_service',
+    scorers=[
+        ('customer_service_score', '_evaluate_customer_service'),
+        ('problem_solving_score', '_evaluate_problem_solving'),
+        ('technical_skills_score', '_evaluate_tech_skills')
+    ],
+    weights={
+        'customer_service_score': 0.35,
+        'problem_solving_score': 0.15,
+        'technical_skills_score': 0.10
+    },
+    gates=[('customer_service_score', 65), ('problem_solving_score', 50)],
+    thresholds=(75, 60, 45),
+    positive_keywords=[
+        'customer satisfaction', 'problem resolution', 'multilingual support',
+        'client retention', 'service quality', 'call handling',
+        'complaint management', 'customer experience', 'service metrics'
+    ],
+    skill_keywords=['customer service', 'troubleshooting', 'support', 'help desk'],
+    feedback=[
+        ('customer_service_score', 65,
+         "Customer service achievements could be highlighted more strongly. Share metrics like customer satisfaction ratings, "
+         "awards, or success stories. Recruiters look for evidence of excellent interpersonal skills and service consistency. "
+         "Consider adding short customer testimonials if appropriate."),
+        ('problem_solving_score', 50,
+         "Problem-solving examples could be improved. Describe real scenarios where you resolved customer complaints, "
+         "improved service processes, or developed creative solutions under pressure. Concrete examples can greatly boost your appeal.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'natural_resources',
+    scorers=[
+        ('field_experience_score', '_evaluate_field_experience'),
+        ('regulatory_knowledge_score', '_evaluate_regulatory_knowledge'),
+        ('technical_skills_score', '_evaluate_natural_resources_skills')
+    ],
+    weights={
+        'field_experience_score': 0.35,
+        'technical_skills_score': 0.25,
+        'regulatory_knowledge_score': 0.20,
+        'education_quality': 0.20,
+        'experience_quality': 0.25
+    },
+    gates=[('field_experience_score', 70), ('regulatory_knowledge_score', 60)],
+    positive_keywords=[
+        'conservation', 'rangeland', 'watershed', 'ecological',
+        'regulatory', 'compliance', 'inventory', 'assessment',
+        'mitigation', 'rehabilitation', 'grazing', 'AUMs',
+        'animal unit months', 'range unit', 'allotment',
+        'ArcGIS', 'TAAMs', 'noxious weed', 'soil conservation'
+    ],
+    skill_keywords=['arcgis', 'taams', 'conservation', 'wildlife', 'environmental'],
+    feedback=[
+        ('field_experience_score', 60,
+         "More emphasis on field experience would strengthen your CV. Highlight work on environmental surveys, inspections, "
+         "conservation projects, or land management tasks. Mention certifications and technical fieldwork skills to stand out."),
+        ('regulatory_knowledge_score', 50,
+         "Regulatory knowledge should be more prominent. Share your understanding of environmental laws like NEPA, "
+         "CFR regulations, or other compliance procedures you've followed. This showcases your preparedness for regulatory roles."),
+        ('technical_skills_score', 50,
+         "Technical skills such as GIS, GPS data collection, and environmental software should be highlighted. "
+         "Discuss hands-on tools used in past projects. Specific technical proficiencies make a big difference in natural resources careers.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'retail_fashion',
+    scorers=[
+        ('sales_performance_score', '_evaluate_sales_performance'),
+        ('team_leadership_score', '_evaluate_team_leadership'),
+        ('business_development_score', '_evaluate_business_development')
+    ],
+    weights={
+        'sales_performance_score': 0.30,
+        'team_leadership_score': 0.25,
+        'customer_service_score': 0.25,
+        'business_development_score': 0.20
+    },
+    gates=[('sales_performance_score', 60), ('team_leadership_score', 50), ('business_development_score', 40)],
+    positive_keywords=[
+        'sales growth', 'client retention', 'revenue increase',
+        'team development', 'merchandising', 'visual presentation',
+        'brand standards', 'key holder', 'inventory management'
+    ],
+    skill_keywords=['sales', 'merchandising', 'retail', 'clienteling'],
+    feedback=[
+        ('sales_performance_score', 60,
+         "Your sales achievements could be better emphasized. Mention specific sales targets achieved, upselling success, "
+         "or customer loyalty improvements. Numbers and results build credibility and attract retail hiring managers."),
+        ('team_leadership_score', 50,
+         "Leadership examples in retail settings are important. Share stories where you motivated teams, improved sales performance, "
+         "or mentored junior associates. Team leadership in fast-paced environments is highly sought after."),
+        ('business_development_score', 50,
+         "Business development initiatives should be more visible. Highlight strategies you contributed to for store growth, "
+         "new customer acquisition, or brand partnerships that enhanced performance.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'beauty_cosmetics',
+    scorers=[
+        ('artistry_skills_score', '_evaluate_artistry_skills'),
+        ('product_knowledge_score', '_evaluate_product_knowledge'),
+        ('creativity_score', '_evaluate_creativity')
+    ],
+    weights={
+        'artistry_skills_score': 0.30,
+        'customer_service_score': 0.25,
+        'sales_performance_score': 0.20,
+        'product_knowledge_score': 0.15,
+        'creativity_score': 0.10
+    },
+    gates=[('artistry_skills_score', 60), ('product_knowledge_score', 50), ('creativity_score', 40)],
+    positive_keywords=[
+        'artistry training', 'product knowledge', 'client consultation',
+        'makeup application', 'bridal makeup', 'photo shoot',
+        'fashion show', 'counter management', 'social media promotion'
+    ],
+    skill_keywords=['makeup', 'cosmetics', 'artistry', 'skincare'],
+    feedback=[
+        ('artistry_skills_score', 60,
+         "Artistry skills could be elaborated with more examples. Talk about specific makeup styles you specialize in, "
+         "client transformations, editorial shoots, or competitions participated in. Demonstrating creativity helps you stand out."),
+        ('product_knowledge_score', 50,
+         "Product knowledge is critical. List familiarity with major brands, participation in product launches, "
+         "or experience conducting client education. Depth of product expertise can significantly impress employers."),
+        ('creativity_score', 50,
+         "Your creativity could be more visible. Share original makeup looks, creative campaigns, or innovative client transformations. "
+         "Visual portfolios, even small ones, can showcase your artistic impact.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'hospitality_food',
+    scorers=[
+        ('food_safety_score', '_evaluate_food_safety'),
+        ('pos_systems_score', '_evaluate_pos_systems'),
+        ('upselling_score', '_evaluate_upselling'),
+        ('teamwork_score', '_evaluate_teamwork')
+    ],
+    weights={
+        'customer_service_score': 0.35,
+        'food_safety_score': 0.20,
+        'pos_systems_score': 0.15,
+        'upselling_score': 0.15,
+        'teamwork_score': 0.15
+    },
+    gates=[('customer_service_score', 70), ('food_safety_score', 60), ('pos_systems_score', 40)],
+    thresholds=(75, 60, 45),
+    positive_keywords=[
+        'customer satisfaction', 'food handling', 'sanitation',
+        'point of sale', 'menu knowledge', 'beverage service',
+        'shift supervisor', 'training staff', 'health codes'
+    ],
+    skill_keywords=['food safety', 'pos system', 'upselling', 'sanitation'],
+    feedback=[
+        ('food_safety_score', 60,
+         "Food safety experience should be more prominent. Mention certifications like ServSafe, "
+         "successful inspections, or personal commitment to sanitation protocols. Health compliance is essential in food roles."),
+        ('pos_systems_score', 50,
+         "POS system experience could be better highlighted. Familiarity with platforms like Square, Toast, or Aloha "
+         "can be a deciding factor in hospitality hiring. Be specific about the systems you've operated."),
+        ('upselling_score', 50,
+         "Your upselling success could be better demonstrated. Discuss how you increased average order value, "
+         "met promotional targets, or contributed to revenue boosts through effective sales strategies."),
+        ('teamwork_score', 50,
+         "Teamwork examples in fast-paced hospitality settings should be stronger. Mention collaboration across shifts, "
+         "event coordination, or leadership in high-demand scenarios. Teamwork stories show adaptability.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'arts_education',
+    scorers=[
+        ('curriculum_development_score', '_evaluate_curriculum_development'),
+        ('teaching_experience_score', '_evaluate_teaching_experience'),
+        ('artistic_skills_score', '_evaluate_artistic_skills'),
+        ('technology_integration_score', '_evaluate_technology_integration')
+    ],
+    weights={
+        'curriculum_development_score': 0.30,
+        'teaching_experience_score': 0.25,
+        'artistic_skills_score': 0.20,
+        'technology_integration_score': 0.15,
+        'leadership_score': 0.10
+    },
+    gates=[('curriculum_development_score', 60), ('teaching_experience_score', 50), ('artistic_skills_score', 40)],
+    positive_keywords=[
+        'curriculum design', 'lesson planning', 'student assessment',
+        'art exhibition', 'teaching methods', 'classroom management',
+        'art techniques', 'visual arts', 'creative development'
+    ],
+    skill_keywords=['curriculum', 'teaching', 'visual arts', 'art education'],
+    feedback=[
+        ('curriculum_development_score', 60,
+         "Curriculum development experience should be more prominent. Mention any programs you designed, interdisciplinary courses created, "
+         "or improvements you led. Demonstrate how your contributions impacted student learning outcomes positively."),
+        ('teaching_experience_score', 50,
+         "Teaching experience could be more detailed. Highlight years taught, age groups, artistic disciplines, and instructional methods. "
+         "Quantify your impact wherever possible (e.g., student competition wins, increased engagement scores)."),
+        ('artistic_skills_score', 50,
+         "Your diverse artistic skills should be better showcased. Mention mediums you specialize in, exhibitions participated in, "
+         "or community arts initiatives. Diversity in arts education strengthens your teaching portfolio."),
+        ('technology_integration_score', 50,
+         "Technology integration should be emphasized. Describe how you incorporated digital tools, "
+         "virtual galleries, online art classes, or edtech platforms into your curriculum delivery.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'it_architecture',
+    scorers=[
+        ('technical_skills_score', '_evaluate_technical_skills'),
+        ('project_management_score', '_evaluate_project_management'),
+        ('team_leadership_score', '_evaluate_team_leadership'),
+        ('solution_design_score', '_evaluate_solution_design')
+    ],
+    weights={
+        'technical_skills_score': 0.30,
+        'project_management_score': 0.25,
+        'team_leadership_score': 0.20,
+        'solution_design_score': 0.15,
+        'industry_knowledge_score': 0.10
+    },
+    gates=[('technical_skills_score', 70), ('project_management_score', 50), ('solution_design_score', 40)],
+    thresholds=(85, 70, 55),
+    positive_keywords=[
+        'solution architecture', 'technical leadership', 'system integration',
+        'data governance', 'project delivery', 'stakeholder management',
+        'performance tuning', 'best practices', 'enterprise systems'
+    ],
+    skill_keywords=['architecture', 'data modeling', 'solution design', 'integration'],
+    feedback=[
+        ('technical_skills_score', 60,
+         "Technical skills in IT Architecture could be strengthened. Highlight expertise with cloud platforms, system integrations, "
+         "solution architecture frameworks, and key technologies like AWS, Azure, or Kubernetes. Technical certifications also help."),
+        ('project_management_score', 50,
+         "Project management in IT delivery should be clearer. Mention timelines handled, cross-team coordination, "
+         "and success in deploying complex systems. Use metrics if possible (e.g., 'delivered project 15% under budget')."),
+        ('team_leadership_score', 50,
+         "Team leadership examples should be highlighted. Discuss how you mentored junior architects, led design teams, "
+         "or drove cross-functional collaboration across technical and business units."),
+        ('solution_design_score', 50,
+         "Solution design examples could be stronger. Explain how you conceptualized architectures that solved business problems, "
+         "improved scalability, or optimized performance.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'education_administration',
+    scorers=[
+        ('leadership_score', '_evaluate_leadership'),
+        ('policy_implementation_score', '_evaluate_policy_implementation'),
+        ('budget_management_score', '_evaluate_budget_management'),
+        ('staff_development_score', '_evaluate_staff_development')
+    ],
+    weights={
+        'leadership_score': 0.30,
+        'policy_implementation_score': 0.25,
+        'budget_management_score': 0.20,
+        'staff_development_score': 0.15,
+        'academic_improvement_score': 0.10
+    },
+    gates=[('leadership_score', 70), ('policy_implementation_score', 50), ('budget_management_score', 40)],
+    positive_keywords=[
+        'student outcomes', 'academic excellence', 'staff development',
+        'compliance management', 'strategic planning', 'performance metrics',
+        'educational leadership', 'policy implementation', 'budget oversight'
+    ],
+    skill_keywords=['leadership', 'policy', 'budget', 'staff development'],
+    feedback=[
+        ('leadership_score', 60,
+         "Leadership achievements could be stronger. Mention strategic initiatives you led, programs launched, "
+         "or reforms introduced. Leadership in education often involves cross-functional influence and stakeholder engagement."),
+        ('policy_implementation_score', 50,
+         "Policy implementation work should be clearer. Describe developing school or district policies, "
+         "compliance improvements, or how you ensured regulatory adherence and measurable results."),
+        ('budget_management_score', 50,
+         "Budget management experience needs more emphasis. Share successes in allocating resources, balancing budgets, "
+         "or leading financial planning initiatives that improved efficiency."),
+        ('staff_development_score', 50,
+         "Staff development should be highlighted. Talk about workshops you created, mentorship programs initiated, "
+         "or teacher development strategies that boosted performance and morale.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'military_aviation',
+    scorers=[
+        ('technical_skills_score', '_evaluate_aviation_technical_skills'),
+        ('leadership_score', '_evaluate_military_leadership'),
+        ('training_development_score', '_evaluate_training_development'),
+        ('safety_compliance_score', '_evaluate_safety_compliance'),
+        ('operational_experience_score', '_evaluate_operational_experience')
+    ],
+    weights={
+        'technical_skills_score': 0.25,
+        'leadership_score': 0.25,
+        'training_development_score': 0.20,
+        'safety_compliance_score': 0.15,
+        'operational_experience_score': 0.15
+    },
+    gates=[('technical_skills_score', 70), ('leadership_score', 60), ('safety_compliance_score', 50)],
+    thresholds=(85, 70, 55),
+    positive_keywords=[
+        'flight hours', 'instructor pilot', 'mission planning',
+        'safety compliance', 'crew resource management',
+        'standard operating procedures', 'training development',
+        'aerial operations', 'emergency procedures'
+    ],
+    skill_keywords=['aviation', 'flight', 'safety compliance', 'training'],
+    feedback=[
+        ('technical_skills_score', 60,
+         "Technical aviation skills should be emphasized more. Share your knowledge of aviation systems, avionics, flight operations, "
+         "and maintenance procedures. Certification details (e.g., FAA ratings) should be clearly mentioned."),
+        ('leadership_score', 50,
+         "Leadership within aviation environments should be highlighted. Discuss squadron management, unit readiness leadership, "
+         "or experience supervising flight or maintenance crews under operational pressure."),
+        ('training_development_score', 50,
+         "Training and development experience should be more detailed. Describe programs you built for technical training, "
+         "safety compliance, or leadership development within military or aviation contexts."),
+        ('safety_compliance_score', 50,
+         "Safety compliance efforts need more visibility. Share achievements maintaining operational safety standards, "
+         "audit results, or corrective actions led during inspections.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'entry_level_service',
+    scorers=[
+        ('customer_service_score', '_evaluate_customer_service'),
+        ('teamwork_score', '_evaluate_teamwork'),
+        ('multitasking_score', '_evaluate_multitasking'),
+        ('technical_skills_score', '_evaluate_service_tech_skills'),
+        ('safety_compliance_score', '_evaluate_service_safety')
+    ],
+    weights={
+        'customer_service_score': 0.35,
+        'teamwork_score': 0.25,
+        'multitasking_score': 0.20,
+        'technical_skills_score': 0.10,
+        'safety_compliance_score': 0.10
+    },
+    gates=[('customer_service_score', 65), ('teamwork_score', 50), ('multitasking_score', 40)],
+    thresholds=(75, 60, 45),
+    positive_keywords=[
+        'customer satisfaction', 'point of sale', 'inventory management',
+        'shift management', 'team collaboration', 'conflict resolution',
+        'safety protocols', 'multitasking', 'process improvement'
+    ],
+    skill_keywords=['customer service', 'multitasking', 'safety', 'teamwork'],
+    feedback=[
+        ('customer_service_score', 60,
+         "Customer service skills should be highlighted with real examples. Mention high-volume handling, satisfaction scores, "
+         "or customer commendations. Basic service achievements set entry-level candidates apart quickly."),
+        ('teamwork_score', 50,
+         "Teamwork experiences should be clearer. Describe situations where you worked collaboratively, "
+         "helped cover shifts, or supported team goals during high-pressure periods."),
+        ('multitasking_score', 50,
+         "Multitasking skills should be showcased. Discuss handling multiple tasks simultaneously, "
+         "juggling customer interactions, administrative work, and operational duties."),
+        ('technical_skills_score', 50,
+         "Basic technical skills should be strengthened. Mention POS systems, Microsoft Office tools, or ticketing systems you operated. "
+         "Technical comfort boosts employability even for service roles.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'financial_services',
+    scorers=[
+        ('financial_analysis_score', '_evaluate_financial_analysis'),
+        ('client_management_score', '_evaluate_client_management'),
+        ('regulatory_compliance_score', '_evaluate_regulatory_compliance'),
+        ('portfolio_management_score', '_evaluate_portfolio_management'),
+        ('technical_skills_score', '_evaluate_finance_tech_skills')
+    ],
+    weights={
+        'financial_analysis_score': 0.30,
+        'client_management_score': 0.25,
+        'regulatory_compliance_score': 0.20,
+        'portfolio_management_score': 0.15,
+        'technical_skills_score': 0.10
+    },
+    gates=[('financial_analysis_score', 70), ('client_management_score', 50), ('regulatory_compliance_score', 40)],
+    thresholds=(85, 70, 55),
+    positive_keywords=[
+        'loan portfolio', 'risk management', 'regulatory compliance',
+        'client acquisition', 'cross-selling', 'financial modeling',
+        'cash flow analysis', 'credit analysis', 'underwriting'
+    ],
+    skill_keywords=['financial analysis', 'compliance', 'portfolio management', 'client relations'],
+    feedback=[
+        ('financial_analysis_score', 60,
+         "Financial analysis skills could be stronger. Highlight experience with forecasting, budgeting, risk assessment, "
+         "or investment strategy development. Quantifiable financial results create a strong impression."),
+        ('client_management_score', 50,
+         "Client relationship management should be emphasized. Discuss relationship building, retention improvements, "
+         "and how you handled client portfolios or account renewals successfully."),
+        ('regulatory_compliance_score', 50,
+         "Regulatory compliance experience should be clearer. Mention your understanding of SEC, SOX, AML, or Dodd-Frank regulations, "
+         "and share real examples of compliance project involvement."),
+        ('portfolio_management_score', 50,
+         "Portfolio management contributions should be better detailed. Describe asset allocation strategies, risk diversification, "
+         "or portfolio growth metrics you achieved.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'entry_level_finance',
+    scorers=[
+        ('financial_analysis_score', '_evaluate_entry_level_analysis'),
+        ('academic_achievement_score', '_evaluate_academic_achievement'),
+        ('technical_skills_score', '_evaluate_entry_tech_skills'),
+        ('client_service_score', '_evaluate_client_service'),
+        ('teamwork_score', '_evaluate_teamwork')
+    ],
+    weights={
+        'financial_analysis_score': 0.35,
+        'academic_achievement_score': 0.25,
+        'technical_skills_score': 0.20,
+        'client_service_score': 0.15,
+        'teamwork_score': 0.05
+    },
+    gates=[('financial_analysis_score', 60), ('academic_achievement_score', 50), ('technical_skills_score', 40)],
+    positive_keywords=[
+        'financial analysis', 'academic projects', 'research',
+        'data analysis', 'valuation', 'financial statements',
+        'market research', 'investment analysis', 'excel modeling'
+    ],
+    skill_keywords=['financial modeling', 'analysis', 'valuation', 'excel'],
+    feedback=[
+        ('financial_analysis_score', 60,
+         "Financial analysis exposure could be improved. Mention internships, university projects, or simulations "
+         "where you performed forecasting, valuation, or data modeling using Excel or similar tools."),
+        ('academic_achievement_score', 50,
+         "Academic achievements need better emphasis. Highlight GPA (if strong), scholarships, dean's list honors, "
+         "or finance-related coursework to build credibility for entry-level finance roles."),
+        ('technical_skills_score', 50,
+         "Technical finance skills such as Excel modeling, Python for finance, or Bloomberg Terminal usage "
+         "should be showcased to demonstrate analytical readiness."),
+        ('client_service_score', 50,
+         "Client service exposure could be improved. Mention internship experiences, university consulting projects, "
+         "or volunteer work that developed your client-facing skills.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'bpo_operations',
+    scorers=[
+        ('operations_management_score', '_evaluate_operations_management'),
+        ('team_leadership_score', '_evaluate_bpo_leadership'),
+        ('performance_metrics_score', '_evaluate_performance_metrics'),
+        ('client_management_score', '_evaluate_client_management'),
+        ('process_improvement_score', '_evaluate_process_improvement')
+    ],
+    weights={
+        'operations_management_score': 0.30,
+        'team_leadership_score': 0.25,
+        'performance_metrics_score': 0.20,
+        'client_management_score': 0.15,
+        'process_improvement_score': 0.10
+    },
+    gates=[('operations_management_score', 70), ('team_leadership_score', 50), ('performance_metrics_score', 40)],
+    positive_keywords=[
+        'operations management', 'performance metrics', 'kpi improvement',
+        'team leadership', 'process improvement', 'client management',
+        'sales conversion', 'revenue growth', 'profit margin'
+    ],
+    skill_keywords=['operations management', 'kpi', 'performance metrics', 'client management'],
+    feedback=[
+        ('operations_management_score', 60,
+         "Operations management should be emphasized more. Highlight handling KPIs, optimizing workflows, "
+         "or achieving service-level agreements (SLAs) consistently in BPO environments."),
+        ('team_leadership_score', 50,
+         "Leadership examples managing BPO teams should be shared. Discuss scheduling, performance monitoring, "
+         "coaching underperformers, or driving team metrics."),
+        ('performance_metrics_score', 50,
+         "Performance metrics achievements could be clearer. Talk about call quality improvements, "
+         "productivity gains, or first-call resolution rate increases you contributed to."),
+        ('client_management_score', 50,
+         "Client management stories should be highlighted. Mention direct client communications, meeting client KPIs, "
+         "or upselling additional services within BPO operations.")
+    ]
+))
+
+register_plan(ScoringPlan(
+    'general',
+    gates=[('experience_quality', 50), ('education_quality', 40), ('skills_relevance', 40)]
+))
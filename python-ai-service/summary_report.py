@@ -0,0 +1,85 @@
+from collections import Counter
+
+# Strengths and weaknesses listed in the summary
+TOP_FEEDBACK = 3
+
+
+class SummaryAccumulator:
+    """
+    Batch summary built one individual report at a time.
+
+    add() every report as it is produced, then finalize() gives the summary
+    report without the reports having to be kept. Accumulators of separate
+    shards or workers combine with merge(); counts are exact, and ties among
+    the common strengths and weaknesses go to the one seen first.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.score_sum = 0
+        self.score_count = 0
+        self.meets = 0
+        self.industries = Counter()
+        self.decisions = Counter()
+        self.strengths = Counter()
+        self.weaknesses = Counter()
+        self.errors = []
+
+    def add(self, report):
+        self.total += 1
+
+        summary = None
+        try:
+            summary = report['report']['evaluation_summary']
+        except Exception:
+            # Reports without an evaluation summary count as errors
+            self.decisions['Error'] += 1
+        if summary is not None:
+            if 'total_score' in summary:
+                self.score_sum += summary['total_score']
+                self.score_count += 1
+            self.decisions[summary.get('decision', 'Unknown')] += 1
+            self.strengths.update(summary.get('strengths', []))
+            self.weaknesses.update(summary.get('weaknesses', []))
+
+        meets_requirements = report.get('meets_requirements')
+        if isinstance(meets_requirements, dict) and all(meets_requirements.values()):
+            self.meets += 1
+        self.industries[report.get('industry', 'unknown')] += 1
+        if 'error' in report:
+            self.errors.append(report['error'])
+
+    def merge(self, other):
+        """Fold in the reports of another accumulator, as if added after these"""
+        self.total += other.total
+        self.score_sum += other.score_sum
+        self.score_count += other.score_count
+        self.meets += other.meets
+        self.industries.update(other.industries)
+        self.decisions.update(other.decisions)
+        self.strengths.update(other.strengths)
+        self.weaknesses.update(other.weaknesses)
+        self.errors.extend(other.errors)
+        return self
+
+    @classmethod
+    def of(cls, reports):
+        summary = cls()
+        for report in reports:
+            summary.add(report)
+        return summary
+
+    def finalize(self):
+        total = self.total
+        avg = self.score_sum / self.score_count if self.score_count else 0
+        return {
+            'total_cvs_evaluated': total,
+            'average_score': round(avg, 1),
+            'meets_requirements_count': self.meets,
+            'meets_requirements_percentage': round((self.meets / total) * 100, 1) if total else 0,
+            'industry_distribution': dict(self.industries),
+            'decision_distribution': dict(self.decisions),
+            'common_strengths': self.strengths.most_common(TOP_FEEDBACK),
+            'common_weaknesses': self.weaknesses.most_common(TOP_FEEDBACK),
+            'errors': list(self.errors)
+        }
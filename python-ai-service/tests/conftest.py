@@ -0,0 +1,45 @@
+import copy
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# The service modules are flat, as the Lambda package lays them out
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SERVICE_DIR))
+sys.path.insert(1, str(SERVICE_DIR / 'benchmarks'))
+
+from model import CVEvaluationSystem  # noqa: E402
+from synthetic_cvs import SyntheticCVGenerator  # noqa: E402
+
+# Criteria the equivalence tests run under: the defaults, and hard
+# requirements that some synthetic CVs fail
+CRITERIA = (
+    {},
+    {'min_experience_years': 3, 'education_level': 'bachelor', 'keywords': ['team', 'customer']}
+)
+
+_SYNTHETIC = SyntheticCVGenerator(7).cvs(600)
+_CVS = dict(list(_SYNTHETIC.items())[:60])
+# Few synthetic CVs pass the industry gates; these meet every requirement
+# of both criteria
+PASSING_CVS = ('cv_234', 'cv_421', 'cv_487', 'cv_599')
+_CVS.update((cv_id, _SYNTHETIC[cv_id]) for cv_id in PASSING_CVS)
+# CVs validation has to fix, and one it has to reject
+_CVS['partial'] = {'summary': '', 'experience': [{'description': 'Five years of retail'}], 'skills': 'Excel'}
+_CVS['invalid'] = None
+
+
+@pytest.fixture
+def cvs_data():
+    """A fresh copy of the test CVs, as evaluation fixes dicts in place"""
+    return copy.deepcopy(_CVS)
+
+
+@pytest.fixture(params=CRITERIA, ids=('default', 'strict'))
+def system(request):
+    system = CVEvaluationSystem()
+    system.reference_date = datetime(2024, 6, 1)
+    system.set_requirements(copy.deepcopy(request.param))
+    return system
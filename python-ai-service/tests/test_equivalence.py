@@ -0,0 +1,155 @@
+"""
+The faster evaluation paths give what a plain sequential
+evaluate_multiple_cvs gives, and encoded responses decode to the plain ones.
+"""
+import base64
+import copy
+import gzip
+import json
+
+import pytest
+
+from model import EVALUATION_DEPTHS
+
+
+def as_json(data):
+    return json.dumps(data, sort_keys=True)
+
+
+@pytest.mark.parametrize('depth', EVALUATION_DEPTHS)
+def test_parallel_matches_sequential(system, cvs_data, depth):
+    from parallel_evaluation import evaluate_parallel
+    expected = system.evaluate_multiple_cvs(copy.deepcopy(cvs_data), depth)
+    reports = evaluate_parallel(system, cvs_data, depth, system._batch_criteria(), workers=2, chunk_size=7)
+    if reports is None:
+        pytest.skip('process pool unavailable')
+    assert as_json(reports) == as_json(expected['individual_reports'])
+
+
+def top_by_sorting(system, cvs_data, k, depth):
+    reports = system.evaluate_multiple_cvs(copy.deepcopy(cvs_data), depth)['individual_reports']
+    reports = [report for report in reports if 'error' not in report]
+    return sorted(reports, key=lambda report: -report['report']['evaluation_summary']['total_score'])[:k]
+
+
+@pytest.mark.parametrize('depth', EVALUATION_DEPTHS)
+def test_rank_top_k_matches_sorting(system, cvs_data, depth):
+    expected = top_by_sorting(system, cvs_data, 10, depth)
+    ranked = system.rank_top_k(cvs_data, 10, depth)
+    assert ranked['pruned'] > 0
+    assert as_json(ranked['top_candidates']) == as_json(expected)
+
+
+def test_rank_top_k_keeps_uncapped_skill_scores(system):
+    # Skill scores past 100 must not be pruned behind CVs scoring less in total
+    from check_ranking import skill_heavy_cv
+    cvs_data = {f'strong_{index}': skill_heavy_cv('Loan processing', 13) for index in range(3)}
+    cvs_data['skill_heavy'] = skill_heavy_cv('Loan processing', 80)
+    ranked = system.rank_top_k(copy.deepcopy(cvs_data), 3, 'score')
+    assert as_json(ranked['top_candidates']) == as_json(top_by_sorting(system, cvs_data, 3, 'score'))
+    assert ranked['top_candidates'][0]['cv_id'] == 'skill_heavy'
+
+
+@pytest.mark.parametrize('depth', EVALUATION_DEPTHS)
+def test_gate_first_matches_full_evaluation(system, cvs_data, depth):
+    expected = system.evaluate_multiple_cvs(copy.deepcopy(cvs_data), depth)['individual_reports']
+    gated = system.evaluate_multiple_cvs(cvs_data, depth, gate_first=True)['individual_reports']
+    passed = rejected = 0
+    for full, report in zip(expected, gated):
+        gate = report['report']['evaluation_summary'].get('rejected_at')
+        if gate is not None:
+            # Rejected only at a requirement the full evaluation fails too
+            assert full['meets_requirements'][gate] is False
+            rejected += 1
+        elif 'error' in full:
+            assert 'error' in report
+        else:
+            assert all(full['meets_requirements'].values())
+            assert as_json(report) == as_json(full)
+            passed += 1
+    assert passed and rejected
+
+
+def test_result_cache_reuses_reports_until_engine_version_changes(system, cvs_data, tmp_path, monkeypatch):
+    import result_cache
+    expected = as_json(system.evaluate_multiple_cvs(copy.deepcopy(cvs_data), 'full'))
+
+    first = result_cache.ResultCache(directory=str(tmp_path))
+    assert as_json(first.evaluate(system, copy.deepcopy(cvs_data), 'full')) == expected
+    assert first.stats()['hits'] == 0
+
+    # A new container finds the reports on disk
+    warm = result_cache.ResultCache(directory=str(tmp_path))
+    assert as_json(warm.evaluate(system, copy.deepcopy(cvs_data), 'full')) == expected
+    # Failed evaluations are not cached
+    assert warm.stats()['disk_hits'] == len(cvs_data) - 1
+
+    monkeypatch.setattr(result_cache, 'SCORING_ENGINE_VERSION', result_cache.SCORING_ENGINE_VERSION + '-next')
+    upgraded = result_cache.ResultCache(directory=str(tmp_path))
+    assert as_json(upgraded.evaluate(system, copy.deepcopy(cvs_data), 'full')) == expected
+    assert upgraded.stats()['hits'] == 0
+    assert upgraded.stats()['misses'] == len(cvs_data)
+
+
+@pytest.mark.parametrize('depth', ('score', 'full'))
+@pytest.mark.parametrize('change', [
+    {'keywords': ['audit', 'team', 'sales']},
+    {'required_skills': ['excel']},
+    {'required_sections': ['summary', 'skills']},
+    {'min_experience_years': 5, 'education_level': 'master'},
+    {'industry_specific_weights': {'finance': {'experience': 0.5}}},
+], ids=('keywords', 'skills', 'sections', 'checks', 'weights'))
+def test_rescore_matches_full_evaluation(system, cvs_data, depth, change):
+    from delta_scoring import RetainedScores
+    retained = RetainedScores()
+    first = system.rescore(copy.deepcopy(cvs_data), retained, depth)
+    assert as_json(first) == as_json(system.evaluate_multiple_cvs(copy.deepcopy(cvs_data), depth))
+
+    retained = RetainedScores.from_dict(json.loads(json.dumps(retained.to_dict())))
+    system.set_requirements(copy.deepcopy(change))
+    # Only some components are recomputed, not the whole evaluation
+    assert retained.stale_components(system.evaluation_criteria, '2024-6') is not None
+    rescored = system.rescore(copy.deepcopy(cvs_data), retained, depth)
+    assert as_json(rescored) == as_json(system.evaluate_multiple_cvs(copy.deepcopy(cvs_data), depth))
+
+
+def decoded_body(response):
+    if response.get('isBase64Encoded'):
+        assert response['headers']['Content-Encoding'] == 'gzip'
+        return gzip.decompress(base64.b64decode(response['body'])).decode('utf-8')
+    return response['body']
+
+
+@pytest.mark.parametrize('accept, accept_encoding, compressed', [
+    ('application/octet-stream', 'gzip, deflate', True),
+    ('application/octet-stream', 'identity', False),
+    ('application/json, */*', 'gzip', False),
+])
+def test_encoded_responses_round_trip(accept, accept_encoding, compressed):
+    from response_encoding import MIN_COMPRESS_BYTES, encode_response
+    event = {'headers': {'Accept': accept, 'Accept-Encoding': accept_encoding}}
+    headers = {'Content-Type': 'application/json'}
+    small = json.dumps({'ok': True})
+    large = json.dumps({'reports': ['Highly Recommended'] * MIN_COMPRESS_BYTES})
+    assert encode_response(event, 200, headers, small) == {
+        'statusCode': 200, 'headers': dict(headers, Vary='Accept, Accept-Encoding'), 'body': small
+    }
+    response = encode_response(event, 200, headers, large.encode('utf-8'))
+    assert bool(response.get('isBase64Encoded')) == compressed
+    assert decoded_body(response) == large
+
+
+def test_evaluate_resumes_gzipped_response_matches_plain(cvs_data):
+    import handler
+    from response_encoding import request_body
+    body = json.dumps({'resume_data': list(cvs_data.values())[:20], 'requirements': {'min_experience_years': 2},
+                       'depth': 'standard'})
+    # API Gateway base64 encodes request bodies of a binary media type
+    assert request_body({'body': base64.b64encode(body.encode('utf-8')).decode('ascii'),
+                         'isBase64Encoded': True}) == body
+    plain = handler.evaluate_resumes({'body': body}, None)
+    gzipped = handler.evaluate_resumes({'body': body, 'headers': {
+        'Accept': 'application/octet-stream', 'Accept-Encoding': 'gzip'}}, None)
+    assert plain['statusCode'] == gzipped['statusCode'] == 200
+    assert 'isBase64Encoded' not in plain and gzipped['isBase64Encoded']
+    assert json.loads(decoded_body(gzipped)) == json.loads(plain['body'])
@@ -0,0 +1,48 @@
+import pytest
+
+from keyword_matcher import KeywordAutomaton
+from model import KEYWORD_AUTOMATON
+
+
+def found(text, automaton=KEYWORD_AUTOMATON):
+    hits = automaton.scan([text.lower()]).hits()
+    return {automaton.terms[term_id] for term_id in hits.term_ids}
+
+
+@pytest.mark.parametrize('term, text', [
+    ('develop', 'Developed new markets for the brand'),
+    ('develop', 'Developing vendor relations'),
+    ('expand', 'Expanded the store to two sites'),
+    ('upsell', 'Upselling desserts and specials'),
+    ('audit', 'Audited quarterly accounts'),
+    ('audit', 'Prepared audits'),
+    ('regulation', 'Applied new regulations'),
+    ('policy', 'Wrote company policies'),
+    ('supervise', 'Supervised a team of ten'),
+    ('lesson plan', 'Lesson planning for three grades'),
+])
+def test_inflected_forms_match(term, text):
+    assert term in found(text)
+
+
+@pytest.mark.parametrize('term, text', [
+    ('led', 'Handled customer calls'),
+    ('led', 'Product knowledge'),
+    ('ea', 'Team player'),
+    ('va', 'Loan valuation'),
+    ('ems', 'Support for legacy systems'),
+])
+def test_terms_only_match_whole_words(term, text):
+    assert term not in found(text)
+
+
+def test_inflection_reads_as_every_term():
+    automaton = KeywordAutomaton({'one': ['regulation'], 'other': ['regulations'], 'past': ['developed', 'develop']})
+    hits = automaton.scan(['new regulations developed']).hits()
+    assert hits.count('one') == hits.count('other') == 1
+    assert hits.count('past') == 2
+
+
+def test_phd_synonyms():
+    for degree in ('PhD in Physics', 'Doctorate of Education', 'Doctoral studies'):
+        assert KEYWORD_AUTOMATON.scan([degree.lower()]).hits().any('degree:phd')